@@ -89,6 +89,34 @@ def startup_checks():
             logging.getLogger("uvicorn.error").warning(
                 "AUTH_SECRET_KEY not set or using default. Set it in Render Dashboard."
             )
+    # Spawn + warm parse workers now (PARSE_POOL_WORKERS > 0) instead of on the first scrape
+    from model.parse_pool import get_parse_pool
+    get_parse_pool()
+    # Keep the local job catalog warm in the background (CRAWLER_ENABLED=true)
+    from model.crawler import get_crawler
+    get_crawler()
+
+
+@app.on_event("shutdown")
+async def shutdown_scrapers():
+    """
+    Stop the crawler; close warm Playwright browsers, shared HTTP clients/sessions, parse
+    workers and local stores (board sync state, job catalog, seen-URL snapshot).
+    """
+    from model.board_sync import close_board_sync_store
+    from model.crawler import close_crawler
+    from model.job_catalog import close_job_catalog
+    from model.seen_urls import close_seen_urls
+    from model.job_scraper import close_async_http_engine, close_browser_pools, close_job_scrapers
+    from model.parse_pool import close_parse_pool
+    close_crawler()
+    await close_async_http_engine()
+    close_browser_pools()
+    close_job_scrapers()
+    close_parse_pool()
+    close_board_sync_store()
+    close_job_catalog()
+    close_seen_urls()
 
 
 if __name__ == "__main__":
@@ -4,9 +4,9 @@ import sys
 
 from dotenv import load_dotenv
 from fastapi import APIRouter, HTTPException
-from playwright.async_api import async_playwright
 
 from api import models
+from model.job_scraper import get_browser_pool
 from model.utils.config import get_config
 from api.dependencies import db_dependency, user_dependency
 from api.schemas import JobAnalysisRequest, JobAnalysisResponse
@@ -47,15 +47,14 @@ async def analyze_job(
     current_user_id = user.get("id")
     url = payload.url
 
-    # 1) Scrape
+    # 1) Scrape (page leased from the shared browser pool)
+    async def _read_page(page):
+        return await page.inner_text("body"), await page.title()
+
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            job_description = await page.inner_text("body")
-            page_title = await page.title()
-            await browser.close()
+        job_description, page_title = await get_browser_pool().run_page_async(
+            url, _read_page, timeout_ms=60000, block_resources=True
+        )
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Scraping failed: {str(e)}")
 
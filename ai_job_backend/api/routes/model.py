@@ -4,23 +4,42 @@ FastAPI routes for resume analysis, answer generation, and job scraping.
 """
 
 import asyncio
+import json
 import logging
 import os
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, Optional  # noqa: F401 - Optional used in BaseModel
+from typing import Annotated, Dict, List, Optional  # noqa: F401 - Optional used in BaseModel
 
 from dotenv import load_dotenv
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, HttpUrl
 
+from api.dependencies import user_dependency
 from api.limiter import limiter
 from model.api_integration import (
     analyze_resume_endpoint,
     extract_resume_profile_endpoint,
     generate_answer_endpoint,
-    scrape_job_description_endpoint,
+    scrape_job_description_endpoint_async,
+    scrape_job_descriptions_batch_async,
 )
-from model.job_discovery import discover_jobs
+from model.board_sync import board_sync_stats
+from model.crawler import crawler_stats
+from model.discovery_sources import discovery_source_stats
+from model.job_catalog import job_catalog_stats
+from model.job_discovery import discover_jobs_indexed, discover_jobs_stream, page_cache_stats
+from model.job_scraper import (
+    async_http_stats,
+    browser_pool_stats,
+    download_stats,
+    job_scraper_stats,
+    scrape_flight_stats,
+)
+from model.parse_pool import parse_pool_stats
+from model.provider_health import provider_health_stats
+from model.scrape_cache import scrape_cache_stats
+from model.seen_urls import seen_urls_stats
 from model.job_matches import rank_jobs_for_user as rank_jobs_for_user_impl
 from model.utils.config import get_config
 
@@ -43,6 +62,7 @@ MAX_RESUME_LEN = 50_000
 MAX_JOB_DESC_LEN = 100_000
 MAX_QUESTION_LEN = 2_000
 MAX_URL_LEN = 2_048
+MAX_BATCH_URLS = get_config().SCRAPE_BATCH_MAX_URLS
 
 
 class ResumeAnalysisRequest(BaseModel):
@@ -62,6 +82,14 @@ class ScrapeJobRequest(BaseModel):
     job_url: str = Field(..., max_length=MAX_URL_LEN)
 
 
+class ScrapeBatchRequest(BaseModel):
+    job_urls: List[Annotated[str, Field(max_length=MAX_URL_LEN)]] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_URLS
+    )
+    max_concurrency: Optional[int] = Field(None, ge=1, le=16)
+    per_domain: Optional[int] = Field(None, ge=1, le=4)
+
+
 class ExtractResumeRequest(BaseModel):
     resume_text: str = Field(..., max_length=MAX_RESUME_LEN)
 
@@ -225,18 +253,29 @@ async def job_discover(
     q: str = "software engineer",
     location: str = "",
     max_results: int = 20,
+    source: Optional[str] = None,
+    posted_days_ago: Optional[int] = None,
+    new_only: bool = False,
 ) -> Dict:
     """
-    GET /api/job/discover?q=software+engineer&location=remote&max_results=60
+    GET /api/job/discover?q=software+engineer&location=remote&max_results=60&source=ziprecruiter&posted_days_ago=3
     Discover jobs from ZipRecruiter, DailyAIJobs.com, and AIWorkPortal.com (free).
     Use user profile roles/skills as q for personalized results. Returns up to 60 jobs.
+    Answered from the local full-text job index when it has enough fresh matches (indexed=true);
+    repeated live searches are served from the discovery cache (cached / cache_age_seconds set).
+    Live searches return the sources that finished within DISCOVERY_DEADLINE, with per-source
+    status / latency / counts in source_status (partial=true when any failed or timed out).
+    new_only=true returns only postings no earlier discovery returned (live search).
     """
     try:
         max_results = min(max(1, max_results), 150)
         loop = asyncio.get_event_loop()
         result = await loop.run_in_executor(
             _executor,
-            lambda: discover_jobs(query=q or "jobs", location=location or "", max_results=max_results),
+            lambda: discover_jobs_indexed(
+                query=q or "jobs", location=location or "", max_results=max_results,
+                source=source or None, posted_days_ago=posted_days_ago, new_only=new_only,
+            ),
         )
         return result
     except Exception as e:
@@ -244,6 +283,37 @@ async def job_discover(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/job/discover/stream")
+@limiter.limit("20/minute")
+async def job_discover_stream(
+    request: Request,
+    q: str = "software engineer",
+    location: str = "",
+    max_results: int = 20,
+    format: str = "ndjson",
+) -> StreamingResponse:
+    """
+    GET /api/job/discover/stream?q=software+engineer&location=remote&max_results=60&format=ndjson
+    Live discovery streamed per source: a "jobs" event (deduplicated jobs not sent yet) as each
+    source finishes, then a "done" summary event. NDJSON by default; format=sse for Server-Sent Events.
+    """
+    max_results = min(max(1, max_results), 150)
+    sse = format.lower() == "sse"
+
+    async def events():
+        async for event in discover_jobs_stream(query=q or "jobs", location=location or "", max_results=max_results):
+            if sse:
+                yield f"event: {event['event']}\ndata: {json.dumps(event)}\n\n"
+            else:
+                yield json.dumps(event) + "\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/job/scrape")
 @limiter.limit("15/minute")
 async def scrape_job(request: Request, body: ScrapeJobRequest) -> Dict:
@@ -260,11 +330,8 @@ async def scrape_job(request: Request, body: ScrapeJobRequest) -> Dict:
         if not body.job_url or not body.job_url.strip():
             raise HTTPException(status_code=400, detail="Provide job_url")
         logger.info(f"Job scraping request for: {body.job_url}")
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            _executor,
-            lambda: scrape_job_description_endpoint(job_url=body.job_url.strip()),
-        )
+        # Native async scrape: awaits the shared HTTP client / browser pool, no _executor thread
+        result = await scrape_job_description_endpoint_async(job_url=body.job_url.strip())
         if not result.get('success'):
             raise HTTPException(status_code=500, detail=result.get('error', 'Scraping failed'))
         
@@ -277,6 +344,30 @@ async def scrape_job(request: Request, body: ScrapeJobRequest) -> Dict:
         raise HTTPException(status_code=500, detail=f'Internal server error: {str(e)}')
 
 
+@router.post("/job/scrape/batch")
+@limiter.limit("5/minute")
+async def scrape_jobs_batch(request: Request, body: ScrapeBatchRequest) -> StreamingResponse:
+    """
+    POST /api/job/scrape/batch
+    Scrapes several job URLs concurrently (global and per-domain caps, duplicates dropped).
+    Streams NDJSON: one line per URL as soon as it finishes, with method and latency_ms.
+
+    Request body:
+    {
+        "job_urls": ["https://indeed.com/viewjob?jk=...", "https://jobs.lever.co/..."]
+    }
+    """
+    logger.info(f"Batch job scraping request for {len(body.job_urls)} URLs")
+
+    async def lines():
+        async for result in scrape_job_descriptions_batch_async(
+            body.job_urls, max_concurrency=body.max_concurrency, per_domain=body.per_domain
+        ):
+            yield json.dumps(result) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @router.get("/status", response_model=StatusResponse)
 @limiter.exempt
 async def get_status() -> StatusResponse:
@@ -292,3 +383,34 @@ async def get_status() -> StatusResponse:
         playwright_enabled=config.USE_PLAYWRIGHT,
         model=config.OPENAI_MODEL
     )
+
+
+@router.get("/scraper/stats")
+@limiter.limit("20/minute")
+async def scraper_stats(request: Request, user: user_dependency) -> Dict:
+    """
+    GET /api/scraper/stats
+    Scraper internals for inspection (signed-in users only):
+    - browser pool, async HTTP client, shared-session connection reuse, streamed downloads
+    - scrape cache and coalesced scrapes, parse worker pool
+    - provider health and circuit breakers per domain
+    - discovery: conditional re-discovery pages, coalesced searches and result cache,
+      per-source runs / timeouts / retries / credits, company board syncs
+    - job catalog, crawler runs, seen-URL filter
+    """
+    return {
+        "providers": provider_health_stats(),
+        "browser_pool": browser_pool_stats(),
+        "async_http": async_http_stats(),
+        "sessions": job_scraper_stats(),
+        "scrape_cache": scrape_cache_stats(),
+        "scrape_flight": scrape_flight_stats(),
+        "downloads": download_stats(),
+        "parse_pool": parse_pool_stats(),
+        "discovery_pages": page_cache_stats(),
+        "discovery_sources": discovery_source_stats(),
+        "discovery_boards": board_sync_stats(),
+        "job_catalog": job_catalog_stats(),
+        "crawler": crawler_stats(),
+        "seen_urls": seen_urls_stats(),
+    }
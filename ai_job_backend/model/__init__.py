@@ -23,6 +23,8 @@ from model.api_integration import (
     analyze_resume_endpoint,
     generate_answer_endpoint,
     scrape_job_description_endpoint,
+    scrape_job_description_endpoint_async,
+    scrape_job_descriptions_batch_async,
 )
 
 __all__ = [
@@ -40,4 +42,6 @@ __all__ = [
     "analyze_resume_endpoint",
     "generate_answer_endpoint",
     "scrape_job_description_endpoint",
+    "scrape_job_description_endpoint_async",
+    "scrape_job_descriptions_batch_async",
 ]
@@ -6,16 +6,17 @@ These functions can be directly imported and called by the backend server.
 
 import logging
 import os
-from typing import Dict, Optional
+from typing import AsyncIterator, Dict, List, Optional
 
 from dotenv import load_dotenv
 from model.job_assistant_service import JobAssistantService
-from model.job_scraper import scrape_job_description
+from model.job_scraper import get_job_scraper, scrape_job_description, scrape_job_description_async
 from model.resume_analyzer import analyze_resume_and_jd
 from model.resume_extractor import extract_profile_from_resume
 from model.answer_generator import generate_tailored_answer
 from model.utils.config import Config, get_config
 from model.utils.logging_config import setup_logging
+from model.utils.urls import dedupe_job_urls
 
 # Load environment variables from .env file
 load_dotenv()
@@ -149,6 +150,34 @@ def extract_resume_profile_endpoint(resume_text: str) -> Dict:
         return {"success": False, "error": str(e)}
 
 
+def _scraper_api_key() -> Optional[str]:
+    return os.getenv("SCRAPER_API_KEY") or getattr(get_config(), "SCRAPER_API_KEY", None)
+
+
+def _scrape_precheck(job_url: str) -> Optional[Dict]:
+    """Error response for URLs we can't scrape with the current config, else None."""
+    config = get_config()
+    url_lower = job_url.lower()
+    if "linkedin.com" in url_lower:
+        return {
+            "success": False,
+            "error": "LinkedIn is not supported. Use Indeed or Glassdoor job URLs.",
+            "url": job_url,
+        }
+    needs_js = "glassdoor.com" in url_lower
+    has_js_option = config.BROWSERLESS_URL or _scraper_api_key()
+    if needs_js and not has_js_option:
+        return {
+            "success": False,
+            "error": (
+                "Glassdoor needs JS rendering. Set SCRAPER_API_KEY (scraperapi.com) or "
+                "BROWSERLESS_URL (wss://chrome.browserless.io?token=YOUR_TOKEN). Or use Indeed URLs."
+            ),
+            "url": job_url,
+        }
+    return None
+
+
 def scrape_job_description_endpoint(job_url: str) -> Dict:
     """
     Scrape job description from Indeed or Glassdoor URL (LinkedIn not supported).
@@ -156,31 +185,14 @@ def scrape_job_description_endpoint(job_url: str) -> Dict:
     logger.info(f"Scrape job description endpoint called for: {job_url}")
     
     try:
-        config = get_config()
-        url_lower = job_url.lower()
-        if "linkedin.com" in url_lower:
-            return {
-                "success": False,
-                "error": "LinkedIn is not supported. Use Indeed or Glassdoor job URLs.",
-                "url": job_url,
-            }
-        needs_js = "glassdoor.com" in url_lower
-        scraper_key = os.getenv("SCRAPER_API_KEY") or getattr(config, "SCRAPER_API_KEY", None)
-        has_js_option = config.BROWSERLESS_URL or scraper_key
-        if needs_js and not has_js_option:
-            return {
-                "success": False,
-                "error": (
-                    "Glassdoor needs JS rendering. Set SCRAPER_API_KEY (scraperapi.com) or "
-                    "BROWSERLESS_URL (wss://chrome.browserless.io?token=YOUR_TOKEN). Or use Indeed URLs."
-                ),
-                "url": job_url,
-            }
+        error = _scrape_precheck(job_url)
+        if error:
+            return error
         text = scrape_job_description(
             job_url,
             use_selenium=False,
-            use_playwright=bool(config.BROWSERLESS_URL),
-            scraper_api_key=scraper_key,
+            use_playwright=bool(get_config().BROWSERLESS_URL),
+            scraper_api_key=_scraper_api_key(),
         )
         return {
             'success': True,
@@ -194,3 +206,51 @@ def scrape_job_description_endpoint(job_url: str) -> Dict:
             'error': f"Failed to scrape job description: {str(e)}",
             'url': job_url
         }
+
+
+async def scrape_job_description_endpoint_async(job_url: str) -> Dict:
+    """Async version of scrape_job_description_endpoint (no worker thread held during I/O)."""
+    logger.info(f"Scrape job description endpoint (async) called for: {job_url}")
+    try:
+        error = _scrape_precheck(job_url)
+        if error:
+            return error
+        text = await scrape_job_description_async(
+            job_url,
+            use_selenium=False,
+            use_playwright=bool(get_config().BROWSERLESS_URL),
+            scraper_api_key=_scraper_api_key(),
+        )
+        return {'success': True, 'text': text, 'url': job_url}
+    except Exception as e:
+        logger.error(f"Error in scrape_job_description_endpoint_async: {str(e)}")
+        return {
+            'success': False,
+            'error': f"Failed to scrape job description: {str(e)}",
+            'url': job_url
+        }
+
+
+async def scrape_job_descriptions_batch_async(
+    job_urls: List[str],
+    max_concurrency: Optional[int] = None,
+    per_domain: Optional[int] = None,
+) -> AsyncIterator[Dict]:
+    """
+    Scrape many job URLs; yields one result per unique URL as soon as it finishes
+    ({success, text|error, url, method, latency_ms}). Unsupported URLs are yielded first.
+    """
+    urls = dedupe_job_urls(job_urls)
+    logger.info(f"Batch scrape endpoint called for {len(urls)} URLs")
+    runnable = []
+    for url in urls:
+        error = _scrape_precheck(url)
+        if error:
+            yield {**error, "text": None, "method": None, "latency_ms": 0.0}
+        else:
+            runnable.append(url)
+    if not runnable:
+        return
+    scraper = get_job_scraper(bool(get_config().BROWSERLESS_URL), _scraper_api_key())
+    async for result in scraper.scrape_many_async(runnable, max_concurrency, per_domain):
+        yield result
@@ -0,0 +1,211 @@
+"""
+Greenhouse and Lever public board APIs.
+
+Both platforms serve every posting as compact JSON from an unauthenticated board API,
+so for their URLs the scraper can skip downloading and parsing the rendered page.
+resolve_ats_url() maps board and posting URLs to the API endpoint; parse_greenhouse_job /
+parse_lever_posting normalize a posting payload to (description text, job fields) with
+the same field names as model.structured_data, and board_postings() turns a board's job
+list into discovery jobs.
+"""
+
+import hashlib
+import html as html_lib
+import json
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from model.structured_data import html_fragment_to_text
+
+# API roots per platform/region (tests point these at a local server)
+API_BASES = {
+    "greenhouse": "https://boards-api.greenhouse.io/v1/boards",
+    "lever": "https://api.lever.co/v0/postings",
+    "lever-eu": "https://api.eu.lever.co/v0/postings",
+}
+
+_GREENHOUSE_HOSTS = ("boards.greenhouse.io", "job-boards.greenhouse.io")
+_LEVER_HOSTS = {"jobs.lever.co": "lever", "jobs.eu.lever.co": "lever-eu"}
+_SLUG_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+_GREENHOUSE_ID_RE = re.compile(r"^\d+$")
+_LEVER_ID_RE = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE)
+
+
+class AtsRef(NamedTuple):
+    """A Greenhouse/Lever board, or one posting on it (posting_id set)."""
+    site: str                  # "greenhouse" | "lever"
+    api: str                   # key into API_BASES
+    board: str                 # Greenhouse board token / Lever company slug
+    posting_id: Optional[str]
+
+    @property
+    def key(self) -> str:
+        """Board identity, e.g. "greenhouse:acme" (API region included for Lever EU)."""
+        return f"{self.api}:{self.board}"
+
+    @property
+    def api_url(self) -> str:
+        """Posting JSON endpoint, or the board's job list when there is no posting_id."""
+        base = f"{API_BASES[self.api]}/{self.board}"
+        if self.site == "greenhouse":
+            return f"{base}/jobs/{self.posting_id}" if self.posting_id else f"{base}/jobs"
+        return f"{base}/{self.posting_id}" if self.posting_id else f"{base}?mode=json"
+
+
+def resolve_ats_url(url: str) -> Optional[AtsRef]:
+    """
+    AtsRef for Greenhouse/Lever board and posting URLs, e.g.
+    boards.greenhouse.io/acme/jobs/123, boards.greenhouse.io/embed/job_app?for=acme&token=123,
+    jobs.lever.co/acme/<uuid>[/apply]. None for anything else (custom career domains included).
+    """
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return None
+    host = (parsed.hostname or "").lower()
+    parts = [p for p in parsed.path.split("/") if p]
+
+    if host in _GREENHOUSE_HOSTS:
+        if parts[:2] == ["embed", "job_app"]:
+            query = parse_qs(parsed.query)
+            board, token = query.get("for", [""])[0], query.get("token", [""])[0]
+            if _SLUG_RE.match(board) and _GREENHOUSE_ID_RE.match(token):
+                return AtsRef("greenhouse", "greenhouse", board, token)
+            return None
+        if not parts or parts[0] == "embed" or not _SLUG_RE.match(parts[0]):
+            return None
+        if len(parts) >= 3 and parts[1] == "jobs" and _GREENHOUSE_ID_RE.match(parts[2]):
+            return AtsRef("greenhouse", "greenhouse", parts[0], parts[2])
+        if len(parts) == 1:
+            return AtsRef("greenhouse", "greenhouse", parts[0], None)
+        return None
+
+    api = _LEVER_HOSTS.get(host)
+    if api and parts and _SLUG_RE.match(parts[0]):
+        if len(parts) >= 2 and _LEVER_ID_RE.match(parts[1]):
+            return AtsRef("lever", api, parts[0], parts[1].lower())
+        if len(parts) == 1:
+            return AtsRef("lever", api, parts[0], None)
+    return None
+
+
+def _iso_date(value: Any) -> str:
+    """ISO date from an ISO timestamp string or epoch milliseconds (Lever createdAt)."""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value / 1000, tz=timezone.utc).date().isoformat()
+    return str(value or "").strip()
+
+
+def _join(*parts: str) -> str:
+    return " ".join(p for p in parts if p)
+
+
+def parse_greenhouse_job(payload: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """(description text, job fields) from GET /v1/boards/{board}/jobs/{id}."""
+    # content is HTML that Greenhouse sends entity-escaped (&lt;p&gt;...)
+    description = html_fragment_to_text(html_lib.unescape(str(payload.get("content") or "")))
+    location = payload.get("location")
+    fields = {
+        "title": str(payload.get("title") or "").strip(),
+        "company": str(payload.get("company_name") or "").strip(),
+        "location": str(location.get("name") or "").strip() if isinstance(location, dict) else "",
+        "datePosted": _iso_date(payload.get("first_published") or payload.get("updated_at")),
+        "source": "greenhouse-api",
+    }
+    return description, {k: v for k, v in fields.items() if v}
+
+
+def parse_lever_posting(payload: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """(description text, job fields) from GET /v0/postings/{company}/{id}."""
+    sections = [html_fragment_to_text(str(payload.get("description") or ""))]
+    for item in payload.get("lists") or []:
+        if isinstance(item, dict):
+            sections.append(_join(
+                html_fragment_to_text(str(item.get("text") or "")),
+                html_fragment_to_text(str(item.get("content") or "")),
+            ))
+    sections.append(html_fragment_to_text(str(payload.get("additional") or "")))
+
+    categories = payload.get("categories") if isinstance(payload.get("categories"), dict) else {}
+    location = str(categories.get("location") or "").strip()
+    if str(payload.get("workplaceType") or "").lower() == "remote":
+        location = f"Remote ({location})" if location else "Remote"
+    fields = {
+        "title": str(payload.get("text") or "").strip(),
+        "location": location,
+        "datePosted": _iso_date(payload.get("createdAt")),
+        "employmentType": str(categories.get("commitment") or "").strip(),
+        "source": "lever-api",
+    }
+    return _join(*sections), {k: v for k, v in fields.items() if v}
+
+
+def parse_posting(ref: AtsRef, payload: Any) -> Tuple[str, Dict[str, Any]]:
+    """Normalize the posting payload for ref; ("", {}) if it is not a posting object."""
+    if not isinstance(payload, dict):
+        return "", {}
+    if ref.site == "greenhouse":
+        return parse_greenhouse_job(payload)
+    return parse_lever_posting(payload)
+
+
+def parse_board_spec(spec: str) -> Optional[AtsRef]:
+    """Board from "greenhouse:acme" / "lever:acme" / "lever-eu:acme" or a board URL."""
+    spec = spec.strip()
+    if "://" in spec:
+        ref = resolve_ats_url(spec)
+        return ref._replace(posting_id=None) if ref is not None else None
+    api, _, board = spec.partition(":")
+    api, board = api.strip().lower(), board.strip().strip("/")
+    if api not in API_BASES or not _SLUG_RE.match(board):
+        return None
+    return AtsRef("lever" if api.startswith("lever") else api, api, board, None)
+
+
+def _fingerprint(item: Dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(item, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def board_postings(ref: AtsRef, payload: Any) -> List[Dict[str, Any]]:
+    """
+    Discovery jobs ({title, company, url, snippet, source, location}) for a board list
+    payload, each with "id", "updated" (timestamp, for the sync cursor) and "fingerprint"
+    (changes whenever the listed posting does).
+    """
+    jobs: List[Dict[str, Any]] = []
+    if ref.site == "greenhouse":
+        items = payload.get("jobs") if isinstance(payload, dict) else None
+        for item in items or []:
+            if not isinstance(item, dict) or not item.get("id") or not item.get("absolute_url"):
+                continue
+            location = item.get("location")
+            jobs.append({
+                "title": str(item.get("title") or "Job").strip()[:200],
+                "company": str(item.get("company_name") or ref.board).strip(),
+                "url": item["absolute_url"],
+                "snippet": "",
+                "source": "greenhouse",
+                "location": str(location.get("name") or "").strip() if isinstance(location, dict) else "",
+                "id": str(item["id"]),
+                "updated": str(item.get("updated_at") or ""),
+                "fingerprint": _fingerprint(item),
+            })
+        return jobs
+    for item in payload if isinstance(payload, list) else []:
+        if not isinstance(item, dict) or not item.get("id") or not item.get("hostedUrl"):
+            continue
+        categories = item.get("categories") if isinstance(item.get("categories"), dict) else {}
+        jobs.append({
+            "title": str(item.get("text") or "Job").strip()[:200],
+            "company": ref.board,
+            "url": item["hostedUrl"],
+            "snippet": " ".join(str(item.get("descriptionPlain") or "").split())[:300],
+            "source": "lever",
+            "location": str(categories.get("location") or "").strip(),
+            "id": str(item["id"]),
+            "updated": _iso_date(item.get("createdAt")) if item.get("createdAt") else "",
+            "fingerprint": _fingerprint(item),
+        })
+    return jobs
@@ -0,0 +1,300 @@
+"""
+Incremental discovery from Greenhouse / Lever company boards.
+
+DISCOVERY_BOARDS lists company boards ("greenhouse:acme, lever:globex" or board URLs).
+Each sync pulls every board's full job list from its public JSON feed, in parallel, with
+a conditional GET on the board's stored ETag / Last-Modified. Per board, SQLite keeps
+those validators, a cursor (latest posting update seen) and every posting with its
+fingerprint, so a sync only emits postings that are new or changed since the last one,
+and an unchanged board costs one 304. Searches filter the stored postings, so a posting
+first synced during an unrelated search is still found by a later matching one.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from model.ats_api import AtsRef, board_postings, parse_board_spec
+from model.utils.fetch import conditional_headers, response_validators
+
+logger = logging.getLogger(__name__)
+
+
+class BoardSyncStore:
+    """
+    Per-board sync state in SQLite: validators, cursor and postings (job dict + fingerprint).
+    path=None keeps it in memory (lost on restart, so every board is "new" again).
+    Thread-safe; one instance is shared per process (see get_board_sync_store).
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path or ":memory:", check_same_thread=False, timeout=5)
+        if path:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS board_state ("
+            " board TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, cursor TEXT,"
+            " synced_at REAL NOT NULL, postings INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS board_postings ("
+            " board TEXT NOT NULL, posting_id TEXT NOT NULL, fingerprint TEXT NOT NULL, job TEXT,"
+            " PRIMARY KEY (board, posting_id))"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(board_postings)")}
+        if "job" not in columns:
+            # Stores from before postings were kept: forget the validators so the next sync
+            # fetches every board in full and fills in the job dicts
+            self._conn.execute("ALTER TABLE board_postings ADD COLUMN job TEXT")
+            self._conn.execute("DELETE FROM board_state")
+        self._conn.commit()
+
+    def state(self, board: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, cursor, synced_at, postings FROM board_state WHERE board = ?",
+                (board,),
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, cursor, synced_at, postings = row
+        validators = {k: v for k, v in (("etag", etag), ("last_modified", last_modified)) if v}
+        return {"validators": validators, "cursor": cursor, "synced_at": synced_at, "postings": postings}
+
+    def fingerprints(self, board: str) -> Dict[str, str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT posting_id, fingerprint FROM board_postings WHERE board = ?", (board,)
+            ).fetchall()
+        return dict(rows)
+
+    def postings(self, boards: Iterable[str]) -> List[Dict[str, Any]]:
+        """Stored job dicts of the given boards, in board order."""
+        jobs: List[Dict[str, Any]] = []
+        with self._lock:
+            for board in boards:
+                rows = self._conn.execute(
+                    "SELECT job FROM board_postings WHERE board = ? AND job IS NOT NULL ORDER BY rowid", (board,)
+                ).fetchall()
+                jobs.extend(json.loads(job) for (job,) in rows)
+        return jobs
+
+    def touch(self, board: str) -> None:
+        """Board answered 304: only the sync time changes."""
+        with self._lock:
+            self._conn.execute("UPDATE board_state SET synced_at = ? WHERE board = ?", (time.time(), board))
+            self._conn.commit()
+
+    def save(
+        self,
+        board: str,
+        validators: Dict[str, str],
+        cursor: Optional[str],
+        fingerprints: Dict[str, str],
+        removed: Iterable[str],
+        jobs: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
+        """Replace a board's state after a full sync (one transaction); jobs by posting id."""
+        jobs = jobs or {}
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "DELETE FROM board_postings WHERE board = ? AND posting_id = ?",
+                    [(board, pid) for pid in removed],
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO board_postings (board, posting_id, fingerprint, job) VALUES (?, ?, ?, ?)",
+                    [(board, pid, fp, json.dumps(jobs[pid]) if pid in jobs else None) for pid, fp in fingerprints.items()],
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO board_state"
+                    " (board, etag, last_modified, cursor, synced_at, postings) VALUES (?, ?, ?, ?, ?, ?)",
+                    (board, validators.get("etag"), validators.get("last_modified"), cursor,
+                     time.time(), len(fingerprints)),
+                )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            boards, postings = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(postings), 0) FROM board_state"
+            ).fetchone()
+        return {"boards": boards, "postings": postings, "path": self.path}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_counters = {"syncs": 0, "not_modified": 0, "errors": 0, "new": 0, "changed": 0, "removed": 0}
+_counters_lock = threading.Lock()
+
+
+def _count(**deltas: int) -> None:
+    with _counters_lock:
+        for key, n in deltas.items():
+            _counters[key] += n
+
+
+def sync_board(
+    ref: AtsRef,
+    store: BoardSyncStore,
+    session: requests.Session,
+    timeout: float = 20,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Sync one board. Returns (new/changed jobs, summary). Jobs carry "change" ("new" |
+    "changed"); a 304 or fetch error returns no jobs and leaves the stored state as is.
+    """
+    state = store.state(ref.key) or {}
+    try:
+        r = session.get(
+            ref.api_url,
+            timeout=timeout,
+            headers={"Accept": "application/json", **conditional_headers(state.get("validators"))},
+        )
+        if r.status_code == 304 and state:
+            store.touch(ref.key)
+            _count(syncs=1, not_modified=1)
+            return [], {"status": "not_modified", "cursor": state.get("cursor"), "postings": state.get("postings")}
+        r.raise_for_status()
+        postings = board_postings(ref, r.json())
+    except Exception as e:
+        logger.warning("Board sync failed for %s: %s", ref.key, e)
+        _count(syncs=1, errors=1)
+        return [], {"status": "error", "error": str(e)}
+
+    known = store.fingerprints(ref.key)
+    emitted: List[Dict[str, Any]] = []
+    fingerprints: Dict[str, str] = {}
+    jobs: Dict[str, Dict[str, Any]] = {}
+    for job in postings:
+        pid, fp = job.pop("id"), job.pop("fingerprint")
+        fingerprints[pid] = fp
+        jobs[pid] = job
+        if known.get(pid) != fp:
+            emitted.append({**job, "change": "new" if pid not in known else "changed"})
+    removed = [pid for pid in known if pid not in fingerprints]
+    cursor = max((j["updated"] for j in postings if j.get("updated")), default=state.get("cursor"))
+    store.save(ref.key, response_validators(r.headers), cursor, fingerprints, removed, jobs)
+
+    new = sum(1 for j in emitted if j["change"] == "new")
+    _count(syncs=1, new=new, changed=len(emitted) - new, removed=len(removed))
+    summary = {
+        "status": "synced", "postings": len(fingerprints), "new": new,
+        "changed": len(emitted) - new, "removed": len(removed), "cursor": cursor,
+    }
+    return emitted, summary
+
+
+def configured_boards() -> List[AtsRef]:
+    """Boards from DISCOVERY_BOARDS (unrecognized entries are logged and skipped)."""
+    from model.utils.config import get_config
+    boards: List[AtsRef] = []
+    for spec in get_config().DISCOVERY_BOARDS.split(","):
+        if not spec.strip():
+            continue
+        ref = parse_board_spec(spec)
+        if ref is None:
+            logger.warning("DISCOVERY_BOARDS: ignoring %r (use greenhouse:<token>, lever:<slug> or a board URL)", spec)
+        elif ref not in boards:
+            boards.append(ref)
+    return boards
+
+
+def sync_boards(
+    boards: Optional[Iterable[AtsRef]] = None,
+    store: Optional[BoardSyncStore] = None,
+    session: Optional[requests.Session] = None,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Sync boards (default: DISCOVERY_BOARDS) in parallel.
+    Returns {"jobs": new/changed jobs from all boards, "boards": {key: summary}}.
+    """
+    from model.utils.config import get_config
+    boards = list(configured_boards() if boards is None else boards)
+    if not boards:
+        return {"jobs": [], "boards": {}}
+    store = store or get_board_sync_store()
+    sess = session or requests.Session()
+    workers = max(1, min(len(boards), max_workers or get_config().DISCOVERY_BOARD_WORKERS))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="board-sync") as executor:
+        results = list(executor.map(lambda ref: sync_board(ref, store, sess), boards))
+    jobs: List[Dict[str, Any]] = []
+    summaries: Dict[str, Any] = {}
+    for ref, (emitted, summary) in zip(boards, results):
+        jobs.extend(emitted)
+        summaries[ref.key] = summary
+    logger.info("Board sync: %d boards, %d new/changed postings", len(boards), len(jobs))
+    return {"jobs": jobs, "boards": summaries}
+
+
+def _matches(job: Dict[str, Any], terms: List[str]) -> bool:
+    haystack = f"{job.get('title', '')} {job.get('location', '')} {job.get('company', '')}".lower()
+    return all(t in haystack for t in terms)
+
+
+def discover_boards(query: str = "", max_results: int = 50) -> List[Dict[str, Any]]:
+    """
+    Discovery source: syncs the configured boards, then returns their stored postings whose
+    title, location or company contains every query word; those new/changed in this sync carry
+    "change". Returns list of {title, company, url, snippet, source, ...}.
+    """
+    boards = configured_boards()
+    if not boards:
+        return []
+    store = get_board_sync_store()
+    changes = {j["url"]: j["change"] for j in sync_boards(boards, store=store)["jobs"]}
+    terms = (query or "").lower().split()
+    jobs = []
+    for job in store.postings(ref.key for ref in boards):
+        if _matches(job, terms):
+            if job["url"] in changes:
+                job["change"] = changes[job["url"]]
+            jobs.append(job)
+            if len(jobs) >= max_results:
+                break
+    return jobs
+
+
+_board_store: Optional[BoardSyncStore] = None
+_board_store_lock = threading.Lock()
+
+
+def get_board_sync_store() -> BoardSyncStore:
+    """Process-wide BoardSyncStore under CACHE_DIR (memory only when CACHE_DIR is empty)."""
+    global _board_store
+    with _board_store_lock:
+        if _board_store is None:
+            from model.utils.config import get_config
+            cache_dir = get_config().CACHE_DIR
+            _board_store = BoardSyncStore(os.path.join(cache_dir, "board_sync.sqlite3") if cache_dir else None)
+        return _board_store
+
+
+def board_sync_stats() -> Dict[str, Any]:
+    """Sync counters (304s, new/changed/removed postings) and stored state, without opening the store."""
+    with _counters_lock:
+        stats: Dict[str, Any] = dict(_counters)
+    if _board_store is not None:
+        stats["store"] = _board_store.stats()
+    return stats
+
+
+def close_board_sync_store() -> None:
+    global _board_store
+    with _board_store_lock:
+        store, _board_store = _board_store, None
+    if store is not None:
+        store.close()
@@ -54,15 +54,38 @@ class ResumeScoreOutput(TypedDict, total=False):
 
 # ---- Scraper output (current contract) ----
 
+class JobPostingFields(TypedDict, total=False):
+    """JobPosting fields from JSON-LD/microdata (model.structured_data) or a board API (model.ats_api)."""
+    title: str
+    company: str
+    location: str
+    datePosted: str
+    employmentType: str
+    description: str   # plain text; the scrape result carries it as "text"
+    source: str        # "json-ld" | "microdata" | "greenhouse-api" | "lever-api"
+
+
 def scraper_output_schema() -> Dict[str, Any]:
     """
-    Current scraper returns plain text.
-    Optional future: {"title", "company", "description", "requirements", "url"}.
+    Scraper output. title/company/location/datePosted come from the page's JobPosting
+    structured data (result["job"]) when present; description is the scraped text.
     """
     return {
         "title": "str (optional)",
         "company": "str (optional)",
+        "location": "str (optional)",
+        "datePosted": "str (optional, ISO 8601)",
         "description": "str (main content)",
         "requirements": "str (optional)",
         "url": "str",
     }
+
+
+def to_scraper_output(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a JobScraper.scrape() result onto scraper_output_schema (missing fields omitted)."""
+    job = result.get("job") or {}
+    output = {k: job[k] for k in ("title", "company", "location", "datePosted") if job.get(k)}
+    if result.get("text"):
+        output["description"] = result["text"]
+    output["url"] = result.get("url")
+    return output
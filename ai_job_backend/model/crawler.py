@@ -0,0 +1,179 @@
+"""
+Background discovery crawler that keeps the local job catalog (model.job_catalog) warm.
+
+Every CRAWLER_INTERVAL seconds it runs discover_jobs for CRAWLER_QUERIES (popular
+role|location pairs) plus the queries derived from the most recently updated users'
+user_preferences, and upserts the results into the catalog. Rank requests then read
+the catalog instead of scraping third-party sites on the request path. Each run reports
+only the genuinely new postings (seen-URL filter); every result still refreshes the
+catalog so known postings do not age out of it.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from model.job_catalog import JobCatalog, get_job_catalog, normalize_query
+
+logger = logging.getLogger(__name__)
+
+
+def parse_crawl_queries(spec: str) -> List[Tuple[str, str]]:
+    """ "software engineer|Remote; data scientist|" -> [(query, location), ...] (duplicates dropped)."""
+    queries: List[Tuple[str, str]] = []
+    for item in spec.split(";"):
+        query, _, location = item.partition("|")
+        query, location = query.strip(), location.strip()
+        if query and normalize_query(query, location) not in {normalize_query(*q) for q in queries}:
+            queries.append((query, location))
+    return queries
+
+
+class DiscoveryCrawler:
+    """
+    Daemon thread that crawls the configured and user-preference queries on a fixed
+    interval. crawl_once() runs one pass synchronously (also used by tests/scripts).
+    """
+
+    def __init__(
+        self,
+        catalog: JobCatalog,
+        queries: List[Tuple[str, str]],
+        interval: float = 3600,
+        user_queries: int = 50,
+        max_results: int = 60,
+        retention: float = 14 * 86400,
+    ):
+        self.catalog = catalog
+        self.queries = queries
+        self.interval = interval
+        self.user_queries = user_queries
+        self.max_results = max_results
+        self.retention = retention
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats: Dict[str, Any] = {
+            "runs": 0, "queries_crawled": 0, "query_failures": 0, "jobs_upserted": 0, "new_jobs": 0,
+            "last_run_at": None, "last_run_seconds": None, "last_queries": 0,
+        }
+
+    def _user_queries(self) -> List[Tuple[str, str]]:
+        from model.job_matches import _discovery_query_and_location
+        from model.profile_lookup import get_preference_profiles
+        return [_discovery_query_and_location(p) for p in get_preference_profiles(self.user_queries)]
+
+    def plan(self) -> List[Tuple[str, str]]:
+        """Configured queries first, then user-preference queries not already covered."""
+        plan = list(self.queries)
+        seen = {normalize_query(*q) for q in plan}
+        for query, location in self._user_queries():
+            key = normalize_query(query, location)
+            if key[0] and key not in seen:
+                seen.add(key)
+                plan.append((query, location))
+        return plan
+
+    def crawl_once(self) -> Dict[str, Any]:
+        """
+        Crawl every planned query once; returns this run's totals and new_postings, the
+        URLs of postings no earlier discovery returned.
+        """
+        from model.job_discovery import discover_jobs
+        started = time.perf_counter()
+        plan = self.plan()
+        run: Dict[str, Any] = {"queries": len(plan), "failures": 0, "upserted": 0, "new": 0, "new_postings": []}
+        for query, location in plan:
+            if self._stop.is_set():
+                break
+            try:
+                result = discover_jobs(query=query, location=location, max_results=self.max_results, use_cache=False)
+                counts = self.catalog.upsert(result.get("jobs") or [], query, location)
+                run["upserted"] += counts["new"] + counts["updated"]
+                # Genuinely new postings per the seen-URL filter; catalog inserts if it is disabled
+                new = result.get("new_jobs")
+                run["new"] += counts["new"] if new is None else new
+                if new is not None:
+                    run["new_postings"] += [j["url"] for j in result.get("jobs") or [] if not j.get("seen_before")]
+            except Exception as e:
+                run["failures"] += 1
+                logger.warning("Crawl of %r / %r failed: %s", query, location, e)
+        self.catalog.prune(self.retention)
+        elapsed = round(time.perf_counter() - started, 2)
+        self._stats.update(last_run_at=time.time(), last_run_seconds=elapsed, last_queries=len(plan))
+        self._stats["runs"] += 1
+        self._stats["queries_crawled"] += len(plan) - run["failures"]
+        self._stats["query_failures"] += run["failures"]
+        self._stats["jobs_upserted"] += run["upserted"]
+        self._stats["new_jobs"] += run["new"]
+        logger.info(
+            "Crawl finished in %.1fs: %d queries, %d jobs upserted (%d new)",
+            elapsed, len(plan), run["upserted"], run["new"],
+        )
+        return run
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.crawl_once()
+            except Exception as e:
+                logger.error("Crawl run failed: %s", e, exc_info=True)
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="discovery-crawler", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5) -> None:
+        """Stop after the query in progress (does not wait for a whole run)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._stats, "interval": self.interval, "configured_queries": len(self.queries),
+                "running": self._thread is not None and self._thread.is_alive()}
+
+
+_crawler: Optional[DiscoveryCrawler] = None
+_crawler_lock = threading.Lock()
+
+
+def get_crawler() -> Optional[DiscoveryCrawler]:
+    """Start the process-wide crawler (CRAWLER_ENABLED=true and the catalog enabled); else None."""
+    global _crawler
+    from model.utils.config import get_config
+    config = get_config()
+    if not config.CRAWLER_ENABLED:
+        return None
+    catalog = get_job_catalog()
+    if catalog is None:
+        return None
+    with _crawler_lock:
+        if _crawler is None:
+            _crawler = DiscoveryCrawler(
+                catalog,
+                parse_crawl_queries(config.CRAWLER_QUERIES),
+                interval=config.CRAWLER_INTERVAL,
+                user_queries=config.CRAWLER_USER_QUERIES,
+                max_results=config.CRAWLER_MAX_RESULTS,
+                retention=config.CATALOG_RETENTION,
+            )
+            _crawler.start()
+        return _crawler
+
+
+def crawler_stats() -> Dict[str, Any]:
+    """Stats of the running crawler (empty when not started)."""
+    return _crawler.stats() if _crawler is not None else {}
+
+
+def close_crawler() -> None:
+    """Stop the crawler thread (app shutdown)."""
+    global _crawler
+    with _crawler_lock:
+        crawler, _crawler = _crawler, None
+    if crawler is not None:
+        crawler.stop()
@@ -0,0 +1,147 @@
+"""
+Registry of job discovery sources.
+
+Each source declares its own fetch policy:
+- concurrency: fetches of the source in flight at once, across all searches
+- timeout: seconds a search waits for it (capped by the search's overall deadline)
+- retries: extra attempts after an exception, or after an empty result with retry_empty
+  (the JS-rendered boards return nothing when a render fails)
+- cost: ScraperAPI render credits per attempt, counted when SCRAPER_API_KEY is set
+
+Discovery fans out to the sources in registration order, which is also merge priority.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+OK = "ok"
+ERROR = "error"
+TIMEOUT = "timeout"
+
+FetchFn = Callable[[str, str, int, requests.Session], List[Dict[str, Any]]]
+
+
+class DiscoverySource:
+    """A discovery source: fetch(query, location, max_results, session) -> jobs, plus its policy."""
+
+    def __init__(
+        self,
+        name: str,
+        label: str,
+        fetch: FetchFn,
+        concurrency: int = 2,
+        timeout: float = 60.0,
+        retries: int = 0,
+        retry_empty: bool = False,
+        cost: int = 0,
+        latency_alpha: float = 0.3,
+    ):
+        self.name = name
+        self.label = label
+        self.fetch = fetch
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.retries = max(0, retries)
+        self.retry_empty = retry_empty
+        self.cost = cost
+        self.latency_alpha = latency_alpha
+        self._slots = threading.BoundedSemaphore(self.concurrency)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._latency_ms: Optional[float] = None  # EWMA
+        self._counters = {"runs": 0, OK: 0, ERROR: 0, TIMEOUT: 0, "retries": 0, "jobs": 0, "credits": 0}
+
+    def run(self, query: str, location: str, max_results: int, session: requests.Session, deadline: float) -> Dict[str, Any]:
+        """
+        Fetch before deadline (time.monotonic()), waiting for a free slot and retrying per policy
+        while time remains. Never raises; returns the run's status record:
+        {source, status (ok / error / timeout), jobs, found, attempts, credits, latency_ms[, error]}.
+        A result that arrives after the deadline keeps its jobs but is reported as a timeout.
+        """
+        started = time.monotonic()
+        record: Dict[str, Any] = {"source": self.name, "status": OK, "jobs": [], "attempts": 0}
+        if not self._slots.acquire(timeout=max(0.0, deadline - started)):
+            record.update(status=TIMEOUT, error="no free fetch slot")
+        else:
+            with self._lock:
+                self._in_flight += 1
+            try:
+                for _ in range(self.retries + 1):
+                    record["attempts"] += 1
+                    try:
+                        record.update(status=OK, jobs=self.fetch(query, location, max_results, session))
+                        record.pop("error", None)
+                    except Exception as e:
+                        logger.warning("%s discovery failed (attempt %d): %s", self.label, record["attempts"], e)
+                        record.update(status=ERROR, jobs=[], error=str(e))
+                    if (record["status"] == OK and (record["jobs"] or not self.retry_empty)) or time.monotonic() >= deadline:
+                        break
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+                self._slots.release()
+            if time.monotonic() > deadline:
+                record.update(status=TIMEOUT, error=f"no result within {deadline - started:.0f}s")
+        record["found"] = len(record["jobs"])
+        record["credits"] = record["attempts"] * self.cost if os.getenv("SCRAPER_API_KEY") else 0
+        record["latency_ms"] = round((time.monotonic() - started) * 1000)
+        self._record(record)
+        return record
+
+    def _record(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._counters["runs"] += 1
+            self._counters[record["status"]] += 1
+            self._counters["retries"] += max(0, record["attempts"] - 1)
+            self._counters["jobs"] += record["found"]
+            self._counters["credits"] += record["credits"]
+            latency = record["latency_ms"]
+            self._latency_ms = latency if self._latency_ms is None else (
+                self.latency_alpha * latency + (1 - self.latency_alpha) * self._latency_ms
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._counters,
+                "in_flight": self._in_flight,
+                "latency_ms": None if self._latency_ms is None else round(self._latency_ms),
+                "policy": {
+                    "concurrency": self.concurrency, "timeout": self.timeout, "retries": self.retries,
+                    "retry_empty": self.retry_empty, "cost": self.cost,
+                },
+            }
+
+
+_sources: Dict[str, DiscoverySource] = {}
+_sources_lock = threading.Lock()
+
+
+def register_source(source: DiscoverySource) -> DiscoverySource:
+    """Add a discovery source (replacing one of the same name, keeping its position)."""
+    with _sources_lock:
+        _sources[source.name] = source
+    return source
+
+
+def unregister_source(name: str) -> Optional[DiscoverySource]:
+    with _sources_lock:
+        return _sources.pop(name, None)
+
+
+def discovery_sources() -> List[DiscoverySource]:
+    """Registered sources in merge-priority (registration) order."""
+    with _sources_lock:
+        return list(_sources.values())
+
+
+def discovery_source_stats() -> Dict[str, Any]:
+    """Per-source runs by status, retries, jobs found, credits spent, latency EWMA and policy."""
+    return {source.name: source.stats() for source in discovery_sources()}
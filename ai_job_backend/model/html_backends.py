@@ -0,0 +1,217 @@
+"""
+HTML parser backends for the scraper and discovery layers.
+
+Both backends expose the same small DOM API (parse, select, drop, text, attr,
+parent) so extraction code is written once:
+- lxml: libxml2 tree + cssselect-compiled XPath, no Python-level tree walk (fast path)
+- soup: BeautifulSoup + soupsieve, used when lxml/cssselect are missing or a page
+  fails to parse
+
+Select a backend with HTML_PARSER_BACKEND=auto|lxml|soup (auto = lxml when available).
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import soupsieve
+from bs4 import BeautifulSoup
+
+from model.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Optional lxml/cssselect fast path (pip install lxml cssselect)
+try:
+    import lxml.html
+    from lxml import etree
+    from lxml.cssselect import CSSSelector
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+class SelectorPlan(NamedTuple):
+    """Compiled content/exclude selectors for one site on one backend."""
+    content: List[Tuple[str, Any]]
+    exclude: List[Any]
+
+
+class ParserBackend:
+    """Common backend API; subclasses implement parse/compile and the node accessors."""
+
+    name = ""
+
+    def __init__(self):
+        self._compiled: Dict[str, Any] = {}
+
+    def parse(self, html: str) -> Any:
+        raise NotImplementedError
+
+    def compile(self, selector: str) -> Any:
+        raise NotImplementedError
+
+    def compiled(self, selector: str) -> Optional[Any]:
+        """Compiled selector from the per-backend cache; None if the selector is invalid."""
+        if selector not in self._compiled:
+            try:
+                self._compiled[selector] = self.compile(selector)
+            except Exception as e:
+                logger.warning("Invalid selector %r for %s backend: %s", selector, self.name, e)
+                self._compiled[selector] = None
+        return self._compiled[selector]
+
+
+class SoupBackend(ParserBackend):
+    """BeautifulSoup tree with soupsieve selectors (pure Python, always available)."""
+
+    name = "soup"
+
+    def __init__(self, features: str = "lxml"):
+        super().__init__()
+        self.features = features
+
+    def parse(self, html: str) -> Any:
+        try:
+            return BeautifulSoup(html, self.features)
+        except Exception:
+            return BeautifulSoup(html, "html.parser")
+
+    def compile(self, selector: str) -> Any:
+        return soupsieve.compile(selector)
+
+    def select(self, node: Any, compiled: Any) -> List[Any]:
+        return compiled.select(node)
+
+    def first(self, node: Any, compiled: Any) -> Optional[Any]:
+        return compiled.select_one(node)
+
+    def drop(self, node: Any) -> None:
+        node.decompose()
+
+    def text(self, node: Any, separator: str = " ") -> str:
+        return node.get_text(separator=separator, strip=True) or ""
+
+    def attr(self, node: Any, name: str) -> str:
+        value = node.get(name)
+        if isinstance(value, list):  # multi-valued attributes (class, rel)
+            return " ".join(value)
+        return value or ""
+
+    def parent(self, node: Any) -> Optional[Any]:
+        return node.parent
+
+
+class LxmlBackend(ParserBackend):
+    """lxml.html tree with cssselect-compiled XPath selectors."""
+
+    name = "lxml"
+
+    def __init__(self):
+        super().__init__()
+        # Strings BeautifulSoup leaves out of get_text(): script/style/ruby annotations
+        self._text_nodes = etree.XPath(
+            "descendant-or-self::text()[not(parent::script or parent::style"
+            " or parent::rt or parent::rp)]",
+            smart_strings=False,
+        )
+
+    def parse(self, html: str) -> Any:
+        try:
+            doc = lxml.html.document_fromstring(html)
+        except ValueError:
+            # str input with an <?xml encoding=...?> declaration is rejected by lxml
+            parser = lxml.html.HTMLParser(encoding="utf-8")
+            doc = lxml.html.document_fromstring(html.encode("utf-8"), parser=parser)
+        if "<template" in html:
+            # Inert template content: soup keeps it out of get_text(), so drop it here
+            for el in list(doc.iter("template")):
+                self.drop(el)
+        return doc
+
+    def compile(self, selector: str) -> Any:
+        return CSSSelector(selector, translator="html")
+
+    def select(self, node: Any, compiled: Any) -> List[Any]:
+        # cssselect uses descendant-or-self; soup's select() never matches the node itself
+        return [el for el in compiled(node) if el is not node]
+
+    def first(self, node: Any, compiled: Any) -> Optional[Any]:
+        found = self.select(node, compiled)
+        return found[0] if found else None
+
+    def drop(self, node: Any) -> None:
+        if node.getparent() is not None:
+            node.drop_tree()
+
+    def text(self, node: Any, separator: str = " ") -> str:
+        """Same strings as soup get_text(strip=True): no comments, scripts or styles."""
+        parts = []
+        for s in self._text_nodes(node):
+            s = s.strip()
+            if s:
+                parts.append(s)
+        return separator.join(parts)
+
+    def attr(self, node: Any, name: str) -> str:
+        return node.get(name) or ""
+
+    def parent(self, node: Any) -> Optional[Any]:
+        return node.getparent()
+
+
+_backends: Dict[Tuple[str, str], ParserBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def available_backends() -> List[str]:
+    """Backend names usable in this environment (fastest first)."""
+    return (["lxml"] if LXML_AVAILABLE else []) + ["soup"]
+
+
+def get_parser_backend(name: Optional[str] = None, soup_features: str = "lxml") -> ParserBackend:
+    """
+    Shared backend instance (compiled selectors are cached on it).
+    name: lxml | soup | auto (default: HTML_PARSER_BACKEND). soup_features is the
+    BeautifulSoup tree builder used by the soup backend.
+    """
+    name = (name or Config.HTML_PARSER_BACKEND or "auto").lower()
+    if name == "auto" or (name == "lxml" and not LXML_AVAILABLE):
+        name = "lxml" if LXML_AVAILABLE else "soup"
+    key = (name, soup_features if name == "soup" else "")
+    with _backends_lock:
+        backend = _backends.get(key)
+        if backend is None:
+            backend = LxmlBackend() if name == "lxml" else SoupBackend(soup_features)
+            _backends[key] = backend
+        return backend
+
+
+def parse_document(
+    html: str,
+    backend: Optional[ParserBackend] = None,
+    soup_features: str = "lxml",
+) -> Tuple[ParserBackend, Any]:
+    """Parse html with the configured backend, falling back to soup if it fails."""
+    backend = backend or get_parser_backend(soup_features=soup_features)
+    if backend.name != "soup":
+        try:
+            return backend, backend.parse(html)
+        except Exception as e:
+            logger.debug("%s parse failed, falling back to soup: %s", backend.name, e)
+        backend = get_parser_backend("soup", soup_features=soup_features)
+    return backend, backend.parse(html)
+
+
+def compile_plan(
+    backend: ParserBackend,
+    content_selectors: Sequence[str],
+    exclude_selectors: Sequence[str],
+) -> SelectorPlan:
+    """Compile a site's selectors once; invalid selectors are dropped."""
+    content = [(sel, backend.compiled(sel)) for sel in content_selectors]
+    exclude = [backend.compiled(sel) for sel in exclude_selectors]
+    return SelectorPlan(
+        content=[(sel, c) for sel, c in content if c is not None],
+        exclude=[c for c in exclude if c is not None],
+    )
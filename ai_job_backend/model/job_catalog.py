@@ -0,0 +1,383 @@
+"""
+Local job catalog: discovered postings kept in SQLite so ranking does not depend on
+live third-party fetches per request.
+
+The background crawler (model.crawler) upserts discovery results for popular and
+user-preference queries; live discoveries are recorded too. Each posting row has
+first_seen / last_seen timestamps; job_queries links a normalized (query, location) to
+the postings it returned, so get_candidate_jobs_for_user can answer from the catalog.
+
+An FTS5 index over title / company / location / snippet (kept in sync by triggers)
+serves BM25-ranked keyword searches (search()), so /api/job/discover can answer from
+postings already fetched. Without FTS5 in the SQLite build, search() falls back to
+substring matching ordered by recency.
+
+New postings get a SimHash fingerprint (model.utils.simhash); its bands are indexed so
+a posting's near-duplicates already in the catalog are found without a scan. Near-duplicates
+share a cluster, and lookup() / search() return one posting per cluster with the others'
+URLs in alternate_urls.
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from model.utils.simhash import (
+    SimHashIndex, bands, from_signed, hamming, job_simhash, merge_alternate_urls, to_signed,
+)
+from model.utils.urls import canonical_job_url
+
+logger = logging.getLogger(__name__)
+
+
+_FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5("
+    " title, company, location, snippet, content='jobs', content_rowid='rowid',"
+    " tokenize='porter unicode61 remove_diacritics 2');"
+    "CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN"
+    " INSERT INTO jobs_fts (rowid, title, company, location, snippet)"
+    " VALUES (new.rowid, new.title, new.company, new.location, new.snippet); END;"
+    "CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN"
+    " INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location, snippet)"
+    " VALUES ('delete', old.rowid, old.title, old.company, old.location, old.snippet); END;"
+    "CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE ON jobs BEGIN"
+    " INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location, snippet)"
+    " VALUES ('delete', old.rowid, old.title, old.company, old.location, old.snippet);"
+    " INSERT INTO jobs_fts (rowid, title, company, location, snippet)"
+    " VALUES (new.rowid, new.title, new.company, new.location, new.snippet); END;"
+)
+# bm25() column weights: title matches count most, then company, location, snippet
+_BM25_WEIGHTS = (10.0, 4.0, 2.0, 1.0)
+_TERM_RE = re.compile(r"\w+")
+# Rows read per requested result, so near-duplicates folded into a cluster still leave max_results
+_OVERFETCH = 2
+
+
+def normalize_query(query: str, location: str = "") -> Tuple[str, str]:
+    """Catalog key for a search (same normalization as the discovery cache)."""
+    return " ".join((query or "").lower().split()), " ".join((location or "").lower().split())
+
+
+def _terms(text: str) -> List[str]:
+    return _TERM_RE.findall((text or "").lower())
+
+
+def _match_expression(query: str) -> str:
+    """FTS5 MATCH string: every query word, in any column (quoted, so no query syntax)."""
+    return " AND ".join(f'"{t}"' for t in _terms(query))
+
+
+def _posted_at(job: Dict[str, Any], now: float) -> Optional[float]:
+    """Posting time (epoch) from a job's posted_at date or posted_days_ago, if known."""
+    days = job.get("posted_days_ago")
+    if isinstance(days, (int, float)):
+        return now - days * 86400
+    value = job.get("posted_at")
+    if not value:
+        return None
+    try:
+        posted = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if posted.tzinfo is None:
+        posted = posted.replace(tzinfo=timezone.utc)
+    return posted.timestamp()
+
+
+class JobCatalog:
+    """
+    Postings keyed by canonical job URL, plus (query, location) -> posting links and a
+    full-text index. path=None keeps the catalog in memory. Thread-safe; one instance is
+    shared per process (see get_job_catalog).
+    """
+
+    def __init__(self, path: Optional[str] = None, clock=time.time, max_distance: int = 3):
+        self.path = path
+        self._clock = clock
+        self.max_distance = max_distance
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path or ":memory:", check_same_thread=False, timeout=5)
+        if path:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " url TEXT PRIMARY KEY, title TEXT NOT NULL, company TEXT, location TEXT,"
+            " snippet TEXT, source TEXT, payload TEXT NOT NULL,"
+            " first_seen REAL NOT NULL, last_seen REAL NOT NULL, posted_at REAL);"
+            "CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs(last_seen);"
+            "CREATE TABLE IF NOT EXISTS job_queries ("
+            " query TEXT NOT NULL, location TEXT NOT NULL, url TEXT NOT NULL, last_seen REAL NOT NULL,"
+            " PRIMARY KEY (query, location, url));"
+            "CREATE TABLE IF NOT EXISTS job_simhash_bands ("
+            " band INTEGER NOT NULL, value INTEGER NOT NULL, url TEXT NOT NULL,"
+            " PRIMARY KEY (band, value, url)) WITHOUT ROWID;"
+            "CREATE INDEX IF NOT EXISTS idx_simhash_bands_url ON job_simhash_bands(url);"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for column in ("posted_at REAL", "simhash INTEGER", "cluster TEXT"):
+            if column.split()[0] not in columns:
+                self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {column}")
+        self._conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS jobs_simhash_delete AFTER DELETE ON jobs BEGIN"
+            " DELETE FROM job_simhash_bands WHERE url = old.url; END"
+        )
+        self.fts = self._create_fts()
+        self._conn.commit()
+        self._counters = {
+            "upserts": 0, "new": 0, "near_duplicates": 0, "lookups": 0, "hits": 0, "pruned": 0, "searches": 0,
+        }
+
+    def _create_fts(self) -> bool:
+        """Create (and on first creation, backfill) the FTS5 index; False when FTS5 is unavailable."""
+        try:
+            exists = self._conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'").fetchone()
+            self._conn.executescript(_FTS_SCHEMA)
+            if not exists:
+                self._conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+            return True
+        except sqlite3.OperationalError as e:
+            logger.warning("SQLite FTS5 unavailable (%s); job search falls back to substring matching", e)
+            return False
+
+    def upsert(self, jobs: Iterable[Dict[str, Any]], query: str = "", location: str = "") -> Dict[str, int]:
+        """
+        Insert or refresh postings (first_seen kept, last_seen bumped) and link them to
+        the (query, location) that found them. Returns {"new": n, "updated": n}.
+        """
+        now = self._clock()
+        key = normalize_query(query, location)
+        rows = []
+        for job in jobs:
+            url = canonical_job_url(job.get("url") or "")
+            if not url or not job.get("title"):
+                continue
+            payload = {k: v for k, v in job.items() if k not in ("change", "cached", "seen_before", "first_seen", "last_seen")}
+            rows.append((
+                url, job["title"], job.get("company") or "", job.get("location") or "",
+                job.get("snippet") or "", job.get("source") or "",
+                json.dumps(payload, separators=(",", ":")), now, now, _posted_at(job, now),
+                job_simhash(job) if self.max_distance > 0 else None,
+            ))
+        if not rows:
+            return {"new": 0, "updated": 0}
+        with self._lock, self._conn:
+            known = {
+                url for (url,) in self._conn.execute(
+                    f"SELECT url FROM jobs WHERE url IN ({','.join('?' * len(rows))})", [r[0] for r in rows]
+                )
+            }
+            rows, band_rows = self._assign_clusters(rows, known)
+            self._conn.executemany(
+                "INSERT INTO jobs (url, title, company, location, snippet, source, payload,"
+                " first_seen, last_seen, posted_at, simhash, cluster)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(url) DO UPDATE SET title = excluded.title, company = excluded.company,"
+                " location = excluded.location, snippet = excluded.snippet, source = excluded.source,"
+                " payload = excluded.payload, last_seen = excluded.last_seen,"
+                " posted_at = COALESCE(excluded.posted_at, jobs.posted_at)",
+                rows,
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO job_simhash_bands (band, value, url) VALUES (?, ?, ?)", band_rows
+            )
+            if key[0]:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO job_queries (query, location, url, last_seen) VALUES (?, ?, ?, ?)",
+                    [(key[0], key[1], r[0], now) for r in rows],
+                )
+        new = len({r[0] for r in rows} - known)
+        self._counters["upserts"] += len(rows)
+        self._counters["new"] += new
+        return {"new": new, "updated": len(rows) - new}
+
+    def _assign_clusters(self, rows: List[tuple], known: set) -> Tuple[List[tuple], List[Tuple[int, int, str]]]:
+        """
+        Append (signed simhash, cluster) to each row. A new posting joins the cluster of a
+        near-duplicate already cataloged or earlier in this batch (band lookups, then a
+        Hamming check), else starts its own; existing postings keep theirs (the upsert
+        leaves both columns alone). Also returns the new postings' band rows.
+        """
+        batch = SimHashIndex(self.max_distance)
+        batch_clusters: List[str] = []
+        out: List[tuple] = []
+        band_rows: List[Tuple[int, int, str]] = []
+        for row in rows:
+            url, fingerprint = row[0], row[-1]
+            cluster = url
+            if fingerprint is not None and url not in known:
+                match = batch.near(fingerprint)
+                if match:
+                    cluster = batch_clusters[match[0]]
+                else:
+                    cluster = self._cataloged_cluster(fingerprint, url) or url
+                if cluster != url:
+                    self._counters["near_duplicates"] += 1
+                batch.add(len(batch_clusters), fingerprint)
+                batch_clusters.append(cluster)
+                band_rows.extend((band, value, url) for band, value in bands(fingerprint, self.max_distance))
+            out.append(row[:-1] + (None if fingerprint is None else to_signed(fingerprint), cluster))
+        return out, band_rows
+
+    def _cataloged_cluster(self, fingerprint: int, url: str) -> Optional[str]:
+        """Cluster of a cataloged near-duplicate of fingerprint (other than url), if any."""
+        band_list = bands(fingerprint, self.max_distance)
+        where = " OR ".join("(b.band = ? AND b.value = ?)" for _ in band_list)
+        candidates = self._conn.execute(
+            "SELECT DISTINCT j.url, j.simhash, j.cluster FROM job_simhash_bands b JOIN jobs j ON j.url = b.url"
+            f" WHERE ({where}) AND j.url != ?",
+            [v for band in band_list for v in band] + [url],
+        ).fetchall()
+        for other_url, other, cluster in candidates:
+            if other is not None and hamming(from_signed(other), fingerprint) <= self.max_distance:
+                return cluster or other_url
+        return None
+
+    @staticmethod
+    def _collapse(rows: List[tuple], max_results: int) -> List[Dict[str, Any]]:
+        """(payload, first_seen, last_seen, cluster) rows -> one job per cluster, in row order."""
+        jobs: List[Dict[str, Any]] = []
+        by_cluster: Dict[str, Dict[str, Any]] = {}
+        for payload, first, last, cluster in rows:
+            job = {**json.loads(payload), "first_seen": first, "last_seen": last}
+            rep = by_cluster.get(cluster) if cluster else None
+            if rep is None:
+                if len(jobs) < max_results:
+                    jobs.append(job)
+                    if cluster:
+                        by_cluster[cluster] = job
+                continue
+            merge_alternate_urls(rep, job)
+        return jobs
+
+    def lookup(self, query: str, location: str = "", max_results: int = 60, max_age: float = 86400) -> List[Dict[str, Any]]:
+        """
+        Postings seen for (query, location) within max_age seconds, most recently seen first,
+        one per near-duplicate cluster.
+        """
+        key = normalize_query(query, location)
+        horizon = self._clock() - max_age
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT j.payload, j.first_seen, j.last_seen, j.cluster FROM job_queries q JOIN jobs j ON j.url = q.url"
+                " WHERE q.query = ? AND q.location = ? AND q.last_seen >= ?"
+                " ORDER BY q.last_seen DESC, j.first_seen DESC LIMIT ?",
+                (key[0], key[1], horizon, max_results * _OVERFETCH),
+            ).fetchall()
+        self._counters["lookups"] += 1
+        self._counters["hits"] += int(bool(rows))
+        return self._collapse(rows, max_results)
+
+    def search(
+        self,
+        query: str,
+        location: str = "",
+        max_results: int = 60,
+        source: Optional[str] = None,
+        posted_days_ago: Optional[int] = None,
+        max_age: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Keyword search over every cataloged posting: all query words must appear (title,
+        company, location or snippet; stemmed) and each location word in the posting's location
+        or in the location of a search that returned it (scraped cards carry no location),
+        best BM25 match first, one per near-duplicate cluster. Optional filters: source, posted
+        within posted_days_ago days (postings without a known date are left out), seen within
+        max_age seconds.
+        """
+        now = self._clock()
+        filters, params = [], []
+        if source:
+            filters.append("j.source = ?")
+            params.append(source)
+        if posted_days_ago is not None:
+            filters.append("j.posted_at >= ?")
+            params.append(now - posted_days_ago * 86400)
+        if max_age is not None:
+            filters.append("j.last_seen >= ?")
+            params.append(now - max_age)
+        for term in _terms(location):
+            filters.append(
+                "(j.location LIKE ? OR EXISTS (SELECT 1 FROM job_queries q WHERE q.url = j.url AND q.location LIKE ?))"
+            )
+            params += [f"%{term}%", f"%{term}%"]
+        match = _match_expression(query)
+        if self.fts and match:
+            weights = ", ".join(str(w) for w in _BM25_WEIGHTS)
+            sql = (
+                "SELECT j.payload, j.first_seen, j.last_seen, j.cluster"
+                " FROM jobs_fts JOIN jobs j ON j.rowid = jobs_fts.rowid"
+                f" WHERE jobs_fts MATCH ?{''.join(' AND ' + f for f in filters)}"
+                f" ORDER BY bm25(jobs_fts, {weights}), j.last_seen DESC LIMIT ?"
+            )
+            params = [match] + params
+        else:
+            for term in _terms(query):
+                filters.append("(j.title || ' ' || j.company || ' ' || j.location || ' ' || j.snippet) LIKE ?")
+                params.append(f"%{term}%")
+            where = f" WHERE {' AND '.join(filters)}" if filters else ""
+            sql = (
+                f"SELECT j.payload, j.first_seen, j.last_seen, j.cluster FROM jobs j{where}"
+                " ORDER BY j.last_seen DESC LIMIT ?"
+            )
+        with self._lock:
+            rows = self._conn.execute(sql, params + [max_results * _OVERFETCH]).fetchall()
+        self._counters["searches"] += 1
+        return self._collapse(rows, max_results)
+
+    def prune(self, older_than: float) -> int:
+        """Drop postings (and query links) not seen for older_than seconds."""
+        horizon = self._clock() - older_than
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM job_queries WHERE last_seen < ?", (horizon,))
+            removed = self._conn.execute("DELETE FROM jobs WHERE last_seen < ?", (horizon,)).rowcount or 0
+        self._counters["pruned"] += removed
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            (jobs,) = self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()
+            (queries,) = self._conn.execute("SELECT COUNT(DISTINCT query || '|' || location) FROM job_queries").fetchone()
+        return {**self._counters, "jobs": jobs, "queries": queries, "fts": self.fts, "path": self.path}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_job_catalog: Optional[JobCatalog] = None
+_job_catalog_lock = threading.Lock()
+
+
+def get_job_catalog() -> Optional[JobCatalog]:
+    """Process-wide JobCatalog under CACHE_DIR; None when CATALOG_ENABLED=false."""
+    global _job_catalog
+    from model.utils.config import get_config
+    config = get_config()
+    if not config.CATALOG_ENABLED:
+        return None
+    with _job_catalog_lock:
+        if _job_catalog is None:
+            path = os.path.join(config.CACHE_DIR, "job_catalog.sqlite3") if config.CACHE_DIR else None
+            _job_catalog = JobCatalog(path, max_distance=config.NEAR_DUPLICATE_MAX_DISTANCE)
+        return _job_catalog
+
+
+def job_catalog_stats() -> Dict[str, Any]:
+    """Stats of the shared catalog without opening it."""
+    return _job_catalog.stats() if _job_catalog is not None else {}
+
+
+def close_job_catalog() -> None:
+    global _job_catalog
+    with _job_catalog_lock:
+        catalog, _job_catalog = _job_catalog, None
+    if catalog is not None:
+        catalog.close()
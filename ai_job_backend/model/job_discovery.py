@@ -1,32 +1,55 @@
 """
-Job discovery: fetch jobs from ZipRecruiter, DailyAIJobs.com, and AIWorkPortal.com.
+Job discovery: fetch jobs from ZipRecruiter, DailyAIJobs.com, and AIWorkPortal.com, plus
+new/changed postings on configured Greenhouse/Lever company boards (model.board_sync).
 Free scraping (no paid APIs); use SCRAPER_API_KEY for JS-rendered sites if needed.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
 import re
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional
-from urllib.parse import quote_plus, urljoin
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote_plus, unquote, urljoin
 
 import requests
-from bs4 import BeautifulSoup
+
+from model.board_sync import discover_boards
+from model.discovery_sources import TIMEOUT, DiscoverySource, discovery_sources, register_source
+from model.html_backends import ParserBackend, parse_document
+from model.job_catalog import get_job_catalog
+from model.parse_pool import get_parse_pool
+from model.seen_urls import get_seen_urls
+from model.utils.cache import LRUCache, SingleFlight
+from model.utils.fetch import conditional_headers, read_html, response_validators
+from model.utils.simhash import SimHashIndex, job_simhash, merge_alternate_urls
+from model.utils.urls import canonical_job_url
 
 logger = logging.getLogger(__name__)
 
 # --- ZipRecruiter ---
 ZIPRECRUITER_SEARCH_BASE = "https://www.ziprecruiter.com/jobs-search"
 ZIPRECRUITER_BASE = "https://www.ziprecruiter.com"
+ZIPRECRUITER_CARD_LINKS = 'a[href*="/job/"], a[href*="/jobs/"], a[data-job-id]'
+# Posting links name the employer: /c/<Company-Name>/Job/<title>/...
+ZIPRECRUITER_COMPANY_RE = re.compile(r"/c/([^/?#]+)/Job/", re.I)
 
 # --- Daily AI Jobs (dailyaijobs.com) ---
 DAILYAIJOBS_BASE = "https://www.dailyaijobs.com"
 DAILYAIJOBS_JOBS_PATH = "/"  # homepage and JS-loaded listings
+# Job links: /job/..., /jobs/..., or links with job-like paths
+DAILYAIJOBS_CARD_LINKS = 'a[href*="/job"], a[href*="/jobs/"], a[href*="/role"], a[href*="/listing"]'
 
 # --- AI Work Portal (aiworkportal.com) ---
 AIWORKPORTAL_BASE = "https://aiworkportal.com"
 AIWORKPORTAL_JOBS_PATH = "/jobs"
+AIWORKPORTAL_CARD_LINKS = 'a[href*="/job/"]'
+AIWORKPORTAL_COMPANY = '.company, [class*="company"]'
 
 # Cap query/location length so the ZipRecruiter URL (and thus ScraperAPI request) stays under
 # server URI limits. Long URLs cause ScraperAPI 500 and job boards don't support huge search strings.
@@ -37,36 +60,25 @@ MAX_LOCATION_LEN = 60
 MAX_JOB_AGE_DAYS = 7
 
 
+# Every posting-age phrase in one pattern: "5 hours ago", "3 days ago", "1 week ago", "2 months ago", "today"
+_POSTED_AGE_RE = re.compile(r"(\d+)\s*(hour|day|week|month)s?\s*ago|today|just now")
+_AGE_UNIT_DAYS = {"hour": 0, "day": 1, "week": 7, "month": 30}
+
+
 def _parse_posted_days_ago(text: str) -> Optional[int]:
     """
-    Parse "posted X days ago" / "1 week ago" / "X hours ago" from card text.
-    Returns approximate days ago, or None if not found / unknown.
+    Parse "posted X days ago" / "1 week ago" / "X hours ago" from card text (one scan).
+    Returns approximate days ago (the most recent age mentioned), or None if not found / unknown.
     """
     if not text:
         return None
-    text = text.lower().strip()
-    # "X hours ago" -> 0 days (today)
-    m = re.search(r"(\d+)\s*hours?\s*ago", text)
-    if m:
-        return 0
-    if "today" in text or "just now" in text:
-        return 0
-    # "X days ago"
-    m = re.search(r"(\d+)\s*days?\s*ago", text)
-    if m:
-        return min(int(m.group(1)), 999)
-    # "1 week ago" -> 7
-    if re.search(r"1\s*week\s*ago", text):
-        return 7
-    # "X weeks ago"
-    m = re.search(r"(\d+)\s*weeks?\s*ago", text)
-    if m:
-        return int(m.group(1)) * 7
-    # "1 month ago" or "X months ago"
-    m = re.search(r"(\d+)\s*months?\s*ago", text)
-    if m:
-        return int(m.group(1)) * 30
-    return None
+    days = None
+    for m in _POSTED_AGE_RE.finditer(text.lower()):
+        n = 0 if m.group(2) is None else min(int(m.group(1)), 999) * _AGE_UNIT_DAYS[m.group(2)]
+        if n == 0:
+            return 0
+        days = n if days is None else min(days, n)
+    return days
 
 
 def _make_session() -> requests.Session:
@@ -79,16 +91,28 @@ def _make_session() -> requests.Session:
     return s
 
 
-def _fetch_html(
+def _read_page(response: requests.Response, url: str) -> str:
+    """Streamed body, capped at SCRAPE_MAX_BYTES with scripts/styles stripped (non-HTML raises)."""
+    from model.utils.config import get_config
+    config = get_config()
+    html, stats = read_html(response, config.SCRAPE_MAX_BYTES, strip=config.SCRAPE_STRIP_SCRIPTS)
+    if stats["truncated"]:
+        logger.warning("Listing page %s capped at %d bytes", url[:80], stats["bytes_downloaded"])
+    return html
+
+
+def _fetch_page(
     url: str,
     session: Optional[requests.Session] = None,
     use_js_render: bool = False,
     instruction_set: Optional[List[Dict[str, Any]]] = None,
     timeout: int = 60,
-) -> str:
+    validators: Optional[Dict[str, str]] = None,
+) -> Tuple[str, Dict[str, str], bool]:
     """
-    Fetch HTML for a URL. If SCRAPER_API_KEY is set, proxy through ScraperAPI.
-    instruction_set: optional ScraperAPI render instructions (e.g. [{"type":"wait","value":10}]).
+    Fetch a page. Returns (html, validators, not_modified).
+    validators (ETag / Last-Modified) are sent as a conditional GET on direct fetches;
+    ScraperAPI renders are always full responses.
     """
     sess = session or _make_session()
     scraper_key = os.getenv("SCRAPER_API_KEY")
@@ -103,19 +127,162 @@ def _fetch_html(
             headers = {}
             if instruction_set and use_js_render:
                 headers["x-sapi-instruction_set"] = json.dumps(instruction_set)
-            r = sess.get(api_url, timeout=timeout, headers=headers or None)
-            r.raise_for_status()
-            return r.text
+            with sess.get(api_url, timeout=timeout, headers=headers or None, stream=True) as r:
+                r.raise_for_status()
+                return _read_page(r, url), {}, False
         except Exception as e:
             logger.warning("ScraperAPI fetch failed for %s: %s", url[:80], e)
-            return ""
+            return "", {}, False
     try:
-        r = sess.get(url, timeout=min(20, timeout))
-        r.raise_for_status()
-        return r.text
+        with sess.get(url, timeout=min(20, timeout), headers=conditional_headers(validators) or None, stream=True) as r:
+            if r.status_code == 304 and validators:
+                return "", dict(validators), True
+            r.raise_for_status()
+            return _read_page(r, url), response_validators(r.headers), False
     except Exception as e:
         logger.warning("Direct fetch failed for %s: %s", url[:80], e)
-        return ""
+        return "", {}, False
+
+
+def _fetch_html(
+    url: str,
+    session: Optional[requests.Session] = None,
+    use_js_render: bool = False,
+    instruction_set: Optional[List[Dict[str, Any]]] = None,
+    timeout: int = 60,
+) -> str:
+    """
+    Fetch HTML for a URL. If SCRAPER_API_KEY is set, proxy through ScraperAPI.
+    instruction_set: optional ScraperAPI render instructions (e.g. [{"type":"wait","value":10}]).
+    """
+    html, _, _ = _fetch_page(
+        url, session=session, use_js_render=use_js_render,
+        instruction_set=instruction_set, timeout=timeout,
+    )
+    return html
+
+
+# Per-page validators + parsed card list. A 304 (or a byte-identical body) reuses the
+# cards without re-downloading / re-parsing on periodic re-discovery.
+_page_cards = LRUCache(max_entries=128)
+_page_card_counters = {"not_modified": 0, "unchanged_body": 0, "parsed": 0}
+
+
+def _run_card_parser(parser: str, html: str) -> List[Dict[str, Any]]:
+    """CARD_PARSERS[parser](html), in the parse worker pool when enabled."""
+    pool = get_parse_pool()
+    if pool is not None:
+        return pool.parse_cards(parser, html)
+    return CARD_PARSERS[parser](html)
+
+
+def _fetch_cards(
+    url: str,
+    parser: str,
+    session: Optional[requests.Session] = None,
+    **fetch_kwargs: Any,
+) -> Optional[List[Dict[str, Any]]]:
+    """Fetch url and parse job cards with CARD_PARSERS[parser]. None when the page could not be fetched."""
+    cached = _page_cards.get(url)
+    html, validators, not_modified = _fetch_page(
+        url, session=session, validators=(cached or {}).get("validators"), **fetch_kwargs
+    )
+    if not_modified and cached:
+        _page_card_counters["not_modified"] += 1
+        return [dict(c) for c in cached["cards"]]
+    if not html:
+        return None
+    digest = hashlib.sha1(html.encode("utf-8", "replace")).hexdigest()
+    if cached and cached.get("digest") == digest:
+        _page_card_counters["unchanged_body"] += 1
+        cards = cached["cards"]
+    else:
+        _page_card_counters["parsed"] += 1
+        cards = _run_card_parser(parser, html)
+    _page_cards.set(url, {"validators": validators, "digest": digest, "cards": cards})
+    return [dict(c) for c in cards]
+
+
+def page_cache_stats() -> Dict[str, Any]:
+    """
+    Counters for conditional re-discovery (304s, unchanged bodies, full parses), coalesced
+    searches and the discovery result cache.
+    """
+    return {
+        **_page_card_counters,
+        "pages": _page_cards.stats(),
+        "singleflight": _discover_flight.stats(),
+        "results": {**_result_counters, **_discovery_results.stats(), "refreshing": len(_refreshing)},
+    }
+
+
+class _CardTexts:
+    """
+    Card text per result link on one parsed page: the text of the nearest ancestor (up to
+    5 levels) that mentions a posted-date marker, else of the furthest one tried. Links
+    share ancestors (the card, then list / page containers), so each ancestor's text is
+    extracted and checked once per page instead of once per link.
+    """
+
+    MAX_DEPTH = 5
+    MAX_CHARS = 500
+
+    def __init__(self, backend: ParserBackend, markers: Tuple[str, ...] = ("ago",)):
+        self.backend = backend
+        self.markers = markers
+        # id(node) -> (node, text, has marker); the node is kept so its id stays unique
+        self._seen: Dict[int, Tuple[Any, str, bool]] = {}
+
+    def _ancestor(self, node: Any) -> Tuple[str, bool]:
+        entry = self._seen.get(id(node))
+        if entry is None:
+            text = self.backend.text(node)[:self.MAX_CHARS]
+            lowered = text.lower()
+            entry = (node, text, any(m in lowered for m in self.markers))
+            self._seen[id(node)] = entry
+        return entry[1], entry[2]
+
+    def __call__(self, link: Any) -> str:
+        card_text = ""
+        parent = self.backend.parent(link)
+        for _ in range(self.MAX_DEPTH):
+            if parent is None:
+                break
+            card_text, has_marker = self._ancestor(parent)
+            if has_marker:
+                break
+            parent = self.backend.parent(parent)
+        return card_text
+
+
+def _parse_ziprecruiter_cards(html: str) -> List[Dict[str, Any]]:
+    """Job cards from a ZipRecruiter search results page (recent jobs only)."""
+    jobs: List[Dict[str, Any]] = []
+    backend, doc = parse_document(html, soup_features="html.parser")
+    card_text_of = _CardTexts(backend)
+    seen_urls: set = set()
+    for a in backend.select(doc, backend.compiled(ZIPRECRUITER_CARD_LINKS)):
+        href = backend.attr(a, "href") or ""
+        if not href.startswith("http"):
+            href = urljoin("https://www.ziprecruiter.com", href)
+        key = canonical_job_url(href)
+        if key in seen_urls:  # same posting linked twice, or with another tracking string
+            continue
+        seen_urls.add(key)
+        card_text = card_text_of(a)
+        posted_days = _parse_posted_days_ago(card_text)
+        if posted_days is not None and posted_days > MAX_JOB_AGE_DAYS:
+            continue
+        title = (backend.text(a, separator="") or "Job")[:200]
+        if len(title) < 2:
+            continue
+        m = ZIPRECRUITER_COMPANY_RE.search(href)
+        company = unquote(m.group(1)).replace("-", " ").strip() if m else ""
+        job = {"title": title, "company": company, "url": href, "snippet": "", "source": "ziprecruiter"}
+        if posted_days is not None:
+            job["posted_days_ago"] = posted_days
+        jobs.append(job)
+    return jobs
 
 
 def discover_ziprecruiter(
@@ -129,7 +296,6 @@ def discover_ziprecruiter(
     Query and location are capped so the request URL stays within safe length (avoids ScraperAPI 500).
     Returns list of {title, company, url, snippet, source}.
     """
-    jobs: List[Dict[str, Any]] = []
     q = ((query or "").strip() or "jobs")[:MAX_QUERY_LEN]
     loc = ((location or "").strip())[:MAX_LOCATION_LEN]
     params: Dict[str, str] = {"search": q}
@@ -137,38 +303,45 @@ def discover_ziprecruiter(
         params["location"] = loc
     url = ZIPRECRUITER_SEARCH_BASE + "?" + "&".join(f"{k}={quote_plus(v)}" for k, v in params.items())
     sess = session or _make_session()
-    html = _fetch_html(url, session=sess, use_js_render=True)
-    if not html:
+    jobs = _fetch_cards(url, "ziprecruiter", session=sess, use_js_render=True)
+    if jobs is None:
         logger.warning("ZipRecruiter discovery: no HTML. Set SCRAPER_API_KEY for JS sites.")
-        return jobs
-    soup = BeautifulSoup(html, "html.parser")
+        return []
+    return jobs[:max_results]
 
-    for a in soup.select('a[href*="/job/"], a[href*="/jobs/"], a[data-job-id]'):
-        if len(jobs) >= max_results:
-            break
-        href = a.get("href") or ""
+
+def _parse_dailyaijobs_cards(html: str) -> List[Dict[str, Any]]:
+    """Job cards from the dailyaijobs.com listing page (recent jobs only, deduped by URL)."""
+    jobs: List[Dict[str, Any]] = []
+    backend, doc = parse_document(html, soup_features="html.parser")
+    card_text_of = _CardTexts(backend, ("ago", "day"))
+    seen_urls: set = set()
+
+    for a in backend.select(doc, backend.compiled(DAILYAIJOBS_CARD_LINKS)):
+        href = (backend.attr(a, "href") or "").strip()
+        if not href or href in ("#", "/"):
+            continue
         if not href.startswith("http"):
-            href = urljoin("https://www.ziprecruiter.com", href)
-        card_text = ""
-        parent = a.parent
-        for _ in range(5):
-            if parent is None:
-                break
-            card_text = (parent.get_text(separator=" ", strip=True) or "")[:500]
-            if "ago" in card_text.lower():
-                break
-            parent = getattr(parent, "parent", None)
+            href = urljoin(DAILYAIJOBS_BASE, href)
+        if "/jobs" in href.rstrip("/") and href.rstrip("/").endswith("/jobs"):
+            continue
+        key = canonical_job_url(href)
+        if key in seen_urls:
+            continue
+        # Get parent card text for posted date
+        card_text = card_text_of(a)
         posted_days = _parse_posted_days_ago(card_text)
         if posted_days is not None and posted_days > MAX_JOB_AGE_DAYS:
             continue
-        title = (a.get_text(strip=True) or "Job")[:200]
-        if len(title) < 2:
+        seen_urls.add(key)
+        title = (backend.text(a, separator="") or "AI/ML Job")[:200]
+        if len(title) < 3:
             continue
-        job = {"title": title, "company": "", "url": href, "snippet": "", "source": "ziprecruiter"}
+        job = {"title": title, "company": "", "url": href, "snippet": "", "source": "dailyaijobs"}
         if posted_days is not None:
             job["posted_days_ago"] = posted_days
         jobs.append(job)
-    return jobs[:max_results]
+    return jobs
 
 
 def discover_dailyaijobs(
@@ -181,58 +354,69 @@ def discover_dailyaijobs(
     Site is JS-heavy; use SCRAPER_API_KEY with render=true for best results.
     Returns list of {title, company, url, snippet, source}.
     """
-    jobs: List[Dict[str, Any]] = []
     sess = session or _make_session()
     url = DAILYAIJOBS_BASE + DAILYAIJOBS_JOBS_PATH
     # Job list is loaded by JS after page load; short wait so it appears (ScraperAPI instruction set)
     instruction_set = [{"type": "wait", "value": 5}]
-    html = _fetch_html(
-        url, session=sess, use_js_render=True, instruction_set=instruction_set, timeout=45
+    jobs = _fetch_cards(
+        url, "dailyaijobs", session=sess,
+        use_js_render=True, instruction_set=instruction_set, timeout=45,
     )
-    if not html:
+    if jobs is None:
         logger.warning("DailyAIJobs: no HTML. Set SCRAPER_API_KEY for JS rendering.")
-        return jobs
+        return []
+    jobs = jobs[:max_results]
+    if jobs:
+        logger.info("DailyAIJobs returned %d jobs", len(jobs))
+    return jobs
 
-    soup = BeautifulSoup(html, "html.parser")
-    seen_urls: set = set()
 
-    # Job links: /job/..., /jobs/..., or links with job-like paths
-    for a in soup.select('a[href*="/job"], a[href*="/jobs/"], a[href*="/role"], a[href*="/listing"]'):
-        if len(jobs) >= max_results:
-            break
-        href = (a.get("href") or "").strip()
-        if not href or href in ("#", "/"):
-            continue
+def _parse_aiworkportal_cards(html: str) -> List[Dict[str, Any]]:
+    """Job cards from an aiworkportal.com page (recent jobs only, deduped by URL)."""
+    jobs: List[Dict[str, Any]] = []
+    backend, doc = parse_document(html, soup_features="html.parser")
+    card_text_of = _CardTexts(backend)
+    seen_urls: set = set()
+    # Job detail links: /job/slug-id (not /jobs). Get card text for "X days ago" / "1 week ago"
+    for a in backend.select(doc, backend.compiled(AIWORKPORTAL_CARD_LINKS)):
+        href = (backend.attr(a, "href") or "").strip()
         if not href.startswith("http"):
-            href = urljoin(DAILYAIJOBS_BASE, href)
-        if "/jobs" in href.rstrip("/") and href.rstrip("/").endswith("/jobs"):
+            href = urljoin(AIWORKPORTAL_BASE, href)
+        if not re.match(r"^https?://[^/]+/job/[^/]+/?$", href):
             continue
-        if href in seen_urls:
+        key = canonical_job_url(href)
+        if key in seen_urls:
             continue
-        # Get parent card text for posted date
-        card_text = ""
-        parent = a.parent
-        for _ in range(5):
-            if parent is None:
-                break
-            card_text = (parent.get_text(separator=" ", strip=True) or "")[:500]
-            if "ago" in card_text.lower() or "day" in card_text.lower():
-                break
-            parent = getattr(parent, "parent", None)
+        # Get parent card text to parse posted date (e.g. "1 week ago")
+        card_text = card_text_of(a)
         posted_days = _parse_posted_days_ago(card_text)
         if posted_days is not None and posted_days > MAX_JOB_AGE_DAYS:
             continue
-        seen_urls.add(href)
-        title = (a.get_text(strip=True) or "AI/ML Job")[:200]
+        seen_urls.add(key)
+        title = (backend.text(a, separator="") or "AI/ML Job").strip()[:200]
         if len(title) < 3:
-            continue
-        job = {"title": title, "company": "", "url": href, "snippet": "", "source": "dailyaijobs"}
+            title = "AI/ML Job"
+        parent = backend.parent(a)
+        company_node = backend.first(parent, backend.compiled(AIWORKPORTAL_COMPANY)) if parent is not None else None
+        job = {
+            "title": title,
+            "company": backend.text(company_node).strip()[:200] if company_node is not None else "",
+            "url": href,
+            "snippet": "",
+            "source": "aiworkportal",
+        }
         if posted_days is not None:
             job["posted_days_ago"] = posted_days
         jobs.append(job)
-    if jobs:
-        logger.info("DailyAIJobs returned %d jobs", len(jobs))
-    return jobs[:max_results]
+    return jobs
+
+
+# Search-page card parsers by name: _fetch_cards callers and parse pool workers look them up here
+CARD_PARSERS: Dict[str, Callable[[str], List[Dict[str, Any]]]] = {
+    "ziprecruiter": _parse_ziprecruiter_cards,
+    "dailyaijobs": _parse_dailyaijobs_cards,
+    "aiworkportal": _parse_aiworkportal_cards,
+}
 
 
 def discover_aiworkportal(
@@ -253,45 +437,14 @@ def discover_aiworkportal(
         if len(jobs) >= max_results:
             break
         url = AIWORKPORTAL_BASE + page_path
-        html = _fetch_html(url, session=sess, use_js_render=True, timeout=45)
-        if not html:
-            continue
-        soup = BeautifulSoup(html, "html.parser")
-        # Job detail links: /job/slug-id (not /jobs). Get card text for "X days ago" / "1 week ago"
-        for a in soup.select('a[href*="/job/"]'):
+        cards = _fetch_cards(url, "aiworkportal", session=sess, use_js_render=True, timeout=45)
+        for job in cards or []:
             if len(jobs) >= max_results:
                 break
-            href = (a.get("href") or "").strip()
-            if not href.startswith("http"):
-                href = urljoin(AIWORKPORTAL_BASE, href)
-            if not re.match(r"^https?://[^/]+/job/[^/]+/?$", href) or href in seen_urls:
-                continue
-            # Get parent card text to parse posted date (e.g. "1 week ago")
-            card_text = ""
-            parent = a.parent
-            for _ in range(5):
-                if parent is None:
-                    break
-                card_text = (parent.get_text(separator=" ", strip=True) or "")[:500]
-                if "ago" in card_text.lower():
-                    break
-                parent = getattr(parent, "parent", None)
-            posted_days = _parse_posted_days_ago(card_text)
-            if posted_days is not None and posted_days > MAX_JOB_AGE_DAYS:
+            key = canonical_job_url(job["url"])
+            if key in seen_urls:
                 continue
-            seen_urls.add(href)
-            title = (a.get_text(strip=True) or "AI/ML Job").strip()[:200]
-            if len(title) < 3:
-                title = "AI/ML Job"
-            job = {
-                "title": title,
-                "company": "",
-                "url": href,
-                "snippet": "",
-                "source": "aiworkportal",
-            }
-            if posted_days is not None:
-                job["posted_days_ago"] = posted_days
+            seen_urls.add(key)
             jobs.append(job)
 
     if jobs:
@@ -299,84 +452,461 @@ def discover_aiworkportal(
     return jobs[:max_results]
 
 
+# Built-in sources, merge priority first: company boards (canonical postings, public JSON APIs),
+# then the scraped boards. Render credits are per attempt (ScraperAPI render=true: 10 per page).
+register_source(DiscoverySource(
+    "boards", "Company boards",
+    lambda query, location, max_results, session: discover_boards(query=query, max_results=max_results),
+    concurrency=2, timeout=30,
+))
+register_source(DiscoverySource(
+    "ziprecruiter", "ZipRecruiter",
+    lambda query, location, max_results, session: discover_ziprecruiter(
+        query=query, location=location, max_results=max_results, session=session,
+    ),
+    concurrency=2, timeout=60, retries=1, retry_empty=True, cost=10,
+))
+register_source(DiscoverySource(
+    "dailyaijobs", "DailyAIJobs",
+    lambda query, location, max_results, session: discover_dailyaijobs(
+        query=query, max_results=max_results, session=session,
+    ),
+    concurrency=2, timeout=50, retries=1, retry_empty=True, cost=10,
+))
+register_source(DiscoverySource(
+    "aiworkportal", "AIWorkPortal",
+    lambda query, location, max_results, session: discover_aiworkportal(
+        query=query, max_results=max_results, session=session,
+    ),
+    concurrency=2, timeout=60, cost=20,
+))
+
+
+# Concurrent identical searches (same query/location and result cap) share one fan-out to the boards
+_discover_flight = SingleFlight()
+
+# Discovery results by normalized (query, location): fresh for DISCOVERY_CACHE_TTL seconds, then
+# served stale for DISCOVERY_CACHE_STALE_TTL more while a background search refreshes the entry
+_discovery_results = LRUCache(max_entries=128)
+_result_counters = {"fresh_hits": 0, "stale_hits": 0, "refreshes": 0, "refresh_failures": 0}
+_refreshing: set = set()
+_refresh_lock = threading.Lock()
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _normalize(text: str) -> str:
+    return " ".join((text or "").lower().split())
+
+
+def _copy_result(result: Dict[str, Any], max_results: Optional[int] = None) -> Dict[str, Any]:
+    """Caller-owned copy (own job dicts), optionally cut to max_results jobs."""
+    return {**result, "jobs": [dict(j) for j in result["jobs"][:max_results]]}
+
+
+def _store_result(query: str, location: str, max_results: int, result: Dict[str, Any]) -> None:
+    """
+    Cache a live result with jobs (an empty fan-out, all sources failed, is retried next time).
+    A partial one (a source failed or timed out) is kept only DISCOVERY_PARTIAL_CACHE_TTL
+    seconds and never served stale, so the missing source's jobs are soon searched again.
+    """
+    from model.utils.config import get_config
+    if not result.get("jobs") or (result.get("partial") and get_config().DISCOVERY_PARTIAL_CACHE_TTL <= 0):
+        return
+    _discovery_results.set(
+        (_normalize(query), _normalize(location)),
+        {"result": result, "max_results": max_results, "stored_at": time.time(), "partial": bool(result.get("partial"))},
+    )
+
+
+def _search(
+    query: str, location: str, max_results: int, deadline: Optional[float] = None,
+) -> Tuple[Dict[str, Any], bool]:
+    """Live discovery through the single-flight, cached on success. (result, joined another caller)."""
+    key = (_normalize(query), _normalize(location), max_results)
+    result, shared = _discover_flight.do(key, lambda: _discover_jobs(query, location, max_results, deadline))
+    if not shared:
+        _store_result(query, location, max_results, result)
+    return result, shared
+
+
+def _refresh_in_background(cache_key: Tuple[str, str], query: str, location: str, max_results: int) -> None:
+    global _refresh_executor
+    with _refresh_lock:
+        if cache_key in _refreshing:
+            return
+        _refreshing.add(cache_key)
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="discovery-refresh")
+    _result_counters["refreshes"] += 1
+
+    def _run():
+        try:
+            result, _ = _search(query, location, max_results)
+            if not result.get("jobs"):
+                _result_counters["refresh_failures"] += 1
+        except Exception as e:
+            _result_counters["refresh_failures"] += 1
+            logger.warning("Discovery refresh failed for %r / %r: %s", query, location, e)
+        finally:
+            with _refresh_lock:
+                _refreshing.discard(cache_key)
+
+    _refresh_executor.submit(_run)
+
+
+def _cached_discovery(query: str, location: str, max_results: int) -> Optional[Dict[str, Any]]:
+    """Cached result for (query, location) covering max_results jobs; refresh scheduled when stale."""
+    from model.utils.config import get_config
+    config = get_config()
+    cache_key = (_normalize(query), _normalize(location))
+    entry = _discovery_results.get(cache_key)
+    if entry is None or entry["max_results"] < max_results:
+        return None
+    age = time.time() - entry["stored_at"]
+    if entry.get("partial"):
+        fresh_ttl, stale_ttl = min(config.DISCOVERY_PARTIAL_CACHE_TTL, config.DISCOVERY_CACHE_TTL), 0
+    else:
+        fresh_ttl, stale_ttl = config.DISCOVERY_CACHE_TTL, config.DISCOVERY_CACHE_STALE_TTL
+    if age < fresh_ttl:
+        state = "fresh"
+    elif age < fresh_ttl + stale_ttl:
+        state = "stale"
+        _refresh_in_background(cache_key, query, location, entry["max_results"])
+    else:
+        _discovery_results.pop(cache_key)
+        return None
+    _result_counters[f"{state}_hits"] += 1
+    logger.info("Discovery cache %s hit (%.0fs old) for %r / %r", state, age, query, location)
+    result = _copy_result(entry["result"], max_results)
+    result.update(cached=True, cache_state=state, cache_age_seconds=round(age, 1))
+    return result
+
+
 def discover_jobs(
     query: str,
     location: str = "",
     max_results: int = 60,
+    use_cache: bool = True,
+    deadline: Optional[float] = None,
+    new_only: bool = False,
 ) -> Dict[str, Any]:
     """
     Discover jobs from ZipRecruiter, DailyAIJobs.com, and AIWorkPortal.com.
-    - All three sources are fetched in parallel (ZipRecruiter, DailyAIJobs, AIWorkPortal at once).
+    - All sources are fetched in parallel (ZipRecruiter, DailyAIJobs, AIWorkPortal at once).
+    - Company boards in DISCOVERY_BOARDS add the postings that are new/changed since their last sync.
     - Jobs older than MAX_JOB_AGE_DAYS (1 week) are excluded so you get enough recent jobs for matching.
-    Returns { success, jobs, query, location, sources }.
+    - Jobs are deduped by canonical URL, and near-duplicates (same title / company / snippet
+      across sources, by SimHash) collapse into one job listing the others in alternate_urls.
+    - seen_before marks postings an earlier discovery already
+      returned (persistent seen-URL filter) and new_jobs counts the rest. new_only=True
+      returns only those new postings, from a live search (a cached result's flags are as
+      of when it was searched); without the filter (SEEN_URLS_ENABLED=false) it changes nothing.
+    - Sources come from the registry (model.discovery_sources), each with its own concurrency,
+      timeout, retries and render-credit cost. The search returns whatever sources finished
+      within deadline seconds (DISCOVERY_DEADLINE by default): source_status gives each source's
+      status (ok / error / timeout), latency_ms, attempts, credits, found and kept (after
+      dedupe) counts, and partial is true when any source failed or timed out (partial results
+      are cached for DISCOVERY_PARTIAL_CACHE_TTL seconds only).
+    - A search already in flight for the same (query, location) is joined instead of repeated.
+    - Results are cached per normalized (query, location): fresh hits are returned directly,
+      stale ones immediately while a background search refreshes them (cached, cache_state and
+      cache_age_seconds are set on cached responses). use_cache=False forces a live search.
+    Returns { success, jobs, query, location, sources, new_jobs, source_status, partial }.
     """
-    sess = _make_session()
-    all_jobs: List[Dict[str, Any]] = []
-    seen_urls: set = set()
+    from model.utils.config import get_config
+    if use_cache and not new_only and get_config().DISCOVERY_CACHE_TTL > 0:
+        cached = _cached_discovery(query, location, max_results)
+        if cached is not None:
+            return cached
+    result, shared = _search(query, location, max_results, deadline)
+    if shared:
+        logger.info("Coalesced discovery for %r / %r with one already in flight", query, location)
+    if shared or new_only:
+        result = _copy_result(result)  # the cached / shared result stays whole
+    if new_only:
+        result["jobs"] = [j for j in result["jobs"] if not j.get("seen_before")]
+    return result
+
+
+def discover_jobs_indexed(
+    query: str,
+    location: str = "",
+    max_results: int = 60,
+    source: Optional[str] = None,
+    posted_days_ago: Optional[int] = None,
+    new_only: bool = False,
+) -> Dict[str, Any]:
+    """
+    Discovery answered from the local job catalog's full-text index when it holds enough
+    fresh matches (BM25-ranked, at least min(max_results, DISCOVERY_INDEX_MIN_RESULTS)
+    postings seen within CATALOG_MAX_AGE); otherwise discover_jobs, whose live results
+    are added to the index. source / posted_days_ago filter either way (undated postings fail
+    a posted_days_ago filter, as in JobCatalog.search).
+    Returns discover_jobs' shape plus indexed (True when served from the index); an index
+    answer reports the catalog as its one source in source_status. new_only skips the index
+    (its postings were all returned before) for discover_jobs(new_only=True).
+    """
+    from model.utils.config import get_config
+    config = get_config()
+    catalog = get_job_catalog()
+    if catalog is not None and not new_only:
+        started = time.monotonic()
+        jobs = catalog.search(
+            query, "" if location == "(any)" else location, max_results=max_results,
+            source=source, posted_days_ago=posted_days_ago, max_age=config.CATALOG_MAX_AGE,
+        )
+        if jobs and len(jobs) >= min(max_results, config.DISCOVERY_INDEX_MIN_RESULTS):
+            sources = list(dict.fromkeys(j["source"] for j in jobs if j.get("source")))
+            seen = get_seen_urls()
+            return {
+                "success": True, "jobs": jobs, "query": query, "location": location or "(any)",
+                "source": sources[0] if sources else "none", "sources": sources,
+                "new_jobs": seen.mark_jobs(jobs) if seen is not None else None,
+                "source_status": {"catalog": {
+                    "status": "ok", "attempts": 1, "found": len(jobs), "credits": 0, "kept": len(jobs),
+                    "latency_ms": round((time.monotonic() - started) * 1000),
+                }},
+                "partial": False, "indexed": True,
+            }
+    result = discover_jobs(query=query, location=location, max_results=max_results, new_only=new_only)
+    if catalog is not None and result.get("jobs") and not result.get("cached"):
+        catalog.upsert(result["jobs"], query, location)
+    if source or posted_days_ago is not None:
+        oldest = (datetime.now(timezone.utc).date() - timedelta(days=posted_days_ago or 0)).isoformat()
+        result = {**result, "jobs": [  # never filter the cached result itself
+            j for j in result["jobs"]
+            if (not source or j.get("source") == source)
+            and (posted_days_ago is None or (j.get("posted_at") or "") >= oldest)
+        ]}
+    return {**result, "indexed": False}
+
+
+def _per_source(max_results: int) -> int:
     # Request extra per source so after 1-week recency filter we still have enough for matching
-    per_source = min(50, max(35, max_results + 20))
+    return min(50, max(35, max_results + 20))
 
-    # Run all three sources in parallel (total time ≈ slowest source, not sum)
-    zip_jobs: List[Dict[str, Any]] = []
-    daily_jobs: List[Dict[str, Any]] = []
-    portal_jobs: List[Dict[str, Any]] = []
 
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        fut_zip = executor.submit(
-            discover_ziprecruiter,
-            query=query, location=location, max_results=per_source, session=sess,
-        )
-        fut_daily = executor.submit(
-            discover_dailyaijobs,
-            query=query, max_results=per_source, session=sess,
-        )
-        fut_portal = executor.submit(
-            discover_aiworkportal,
-            query=query, max_results=per_source, session=sess,
-        )
-        try:
-            zip_jobs = fut_zip.result()
-        except Exception as e:
-            logger.warning("ZipRecruiter discovery failed: %s", e)
-        try:
-            daily_jobs = fut_daily.result()
-        except Exception as e:
-            logger.warning("DailyAIJobs discovery failed: %s", e)
-        try:
-            portal_jobs = fut_portal.result()
-        except Exception as e:
-            logger.warning("AIWorkPortal discovery failed: %s", e)
-
-    for j in zip_jobs + daily_jobs + portal_jobs:
-        u = (j.get("url") or "").strip()
-        if u and u not in seen_urls:
-            seen_urls.add(u)
-            all_jobs.append(j)
-
-    # Keep only jobs posted within MAX_JOB_AGE_DAYS (drop old / no-longer-accepting)
-    filtered = []
-    for j in all_jobs:
-        days = j.get("posted_days_ago")
-        if days is not None and days > MAX_JOB_AGE_DAYS:
-            continue
-        filtered.append(j)
-    # Remove internal key from response
-    result_list = []
-    for j in filtered[:max_results]:
-        j = {k: v for k, v in j.items() if k != "posted_days_ago"}
-        result_list.append(j)
-
-    sources_used = list({j.get("source") for j in result_list if j.get("source")})
+def _status_entry(record: Dict[str, Any], kept: int) -> Dict[str, Any]:
+    """A source's run record as reported in results: jobs replaced by kept (after dedupe)."""
+    return {**{k: v for k, v in record.items() if k not in ("source", "jobs")}, "kept": kept}
+
+
+def _timed_out(started: float) -> Dict[str, Any]:
+    """Status entry for a source a search stopped waiting for."""
+    return {
+        "status": TIMEOUT, "attempts": None, "found": 0, "credits": None, "kept": 0,
+        "latency_ms": round((time.monotonic() - started) * 1000), "error": "deadline passed",
+    }
+
+
+class _JobMerger:
+    """
+    Merges source batches into one discovery result as they arrive: canonical-URL dedupe,
+    MAX_JOB_AGE_DAYS filter, near-duplicate folding (a later copy's URL goes to the kept job's
+    alternate_urls), the max_results cap, posted_at and seen_before. add() returns the jobs
+    it kept from the batch; alternates_added lists earlier-kept jobs that gained alternate URLs.
+    """
+
+    def __init__(self, max_results: int):
+        from model.utils.config import get_config
+        max_distance = get_config().NEAR_DUPLICATE_MAX_DISTANCE
+        self.max_results = max_results
+        self.jobs: List[Dict[str, Any]] = []
+        self.collapsed = 0
+        self.alternates_added: List[Dict[str, Any]] = []
+        self._urls: set = set()
+        self._near = SimHashIndex(max_distance) if max_distance > 0 else None
+        self._seen = get_seen_urls()
+        self.new_jobs: Optional[int] = 0 if self._seen is not None else None
+        self._today = datetime.now(timezone.utc).date()
+
+    @property
+    def full(self) -> bool:
+        return len(self.jobs) >= self.max_results
+
+    def add(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        kept: List[Dict[str, Any]] = []
+        self.alternates_added = []
+        for j in jobs:
+            # Dedupe across sources by canonical URL (tracking params / case / trailing slash ignored)
+            u = canonical_job_url(j.get("url") or "")
+            if not u or u in self._urls:
+                continue
+            self._urls.add(u)
+            # Keep only jobs posted within MAX_JOB_AGE_DAYS (drop old / no-longer-accepting)
+            days = j.get("posted_days_ago")
+            if days is not None and days > MAX_JOB_AGE_DAYS:
+                continue
+            # One posting per cross-source near-duplicate cluster (same role listed on several boards)
+            fingerprint = job_simhash(j) if self._near is not None else None
+            if fingerprint is not None:
+                matches = self._near.near(fingerprint)
+                if matches:
+                    rep = self.jobs[matches[0]]
+                    self.collapsed += 1
+                    if merge_alternate_urls(rep, j) and not any(rep is k for k in kept):
+                        self.alternates_added.append(rep)
+                    continue
+            if self.full:
+                continue
+            if fingerprint is not None:
+                self._near.add(len(self.jobs), fingerprint)
+            # Replace the internal relative age with an absolute date (stays correct in cached / indexed copies)
+            j = {k: v for k, v in j.items() if k != "posted_days_ago"}
+            if days is not None:
+                j["posted_at"] = (self._today - timedelta(days=days)).isoformat()
+            self.jobs.append(j)
+            kept.append(j)
+        # Flag postings no earlier discovery returned (persistent seen-URL filter)
+        if kept and self._seen is not None:
+            self.new_jobs += self._seen.mark_jobs(kept)
+        return kept
+
+    def result(self, query: str, location: str, source_status: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        sources_used = list({j.get("source") for j in self.jobs if j.get("source")})
+        return {
+            "success": True,
+            "jobs": self.jobs,
+            "query": query,
+            "location": location or "(any)",
+            "source": sources_used[0] if sources_used else "none",
+            "sources": sources_used,
+            "new_jobs": self.new_jobs,
+            "source_status": source_status,
+            "partial": any(entry["status"] != "ok" for entry in source_status.values()),
+        }
+
+
+def _discover_jobs(query: str, location: str, max_results: int, deadline: Optional[float] = None) -> Dict[str, Any]:
+    from model.utils.config import get_config
+    if deadline is None:
+        deadline = get_config().DISCOVERY_DEADLINE
+    sources = discovery_sources()
+    sess = _make_session()
+    merger = _JobMerger(max_results)
+    started = time.monotonic()
+    source_status: Dict[str, Dict[str, Any]] = {}
+
+    # Run all sources in parallel (total time ≈ slowest source, not sum), merge in priority order.
+    # Each is waited on until its own timeout or the overall deadline; late ones are left running.
+    executor = ThreadPoolExecutor(max_workers=max(1, len(sources)), thread_name_prefix="discovery")
+    try:
+        futures = []
+        for source in sources:
+            source_deadline = started + min(source.timeout, deadline)
+            futures.append((source, source_deadline, executor.submit(
+                source.run, query, location, _per_source(max_results), sess, source_deadline,
+            )))
+        for source, source_deadline, future in futures:
+            try:
+                record = future.result(timeout=max(0.0, source_deadline - time.monotonic()))
+            except FuturesTimeoutError:
+                logger.warning("%s discovery gave no result within %.0fs", source.label, source_deadline - started)
+                source_status[source.name] = _timed_out(started)
+                continue
+            source_status[source.name] = _status_entry(record, len(merger.add(record["jobs"])))
+    finally:
+        executor.shutdown(wait=False)
+
+    if merger.collapsed:
+        logger.info("Collapsed %d near-duplicate postings", merger.collapsed)
+    failed = [f"{name} {entry['status']}" for name, entry in source_status.items() if entry["status"] != "ok"]
+    if failed:
+        logger.warning("Partial discovery for %r / %r: %s", query, location, ", ".join(failed))
     logger.info(
-        "Discovery total: %d jobs after recency filter (ZipRecruiter=%d, DailyAIJobs=%d, AIWorkPortal=%d)",
-        len(result_list), len(zip_jobs), len(daily_jobs), len(portal_jobs),
+        "Discovery total: %d jobs after recency filter, %s new (%s)",
+        len(merger.jobs), "?" if merger.new_jobs is None else merger.new_jobs,
+        ", ".join(f"{source.label}={source_status[source.name]['found']}" for source in sources),
     )
+    return merger.result(query, location, source_status)
 
-    return {
-        "success": True,
-        "jobs": result_list,
-        "query": query,
-        "location": location or "(any)",
-        "source": sources_used[0] if sources_used else "none",
-        "sources": sources_used,
+
+async def discover_jobs_stream(
+    query: str,
+    location: str = "",
+    max_results: int = 60,
+    use_cache: bool = True,
+    deadline: Optional[float] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    discover_jobs as events, so a client can show results at the first source's latency:
+    {"event": "jobs", source, jobs, status, found, kept, attempts, latency_ms, elapsed_ms[, error]}
+    as each source finishes or times out, with only the jobs not already sent (same dedupe /
+    recency / near-duplicate rules, merged in completion order) and alternate_urls added to
+    earlier-sent jobs; then one {"event": "done", ...} carrying discover_jobs' summary fields
+    (no jobs), total and elapsed_ms. Sources still running once max_results jobs are sent are
+    abandoned (listed in done's pending).
+    A fresh or stale cached result is sent as one "cache" batch. Live results that were not
+    cut short are cached like discover_jobs' and added to the job catalog.
+    """
+    from model.utils.config import get_config
+    config = get_config()
+    if deadline is None:
+        deadline = config.DISCOVERY_DEADLINE
+    started = time.monotonic()
+
+    def _elapsed_ms() -> int:
+        return round((time.monotonic() - started) * 1000)
+
+    if use_cache and config.DISCOVERY_CACHE_TTL > 0:
+        cached = _cached_discovery(query, location, max_results)
+        if cached is not None:
+            jobs = cached.pop("jobs")
+            yield {"event": "jobs", "source": "cache", "jobs": jobs, "found": len(jobs), "elapsed_ms": _elapsed_ms()}
+            yield {"event": "done", **cached, "total": len(jobs), "pending": [], "elapsed_ms": _elapsed_ms()}
+            return
+
+    loop = asyncio.get_running_loop()
+    sources = discovery_sources()
+    sess = _make_session()
+    merger = _JobMerger(max_results)
+    source_status: Dict[str, Dict[str, Any]] = {}
+    executor = ThreadPoolExecutor(max_workers=max(1, len(sources)), thread_name_prefix="discovery-stream")
+    pending: Dict[asyncio.Future, Tuple[DiscoverySource, float]] = {}
+    for source in sources:
+        source_deadline = started + min(source.timeout, deadline)
+        future = loop.run_in_executor(
+            executor, source.run, query, location, _per_source(max_results), sess, source_deadline,
+        )
+        pending[future] = (source, source_deadline)
+    try:
+        while pending and not merger.full:
+            next_deadline = min(source_deadline for _, source_deadline in pending.values())
+            done, _ = await asyncio.wait(
+                pending, timeout=max(0.0, next_deadline - time.monotonic()), return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:  # the nearest source deadline passed: stop waiting for the late sources
+                done = {f for f, (_, d) in pending.items() if d <= time.monotonic()}
+            for future in done:
+                source, _ = pending.pop(future)
+                if future.done():
+                    record = future.result()
+                    kept = merger.add(record["jobs"])
+                    entry = _status_entry(record, len(kept))
+                else:
+                    future.cancel()
+                    logger.warning("%s discovery gave no result within the deadline", source.label)
+                    kept, entry = [], _timed_out(started)
+                source_status[source.name] = entry
+                event: Dict[str, Any] = {"event": "jobs", "source": source.name, "jobs": kept, **entry}
+                event["elapsed_ms"] = _elapsed_ms()
+                if merger.alternates_added:
+                    event["alternate_urls"] = {j["url"]: list(j["alternate_urls"]) for j in merger.alternates_added}
+                yield event
+    finally:
+        # Abandoned sources finish in their threads; their results are dropped
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+    result = merger.result(query, location, source_status)
+    if result["jobs"] and not pending:
+        _store_result(query, location, max_results, result)
+        catalog = get_job_catalog()
+        if catalog is not None:
+            await loop.run_in_executor(None, catalog.upsert, result["jobs"], query, location)
+    summary = {k: v for k, v in result.items() if k != "jobs"}
+    yield {
+        "event": "done", **summary, "total": len(result["jobs"]),
+        "pending": [source.name for source, _ in pending.values()], "elapsed_ms": _elapsed_ms(),
     }
@@ -1,11 +1,13 @@
 """
-Job matching flow: profile from preferences DB + jobs from discover (or DB)
-→ DeepSeek R1 ranks and explains. Used by API and SmolAgents.
+Job matching flow: profile from preferences DB + jobs from the local catalog (kept warm
+by the background crawler) or live discover → DeepSeek R1 ranks and explains.
+Used by API and SmolAgents.
 """
 
 import logging
 from typing import Any, Dict, List, Tuple
 
+from model.job_catalog import get_job_catalog
 from model.job_discovery import discover_jobs
 from model.job_ranker import rank_jobs_with_reasoning
 from model.profile_lookup import get_user_profile_from_db
@@ -52,16 +54,37 @@ def _discovery_query_and_location(profile: Dict[str, Any]) -> Tuple[str, str]:
     return query, location
 
 
+def _find_jobs(query: str, location: str, max_jobs: int) -> Tuple[List[Dict[str, Any]], Dict[str, Any], str]:
+    """
+    (jobs, discovery result, "catalog" | "live") for a search: fresh catalog postings
+    when the crawler (or an earlier live search) has covered it, else live discovery,
+    whose results are recorded in the catalog for next time.
+    """
+    from model.utils.config import get_config
+    catalog = get_job_catalog()
+    if catalog is not None:
+        jobs = catalog.lookup(query, location, max_results=max_jobs, max_age=get_config().CATALOG_MAX_AGE)
+        if jobs:
+            logger.info("Catalog hit: %d jobs for query=%r location=%r", len(jobs), query, location)
+            return jobs, {"query": query, "location": location or "(any)"}, "catalog"
+    result = discover_jobs(query=query, location=location, max_results=max_jobs)
+    jobs = result.get("jobs") or []
+    if catalog is not None and jobs:
+        catalog.upsert(jobs, query, location)
+    return jobs, result, "live"
+
+
 def get_candidate_jobs_for_user(
     user_id: str,
     max_jobs: int = 60,
 ) -> Dict[str, Any]:
     """
     Get user profile from DB (preferences: skills, experience, interests) and
-    fetch candidate jobs from discover (ZipRecruiter + DailyAIJobs + AIWorkPortal).
+    candidate jobs from the local job catalog, falling back to live discover
+    (ZipRecruiter + DailyAIJobs + AIWorkPortal) on a catalog miss.
 
     Returns:
-        {"profile": {...}, "jobs": [...], "query": "...", "location": "..."}
+        {"profile": {...}, "jobs": [...], "query": "...", "location": "...", "jobs_from": "catalog" | "live"}
     """
     profile = get_user_profile_from_db(user_id.strip())
     if profile.get("error"):
@@ -70,17 +93,15 @@ def get_candidate_jobs_for_user(
     # Use short, discovery-friendly query/location so URLs stay within safe length (avoid ScraperAPI 500)
     query, location = _discovery_query_and_location(profile)
 
-    result = discover_jobs(query=query, location=location, max_results=max_jobs)
-    jobs = result.get("jobs") or []
+    jobs, result, jobs_from = _find_jobs(query, location, max_jobs)
 
     # Fallback: if ZipRecruiter returns no results, try broader search
     if not jobs:
         fallback_query = "software engineer" if query != "software engineer" else "developer"
         logger.info("ZipRecruiter returned 0 jobs for query=%r location=%r; trying fallback query=%r", query, location, fallback_query)
-        fallback = discover_jobs(query=fallback_query, location="", max_results=max_jobs)
-        jobs = fallback.get("jobs") or []
-        if jobs:
-            result = fallback
+        fallback_jobs, fallback, fallback_from = _find_jobs(fallback_query, "", max_jobs)
+        if fallback_jobs:
+            jobs, result, jobs_from = fallback_jobs, fallback, fallback_from
             query = fallback_query
             location = ""
 
@@ -89,6 +110,7 @@ def get_candidate_jobs_for_user(
         "jobs": jobs,
         "query": result.get("query") or query,
         "location": result.get("location") or location,
+        "jobs_from": jobs_from,
         "error": None,
     }
 
@@ -145,6 +145,7 @@ Example format: {{"reasoning": "...", "ranked": [{{"index": 2, "title": "...", "
             "url": orig.get("url") or orig.get("source_url") or "",
             "snippet": orig.get("snippet") or orig.get("description") or "",
             "location": orig.get("location") or "",
+            "alternate_urls": orig.get("alternate_urls") or [],
             "explanation": r.get("explanation") or "",
             "score": r.get("score"),
         })
@@ -6,14 +6,37 @@ LinkedIn is not supported; use Indeed or Glassdoor.
 
 import os
 import re
+import time
 import logging
 import asyncio
-from typing import Optional, Dict
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse, quote
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
+import httpx
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from model.ats_api import AtsRef, parse_posting, resolve_ats_url
+from model.html_backends import ParserBackend, SelectorPlan, compile_plan, parse_document
+from model.parse_pool import get_parse_pool
+from model.provider_health import ProviderHealth, get_provider_health
+from model.scrape_cache import ScrapeCache, get_scrape_cache
+from model.structured_data import extract_job_posting
+from model.utils.cache import SingleFlight
+from model.utils.fetch import (
+    DownloadAborted,
+    conditional_headers,
+    read_html,
+    read_html_async,
+    response_validators,
+)
+from model.utils.text import NoiseCleaner, phrase_regex
+from model.utils.urls import canonical_job_url, dedupe_job_urls
 
 logger = logging.getLogger(__name__)
 
@@ -44,8 +67,15 @@ try:
 except ImportError:
     STEALTH_AVAILABLE = False
 
+# Optional HTTP/2 for the async client (pip install "httpx[http2]")
+try:
+    import h2  # noqa: F401
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
 
-# Login wall / blocked page indicators (LinkedIn, Glassdoor)
+# Login wall / blocked page indicators (LinkedIn, Glassdoor); literal phrases, case-insensitive
 LOGIN_WALL_PATTERNS = [
     r"sign in to linkedin",
     r"join linkedin",
@@ -59,21 +89,638 @@ LOGIN_WALL_PATTERNS = [
 ]
 
 
+# A structured-data description shorter than this falls back to DOM extraction
+STRUCTURED_MIN_CHARS = 200
+
+# Generic fallback: first <div> whose class looks like the job body
+_GENERIC_CONTENT_CLASS = re.compile(r"content|description|job", re.I)
+
+
+# Case-sensitive on lowercased text: lets re use its literal-prefix scan
+_LOGIN_WALL_RE = re.compile(phrase_regex(LOGIN_WALL_PATTERNS))
+
+
 def _is_login_wall(html: str) -> bool:
     """Detect if page is a login/signup wall instead of job content."""
     if not html or len(html) < 500:
         return True
-    text = html.lower()[:8000]
-    for pat in LOGIN_WALL_PATTERNS:
-        if re.search(pat, text):
-            return True
-    return False
+    return _LOGIN_WALL_RE.search(html[:8000].lower()) is not None
+
+
+BROWSER_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+DEFAULT_HEADERS = {
+    "User-Agent": BROWSER_USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+BROWSER_LAUNCH_ARGS = [
+    "--no-sandbox", "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+]
+
+# Requests aborted while rendering for text (never needed to read a job description)
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+BLOCKED_HOST_SUFFIXES = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "googlesyndication.com",
+    "googleadservices.com", "adservice.google.com", "facebook.net", "hotjar.com", "segment.com",
+    "segment.io", "mixpanel.com", "amplitude.com", "fullstory.com", "optimizely.com",
+    "newrelic.com", "nr-data.net", "quantserve.com", "scorecardresearch.com", "criteo.com",
+    "criteo.net", "taboola.com", "outbrain.com", "adsrvr.org", "bat.bing.com", "ads.linkedin.com",
+)
+# Typical transfer size per blocked request, used to estimate bytes saved
+BLOCKED_BYTES_ESTIMATE = {"image": 40_000, "font": 30_000, "media": 250_000, "tracker": 25_000}
+
+
+def _blocked_kind(resource_type: str, url: str) -> Optional[str]:
+    """Why a browser request should be aborted (resource type or "tracker"), else None."""
+    if resource_type in BLOCKED_RESOURCE_TYPES:
+        return resource_type
+    host = (urlparse(url).hostname or "").lower()
+    if any(host == h or host.endswith("." + h) for h in BLOCKED_HOST_SUFFIXES):
+        return "tracker"
+    return None
+
+
+def _new_render_metrics() -> Dict[str, Any]:
+    return {
+        "requests": 0,
+        "blocked": 0,
+        "blocked_by_type": {},
+        "est_bytes_saved": 0,
+        "selector_matched": False,
+        "wait_ms": 0.0,
+        "wait_time_saved_ms": 0.0,
+        "total_ms": 0.0,
+    }
+
+
+class _BrowserSlot:
+    """One pooled browser + context; pages are leased from the context."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.browser = None
+        self.context = None
+        self.active = 0          # pages currently leased
+        self.uses = 0            # pages served since last (re)launch
+        self.retiring = False    # recycle once active drops to 0
+        self.lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self.browser is not None and self.browser.is_connected()
+
+
+class BrowserPool:
+    """
+    Long-lived Playwright browsers shared by every scrape in the process.
+
+    Playwright objects are bound to the event loop that created them, so the pool owns a
+    dedicated loop on a daemon thread. Sync callers (JobScraper) block on a future; async
+    callers (FastAPI routes) await it without holding a worker thread.
+
+    - size: browsers kept warm (launched lazily on first lease)
+    - max_pages_per_browser: concurrent pages leased from one browser
+    - recycle_after: relaunch a browser after it has served this many pages (leaks / stale sessions)
+    - block_resources / selector_timeout_ms: render() defaults (abort assets, content-selector wait)
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_pages_per_browser: int = 4,
+        recycle_after: int = 50,
+        headless: bool = True,
+        browserless_url: Optional[str] = None,
+        use_stealth: bool = True,
+        block_resources: bool = True,
+        selector_timeout_ms: int = 3000,
+    ):
+        self.size = max(1, size)
+        self.max_pages_per_browser = max(1, max_pages_per_browser)
+        self.recycle_after = max(1, recycle_after)
+        self.headless = headless
+        self.browserless_url = browserless_url
+        self.use_stealth = use_stealth and STEALTH_AVAILABLE
+        self.block_resources = block_resources
+        self.selector_timeout_ms = selector_timeout_ms
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._playwright = None
+        self._slots: List[_BrowserSlot] = []
+        self._cond: Optional[asyncio.Condition] = None
+        self._start_lock = asyncio.Lock()
+        self._closed = False
+        self._counters = {
+            "leases": 0,
+            "launches": 0,
+            "recycles": 0,
+            "failures": 0,
+            "lease_wait_ms": 0.0,
+            "renders": 0,
+            "blocked_requests": 0,
+            "est_bytes_saved": 0,
+            "wait_time_saved_ms": 0.0,
+        }
+
+    # ---- loop plumbing ----
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("BrowserPool is closed")
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="browser-pool", daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def submit(self, coro: Awaitable[Any]) -> Future:
+        """Schedule a coroutine on the pool loop; returns a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    async def _start(self) -> None:
+        if self._playwright is not None:
+            return
+        if not PLAYWRIGHT_AVAILABLE:
+            raise RuntimeError("Playwright not installed. pip install playwright && playwright install chromium")
+        async with self._start_lock:
+            if self._playwright is not None:
+                return
+            self._cond = asyncio.Condition()
+            self._slots = [_BrowserSlot(i) for i in range(self.size)]
+            self._playwright = await async_playwright().start()
+
+    async def _launch(self, slot: _BrowserSlot) -> None:
+        async with slot.lock:
+            if slot.ready:
+                return
+            await self._close_slot(slot)
+            if self.browserless_url:
+                slot.browser = await self._playwright.chromium.connect_over_cdp(self.browserless_url)
+            else:
+                slot.browser = await self._playwright.chromium.launch(
+                    headless=self.headless, args=BROWSER_LAUNCH_ARGS,
+                )
+            slot.context = await slot.browser.new_context(
+                viewport={"width": 1920, "height": 1080},
+                user_agent=BROWSER_USER_AGENT,
+                locale="en-US",
+            )
+            if self.use_stealth:
+                await Stealth().apply_stealth_async(slot.context)
+            self._counters["launches"] += 1
+            logger.info("Browser pool: launched browser %d", slot.index)
+
+    async def _close_slot(self, slot: _BrowserSlot) -> None:
+        browser, slot.browser, slot.context = slot.browser, None, None
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug("Browser pool: close failed: %s", e)
+
+    def _pick_slot(self) -> Optional[_BrowserSlot]:
+        # Prefer warm browsers with the fewest leased pages; cold slots only when warm ones are full
+        free = [s for s in self._slots if not s.retiring and s.active < self.max_pages_per_browser]
+        if not free:
+            return None
+        return min(free, key=lambda s: (not s.ready, s.active))
+
+    @asynccontextmanager
+    async def _lease(self):
+        await self._start()
+        start = time.perf_counter()
+        async with self._cond:
+            slot = self._pick_slot()
+            while slot is None:
+                await self._cond.wait()
+                slot = self._pick_slot()
+            slot.active += 1
+            if slot.uses + slot.active >= self.recycle_after:
+                slot.retiring = True  # no new leases; recycle once in-flight pages finish
+        self._counters["leases"] += 1
+        self._counters["lease_wait_ms"] += (time.perf_counter() - start) * 1000
+        page = None
+        try:
+            if not slot.ready:
+                await self._launch(slot)
+            page = await slot.context.new_page()
+            yield page
+        except Exception:
+            self._counters["failures"] += 1
+            raise
+        finally:
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+            async with self._cond:
+                slot.active -= 1
+                slot.uses += 1
+                if slot.retiring and slot.active == 0:
+                    await self._close_slot(slot)
+                    slot.retiring = False
+                    slot.uses = 0
+                    self._counters["recycles"] += 1
+                self._cond.notify_all()
+
+    # ---- page operations ----
+
+    async def _block_resources(self, page: Any, metrics: Dict[str, Any]) -> None:
+        """Abort images/fonts/media and analytics/ad hosts on this page; counts go to metrics."""
+        async def _route(route):
+            request = route.request
+            metrics["requests"] += 1
+            kind = _blocked_kind(request.resource_type, request.url)
+            try:
+                if kind is None:
+                    await route.continue_()
+                    return
+                await route.abort()
+            except Exception as e:
+                logger.debug("Browser pool: route handling failed: %s", e)
+                return
+            metrics["blocked"] += 1
+            metrics["blocked_by_type"][kind] = metrics["blocked_by_type"].get(kind, 0) + 1
+            metrics["est_bytes_saved"] += BLOCKED_BYTES_ESTIMATE[kind]
+
+        await page.route("**/*", _route)
+
+    async def _run_page(
+        self,
+        url: str,
+        handler: Callable[[Any], Awaitable[Any]],
+        wait_until: str,
+        timeout_ms: int,
+        block_resources: bool = False,
+        metrics: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        async with self._lease() as page:
+            if block_resources:
+                await self._block_resources(page, metrics if metrics is not None else _new_render_metrics())
+            await page.goto(url, wait_until=wait_until, timeout=timeout_ms)
+            return await handler(page)
+
+    async def _render(
+        self,
+        url: str,
+        wait_selectors: Optional[List[str]],
+        timeout_ms: int,
+        selector_timeout_ms: int,
+        settle_seconds: float,
+        block_resources: bool,
+    ) -> Dict[str, Any]:
+        metrics = _new_render_metrics()
+        started = time.perf_counter()
+
+        async def _content(page):
+            wait_started = time.perf_counter()
+            if wait_selectors:
+                # Return as soon as the job body is in the DOM instead of a fixed settle sleep
+                try:
+                    await page.wait_for_selector(
+                        ", ".join(wait_selectors), state="attached", timeout=selector_timeout_ms,
+                    )
+                    metrics["selector_matched"] = True
+                except Exception as e:
+                    logger.debug("Browser pool: no content selector on %s: %s", url, e)
+            else:
+                await asyncio.sleep(settle_seconds)
+            metrics["wait_ms"] = round((time.perf_counter() - wait_started) * 1000, 1)
+            return await page.content()
+
+        html = await self._run_page(url, _content, "domcontentloaded", timeout_ms, block_resources, metrics)
+        if wait_selectors:
+            metrics["wait_time_saved_ms"] = round(max(0.0, settle_seconds * 1000 - metrics["wait_ms"]), 1)
+        metrics["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        self._counters["renders"] += 1
+        self._counters["blocked_requests"] += metrics["blocked"]
+        self._counters["est_bytes_saved"] += metrics["est_bytes_saved"]
+        self._counters["wait_time_saved_ms"] += metrics["wait_time_saved_ms"]
+        return {"html": html, "metrics": metrics}
+
+    def run_page(
+        self,
+        url: str,
+        handler: Callable[[Any], Awaitable[Any]],
+        wait_until: str = "domcontentloaded",
+        timeout_ms: int = 30000,
+        block_resources: bool = False,
+    ) -> Any:
+        """Open url on a leased page and return await handler(page). Blocks the calling thread."""
+        fut = self.submit(self._run_page(url, handler, wait_until, timeout_ms, block_resources))
+        try:
+            return fut.result(timeout=timeout_ms / 1000 + 60)
+        except Exception:
+            fut.cancel()
+            raise
+
+    async def run_page_async(
+        self,
+        url: str,
+        handler: Callable[[Any], Awaitable[Any]],
+        wait_until: str = "domcontentloaded",
+        timeout_ms: int = 30000,
+        block_resources: bool = False,
+    ) -> Any:
+        """Async version of run_page for callers on another event loop (e.g. FastAPI)."""
+        return await asyncio.wrap_future(
+            self.submit(self._run_page(url, handler, wait_until, timeout_ms, block_resources))
+        )
+
+    def render(
+        self,
+        url: str,
+        wait_selectors: Optional[List[str]] = None,
+        timeout_ms: int = 30000,
+        selector_timeout_ms: Optional[int] = None,
+        settle_seconds: float = 3.0,
+        block_resources: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """
+        Load url and return {"html", "metrics"}. Waits for the first of wait_selectors, at most
+        selector_timeout_ms (or settle_seconds when none are given); block_resources aborts
+        images, fonts, media and tracker hosts. None = pool defaults. Blocks the calling thread.
+        """
+        selector_timeout_ms = self.selector_timeout_ms if selector_timeout_ms is None else selector_timeout_ms
+        block_resources = self.block_resources if block_resources is None else block_resources
+        fut = self.submit(self._render(url, wait_selectors, timeout_ms, selector_timeout_ms, settle_seconds, block_resources))
+        try:
+            return fut.result(timeout=(timeout_ms + selector_timeout_ms) / 1000 + settle_seconds + 60)
+        except Exception:
+            fut.cancel()
+            raise
+
+    async def render_async(
+        self,
+        url: str,
+        wait_selectors: Optional[List[str]] = None,
+        timeout_ms: int = 30000,
+        selector_timeout_ms: Optional[int] = None,
+        settle_seconds: float = 3.0,
+        block_resources: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        selector_timeout_ms = self.selector_timeout_ms if selector_timeout_ms is None else selector_timeout_ms
+        block_resources = self.block_resources if block_resources is None else block_resources
+        return await asyncio.wrap_future(self.submit(
+            self._render(url, wait_selectors, timeout_ms, selector_timeout_ms, settle_seconds, block_resources)
+        ))
+
+    def fetch_html(self, url: str, timeout_ms: int = 30000, settle_seconds: float = 3.0) -> Optional[str]:
+        """Load url (fixed settle wait) and return rendered HTML. Blocks the calling thread."""
+        return self.render(url, timeout_ms=timeout_ms, settle_seconds=settle_seconds)["html"]
+
+    async def fetch_html_async(self, url: str, timeout_ms: int = 30000, settle_seconds: float = 3.0) -> Optional[str]:
+        return (await self.render_async(url, timeout_ms=timeout_ms, settle_seconds=settle_seconds))["html"]
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool state and counters (approximate; read without locking)."""
+        leases = self._counters["leases"]
+        return {
+            "size": self.size,
+            "max_pages_per_browser": self.max_pages_per_browser,
+            "recycle_after": self.recycle_after,
+            "browsers_open": sum(1 for s in self._slots if s.ready),
+            "active_pages": sum(s.active for s in self._slots),
+            "leases": leases,
+            "launches": self._counters["launches"],
+            "recycles": self._counters["recycles"],
+            "failures": self._counters["failures"],
+            "avg_lease_wait_ms": round(self._counters["lease_wait_ms"] / leases, 2) if leases else 0.0,
+            "renders": self._counters["renders"],
+            "blocked_requests": self._counters["blocked_requests"],
+            "est_bytes_saved": self._counters["est_bytes_saved"],
+            "wait_time_saved_ms": round(self._counters["wait_time_saved_ms"], 1),
+            "browsers": [
+                {"index": s.index, "connected": s.ready, "active": s.active, "uses": s.uses}
+                for s in self._slots
+            ],
+        }
+
+    async def _shutdown(self) -> None:
+        for slot in self._slots:
+            await self._close_slot(slot)
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def close(self) -> None:
+        """Close all browsers and stop the pool loop."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=30)
+        except Exception as e:
+            logger.warning("Browser pool shutdown error: %s", e)
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+
+
+_browser_pools: Dict[bool, BrowserPool] = {}
+_browser_pools_lock = threading.Lock()
+
+
+def get_browser_pool(headless: bool = True) -> BrowserPool:
+    """Process-wide BrowserPool (one per headless mode), sized from config."""
+    with _browser_pools_lock:
+        pool = _browser_pools.get(headless)
+        if pool is None:
+            from model.utils.config import get_config
+            config = get_config()
+            pool = BrowserPool(
+                size=config.PLAYWRIGHT_POOL_SIZE,
+                max_pages_per_browser=config.PLAYWRIGHT_MAX_PAGES_PER_BROWSER,
+                recycle_after=config.PLAYWRIGHT_RECYCLE_AFTER,
+                headless=headless,
+                browserless_url=config.BROWSERLESS_URL,
+                use_stealth=getattr(config, "USE_STEALTH", True),
+                block_resources=config.PLAYWRIGHT_BLOCK_RESOURCES,
+                selector_timeout_ms=config.PLAYWRIGHT_SELECTOR_TIMEOUT_MS,
+            )
+            _browser_pools[headless] = pool
+        return pool
+
+
+def browser_pool_stats() -> Dict[str, Any]:
+    """Stats for pools that have been created (does not start a pool)."""
+    with _browser_pools_lock:
+        pools = dict(_browser_pools)
+    return {("headless" if h else "headed"): p.stats() for h, p in pools.items()}
+
+
+def close_browser_pools() -> None:
+    """Close every pool (app shutdown)."""
+    with _browser_pools_lock:
+        pools = list(_browser_pools.values())
+        _browser_pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+class AsyncHttpEngine:
+    """
+    Shared httpx.AsyncClient for one event loop: keep-alive pooling, HTTP/2 when h2 is
+    installed, and a per-host concurrency cap (httpx only limits connections globally).
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive: int = 20,
+        max_per_host: int = 6,
+        http2: bool = True,
+    ):
+        self.max_per_host = max(1, max_per_host)
+        self.http2 = http2 and H2_AVAILABLE
+        self.client = httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            http2=self.http2,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+                keepalive_expiry=30,
+            ),
+        )
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight: Dict[str, int] = {}
+        self.requests = 0
+
+    async def get(
+        self,
+        url: str,
+        timeout: float = 15,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        host = urlparse(url).netloc.lower()
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self.max_per_host)
+        async with slot:
+            self.requests += 1
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+            try:
+                return await self.client.get(url, timeout=timeout, headers=headers)
+            finally:
+                self._in_flight[host] -= 1
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        url: str,
+        timeout: float = 15,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """GET without reading the body (response.aiter_bytes()); same per-host cap as get()."""
+        host = urlparse(url).netloc.lower()
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self.max_per_host)
+        async with slot:
+            self.requests += 1
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+            try:
+                async with self.client.stream("GET", url, timeout=timeout, headers=headers) as response:
+                    yield response
+            finally:
+                self._in_flight[host] -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "http2": self.http2,
+            "max_per_host": self.max_per_host,
+            "requests": self.requests,
+            "in_flight": {h: n for h, n in self._in_flight.items() if n},
+        }
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+# One engine per event loop (AsyncClient connections are bound to the loop that opened them)
+_async_engines: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncHttpEngine]" = weakref.WeakKeyDictionary()
+
+
+def get_async_http_engine() -> AsyncHttpEngine:
+    """AsyncHttpEngine for the running event loop, sized from config."""
+    loop = asyncio.get_running_loop()
+    engine = _async_engines.get(loop)
+    if engine is None:
+        from model.utils.config import get_config
+        config = get_config()
+        engine = AsyncHttpEngine(
+            max_connections=config.HTTP_MAX_CONNECTIONS,
+            max_keepalive=config.HTTP_MAX_KEEPALIVE,
+            max_per_host=config.HTTP_MAX_PER_HOST,
+            http2=config.HTTP2_ENABLED,
+        )
+        _async_engines[loop] = engine
+    return engine
+
+
+def async_http_stats() -> Dict[str, Any]:
+    """Stats of the running loop's engine (empty if none created yet)."""
+    try:
+        engine = _async_engines.get(asyncio.get_running_loop())
+    except RuntimeError:
+        return {}
+    return engine.stats() if engine is not None else {}
+
+
+async def close_async_http_engine() -> None:
+    """Close the running loop's engine (app shutdown)."""
+    engine = _async_engines.pop(asyncio.get_running_loop(), None)
+    if engine is not None:
+        await engine.aclose()
+
+
+# Streamed downloads (requests / ScraperAPI): process-wide totals, per-scrape numbers go to meta["download"]
+_download_counters = {
+    "downloads": 0, "bytes_downloaded": 0, "html_chars": 0, "stripped_chars": 0,
+    "truncated": 0, "aborted_not_html": 0,
+}
+_download_lock = threading.Lock()
+
+
+def download_stats() -> Dict[str, Any]:
+    """Totals over all streamed scraper downloads (bytes read, script/style/svg stripped, caps hit)."""
+    with _download_lock:
+        return dict(_download_counters)
+
+
+# Minimum extracted text for a hedged provider to win the race
+HEDGE_MIN_TEXT_CHARS = 200
+
+# Threads for hedged provider attempts (sync path). Shared, so losers that are still
+# finishing in the background stay bounded.
+_hedge_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="scrape-hedge")
+
+# Concurrent scrapes of one canonical URL (any JobScraper instance) share a single fetch
+_scrape_flight = SingleFlight()
+
+
+def scrape_flight_stats() -> Dict[str, Any]:
+    """Single-flight counters: calls, flights actually run, calls that joined one in flight."""
+    return _scrape_flight.stats()
 
 
 class JobScraper:
     """
     Production job scraper with multiple providers.
-    Priority: ScraperAPI (if configured) > Playwright > requests.
+    Priority: ScraperAPI (if configured) > Playwright > requests, reordered per domain
+    by observed success rate/latency; providers with an open circuit breaker are skipped.
+    Greenhouse/Lever posting URLs try the board's public JSON API first.
     """
 
     SITE_SELECTORS = {
@@ -141,28 +788,56 @@ class JobScraper:
         },
     }
 
-    # Common noise patterns removed from extracted text (nav, ads, footers)
+    # Boilerplate removed from extracted text (case-insensitive). Literal phrases are merged
+    # into one trie regex; NOISE_PATTERNS are regexes for the rest.
+    NOISE_PHRASES = [
+        "Apply now",
+        "Save job",
+        "Share job",
+        "See more",
+        "See less",
+        "Easy apply",
+        "Sign in to save",
+        "All rights reserved.",
+        "All rights reserved",
+        "Privacy policy",
+        "Terms of use",
+        "Terms of service",
+        "Cookie policy",
+        "Follow us on",
+        "Connect with us",
+    ]
     NOISE_PATTERNS = [
-        r"Apply now\s*",
-        r"Save job\s*",
-        r"Share job\s*",
-        r"See more\s*",
-        r"See less\s*",
-        r"Easy apply\s*",
-        r"Sign in to save\s*",
         r"© \d{4}.*?\.?\s*",
-        r"All rights reserved\.?\s*",
-        r"Privacy policy\s*",
-        r"Terms of (use|service)\s*",
-        r"Cookie policy\s*",
-        r"Follow us on\s*",
-        r"Connect with us\s*",
         r"^\s*Home\s*\|\s*",
         r"\s*Home\s*\|\s*Careers\s*\|\s*",
         r"^\s*\[.*?\]\s*",  # [AD] or [Advertisement]
     ]
+    # Extra per-site phrases (button/label text that leaks into the job body)
+    SITE_NOISE_PHRASES = {
+        "indeed": ["Report job", "Hiring Insights", "Job activity"],
+        "glassdoor": ["Show more", "Show less", "Report this job"],
+        "greenhouse": ["Apply for this job", "Back to jobs"],
+        "lever": ["Apply for this job", "Back to all jobs"],
+    }
+
+    # Fallback cleanup for sites without an entry (and pages where site selectors miss)
+    GENERIC_SELECTORS = {
+        "content_selectors": [],
+        "exclude_selectors": ["nav", "header", "footer", ".ad", "script", "style"],
+    }
 
-    JS_SITES = ("glassdoor",)  # Indeed, Greenhouse, Lever use requests (easy)
+    # Render is considered done when one of these exists (sites without SITE_SELECTORS)
+    GENERIC_WAIT_SELECTORS = ["main", "article", "div[class*='description']", "div#content"]
+
+    # Compiled selector plans per (site, backend name); shared by all instances
+    _selector_plans: Dict[tuple, SelectorPlan] = {}
+    # Compiled noise matchers per site
+    _noise_cleaners: Dict[Optional[str], NoiseCleaner] = {}
+
+    JS_SITES = ("glassdoor",)
+    # Sites where requests often returns a shell page: hedge it with ScraperAPI/Playwright
+    HEDGED_SITES = ("glassdoor", "generic")  # Indeed, Greenhouse, Lever use requests (easy)
 
     def __init__(
         self,
@@ -170,19 +845,41 @@ class JobScraper:
         use_playwright: bool = True,
         headless: bool = True,
         scraper_api_key: Optional[str] = None,
+        cache: Optional[ScrapeCache] = None,
+        use_cache: bool = True,
+        health: Optional[ProviderHealth] = None,
+        hedge: Optional[bool] = None,
+        hedge_delay: Optional[float] = None,
+        deadline: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        strip_scripts: Optional[bool] = None,
+        pool_maxsize: Optional[int] = None,
     ):
+        from model.utils.config import get_config
+        config = get_config()
         self.use_selenium = use_selenium and SELENIUM_AVAILABLE
         self.use_playwright = use_playwright and PLAYWRIGHT_AVAILABLE
         self.headless = headless
         self.scraper_api_key = scraper_api_key
         self.driver = None
         self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-        })
-        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.session.headers.update(DEFAULT_HEADERS)
+        # Keep-alive connections per host, enough for every hedge/batch thread using this session
+        self.pool_maxsize = config.SCRAPER_POOL_MAXSIZE if pool_maxsize is None else pool_maxsize
+        adapter = HTTPAdapter(pool_connections=config.SCRAPER_POOL_HOSTS, pool_maxsize=self.pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Shared scrape cache (LRU + SQLite); None disables caching for this instance
+        self.cache = (cache or get_scrape_cache()) if use_cache else None
+        # Per-domain provider stats + circuit breakers (shared across instances by default)
+        self.health = health or get_provider_health()
+        # Hedged mode for HEDGED_SITES: race slower providers after hedge_delay, all within deadline
+        self.hedge = config.SCRAPE_HEDGE_ENABLED if hedge is None else hedge
+        self.hedge_delay = config.SCRAPE_HEDGE_DELAY if hedge_delay is None else hedge_delay
+        self.deadline = config.SCRAPE_DEADLINE if deadline is None else deadline
+        # Streamed downloads: stop after max_bytes, drop <script>/<style>/<svg> before parsing
+        self.max_bytes = config.SCRAPE_MAX_BYTES if max_bytes is None else max_bytes
+        self.strip_scripts = config.SCRAPE_STRIP_SCRIPTS if strip_scripts is None else strip_scripts
 
     def _detect_site(self, url: str) -> str:
         domain = urlparse(url).netloc.lower()
@@ -198,95 +895,160 @@ class JobScraper:
             return "lever"
         return "generic"
 
-    def _clean_text(self, text: str) -> str:
-        """Remove navigation, ads, footer text, and normalize whitespace."""
-        if not text:
-            return ""
-        text = re.sub(r"\s+", " ", text)
-        text = text.strip()
-        # Remove common noise patterns
-        for pat in self.NOISE_PATTERNS:
-            text = re.sub(pat, " ", text, flags=re.IGNORECASE)
-        text = re.sub(r"\s+", " ", text)
-        text = text.strip()
-        return text
+    def _noise_cleaner(self, site: Optional[str]) -> NoiseCleaner:
+        cleaner = self._noise_cleaners.get(site)
+        if cleaner is None:
+            phrases = self.NOISE_PHRASES + self.SITE_NOISE_PHRASES.get(site, [])
+            cleaner = self._noise_cleaners[site] = NoiseCleaner(phrases, self.NOISE_PATTERNS)
+        return cleaner
+
+    def _clean_text(self, text: str, site: Optional[str] = None) -> str:
+        """Remove navigation, ads, footer text (site-specific too), and normalize whitespace."""
+        return self._noise_cleaner(site).clean(text)
+
+    def _selector_plan(self, site: str, backend: ParserBackend) -> SelectorPlan:
+        """Compiled SITE_SELECTORS for a site, built once per backend."""
+        key = (site, backend.name)
+        plan = self._selector_plans.get(key)
+        if plan is None:
+            cfg = self.SITE_SELECTORS.get(site, self.GENERIC_SELECTORS)
+            plan = compile_plan(backend, cfg["content_selectors"], cfg["exclude_selectors"])
+            self._selector_plans[key] = plan
+        return plan
 
     def _extract_with_selectors(
         self,
-        soup: BeautifulSoup,
-        selectors: list,
-        exclude_selectors: list,
+        backend: ParserBackend,
+        doc: Any,
+        plan: SelectorPlan,
+        site: Optional[str] = None,
     ) -> str:
-        for sel in exclude_selectors:
-            for el in soup.select(sel):
-                el.decompose()
-        for selector in selectors:
-            try:
-                elements = soup.select(selector)
-            except Exception:
-                continue
+        for compiled in plan.exclude:
+            for el in backend.select(doc, compiled):
+                backend.drop(el)
+        for _, compiled in plan.content:
+            elements = backend.select(doc, compiled)
             if elements:
                 parts = []
                 for el in elements:
-                    t = el.get_text(separator=" ", strip=True)
+                    t = backend.text(el)
                     if t and len(t) > 80:
                         parts.append(t)
                 if parts:
-                    return self._clean_text(" ".join(parts))
+                    return self._clean_text(" ".join(parts), site)
         return ""
 
-    def _extract_generic(self, soup: BeautifulSoup) -> str:
-        for sel in ["nav", "header", "footer", ".ad", "script", "style"]:
-            for el in soup.select(sel):
-                el.decompose()
-        main = soup.find("main") or soup.find("article") or soup.find(
-            "div", class_=re.compile(r"content|description|job", re.I)
-        )
-        if main:
-            return self._clean_text(main.get_text(separator=" ", strip=True))
-        body = soup.find("body")
-        if body:
+    def _extract_generic(self, backend: ParserBackend, doc: Any, site: Optional[str] = None) -> str:
+        plan = self._selector_plan("generic", backend)
+        for compiled in plan.exclude:
+            for el in backend.select(doc, compiled):
+                backend.drop(el)
+        main = backend.first(doc, backend.compiled("main"))
+        if main is None:
+            main = backend.first(doc, backend.compiled("article"))
+        if main is None:
+            main = next(
+                (
+                    div for div in backend.select(doc, backend.compiled("div[class]"))
+                    if _GENERIC_CONTENT_CLASS.search(backend.attr(div, "class"))
+                ),
+                None,
+            )
+        if main is not None:
+            return self._clean_text(backend.text(main), site)
+        body = backend.first(doc, backend.compiled("body"))
+        if body is not None:
             parts = []
-            for p in body.find_all(["p", "div", "section"]):
-                t = p.get_text(separator=" ", strip=True)
+            for p in backend.select(body, backend.compiled("p, div, section")):
+                t = backend.text(p)
                 if len(t) > 50:
                     parts.append(t)
             if parts:
-                return self._clean_text(" ".join(parts))
+                return self._clean_text(" ".join(parts), site)
         return ""
 
-    def _parse_html(self, html: str, url: str) -> Optional[str]:
+    def _parse_page(self, html: str, url: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        (text, structured JobPosting fields). A JSON-LD/microdata description is used
+        as the text directly; the DOM is only parsed when there is none (or it is too short).
+        """
         if _is_login_wall(html):
             logger.warning("Login wall detected - page requires authentication")
-            return None
-        try:
-            soup = BeautifulSoup(html, "lxml")
-        except Exception:
-            soup = BeautifulSoup(html, "html.parser")
+            return None, None
         site = self._detect_site(url)
+        job = extract_job_posting(html)
+        if job:
+            description = self._clean_text(job.pop("description", ""), site)
+            if len(description) > STRUCTURED_MIN_CHARS:
+                return description, job
+        backend, doc = parse_document(html)
         if site in self.SITE_SELECTORS:
-            cfg = self.SITE_SELECTORS[site]
-            text = self._extract_with_selectors(
-                soup, cfg["content_selectors"], cfg["exclude_selectors"]
-            )
+            text = self._extract_with_selectors(backend, doc, self._selector_plan(site, backend), site)
             if text:
-                return text
-        return self._extract_generic(soup) or None
+                return text, job
+        return self._extract_generic(backend, doc, site) or None, job
+
+    def _parse_html(self, html: str, url: str, meta: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Job text of a page; structured fields (title, company, ...) go to meta["job"].
+        Runs in the parse worker pool when PARSE_POOL_WORKERS > 0.
+        """
+        pool = get_parse_pool()
+        text, job = pool.parse_job(html, url) if pool is not None else self._parse_page(html, url)
+        if job and meta is not None:
+            meta["job"] = job
+        return text
+
+    def _record_download(self, stats: Optional[Dict[str, Any]], meta: Optional[Dict[str, Any]], aborted: bool = False) -> None:
+        with _download_lock:
+            if aborted:
+                _download_counters["aborted_not_html"] += 1
+                return
+            _download_counters["downloads"] += 1
+            _download_counters["truncated"] += int(stats["truncated"])
+            for key in ("bytes_downloaded", "html_chars", "stripped_chars"):
+                _download_counters[key] += stats[key]
+        if stats["truncated"]:
+            logger.warning(f"Download capped at {self.max_bytes} bytes; parsing the first part only")
+        if meta is not None:
+            meta["download"] = stats
+
+    def _read_body(self, response: requests.Response, meta: Optional[Dict[str, Any]]) -> str:
+        """Stream the body: at most max_bytes, non-HTML aborted before download, scripts stripped."""
+        try:
+            html, stats = read_html(response, self.max_bytes, strip=self.strip_scripts)
+        except DownloadAborted:
+            self._record_download(None, meta, aborted=True)
+            raise
+        self._record_download(stats, meta)
+        return html
+
+    async def _read_body_async(self, response: httpx.Response, meta: Optional[Dict[str, Any]]) -> str:
+        try:
+            html, stats = await read_html_async(response, self.max_bytes, strip=self.strip_scripts)
+        except DownloadAborted:
+            self._record_download(None, meta, aborted=True)
+            raise
+        self._record_download(stats, meta)
+        return html
 
-    def _scrape_with_scraper_api(self, url: str) -> Optional[str]:
+    def _scraper_api_url(self, url: str) -> str:
+        return (
+            "http://api.scraperapi.com"
+            f"?api_key={self.scraper_api_key}"
+            f"&url={quote(url, safe='')}"
+            "&render=true"  # JS rendering for LinkedIn
+        )
+
+    def _scrape_with_scraper_api(self, url: str, meta: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """ScraperAPI - production-grade, handles LinkedIn/Glassdoor."""
         if not self.scraper_api_key:
             return None
         try:
-            api_url = (
-                "http://api.scraperapi.com"
-                f"?api_key={self.scraper_api_key}"
-                f"&url={quote(url, safe='')}"
-                "&render=true"  # JS rendering for LinkedIn
-            )
-            r = self.session.get(api_url, timeout=60)
-            r.raise_for_status()
-            text = self._parse_html(r.text, url)
+            with self.session.get(self._scraper_api_url(url), timeout=60, stream=True) as r:
+                r.raise_for_status()
+                html = self._read_body(r, meta)
+            text = self._parse_html(html, url, meta)
             if text and len(text) > 200:
                 logger.info(f"ScraperAPI: extracted {len(text)} chars")
                 return text
@@ -294,57 +1056,171 @@ class JobScraper:
             logger.warning(f"ScraperAPI error: {e}")
         return None
 
-    def _scrape_with_requests(self, url: str) -> Optional[str]:
+    def _scrape_with_requests(
+        self,
+        url: str,
+        meta: Optional[Dict[str, Any]] = None,
+        validators: Optional[Dict[str, str]] = None,
+    ) -> Optional[str]:
+        """
+        Plain GET + parse. With validators, sends If-None-Match/If-Modified-Since; a 304
+        sets meta["not_modified"] and returns None. Response validators go to meta["validators"].
+        """
         try:
-            r = self.session.get(url, timeout=15)
-            r.raise_for_status()
-            text = self._parse_html(r.text, url)
+            with self.session.get(url, timeout=15, headers=conditional_headers(validators) or None, stream=True) as r:
+                if r.status_code == 304 and validators:
+                    if meta is not None:
+                        meta["not_modified"] = True
+                    return None
+                r.raise_for_status()
+                if meta is not None:
+                    meta["validators"] = response_validators(r.headers)
+                html = self._read_body(r, meta)
+            text = self._parse_html(html, url, meta)
             if text and len(text) > 200:
                 return text
         except Exception as e:
             logger.debug(f"Requests scrape failed: {e}")
         return None
 
-    def _scrape_with_playwright(self, url: str) -> Optional[str]:
+    @staticmethod
+    def _ats_posting(url: str) -> Optional[AtsRef]:
+        ref = resolve_ats_url(url)
+        return ref if ref is not None and ref.posting_id else None
+
+    def _ats_text(self, ref: AtsRef, payload: Any, meta: Optional[Dict[str, Any]]) -> Optional[str]:
+        text, job = parse_posting(ref, payload)
+        text = self._clean_text(text, ref.site)
+        if not text:
+            return None
+        if meta is not None:
+            meta["job"] = job
+        return text
+
+    def _scrape_with_ats_api(self, url: str, meta: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Greenhouse/Lever posting from the public board JSON API: no page download or HTML parse."""
+        ref = self._ats_posting(url)
+        if ref is None:
+            return None
+        try:
+            r = self.session.get(ref.api_url, timeout=15, headers={"Accept": "application/json"})
+            r.raise_for_status()
+            text = self._ats_text(ref, r.json(), meta)
+            if text:
+                logger.info(f"{ref.site} API: {len(text)} chars for {ref.board}/{ref.posting_id}")
+                return text
+        except Exception as e:
+            logger.debug(f"{ref.site} API scrape failed: {e}")
+        return None
+
+    def _wait_selectors(self, url: str) -> List[str]:
+        """Selectors that mark the job body as rendered (replaces a fixed settle sleep)."""
+        cfg = self.SITE_SELECTORS.get(self._detect_site(url))
+        return list(cfg["content_selectors"]) if cfg else list(self.GENERIC_WAIT_SELECTORS)
+
+    def _record_render(self, url: str, rendered: Dict[str, Any], meta: Optional[Dict[str, Any]]) -> None:
+        metrics = rendered["metrics"]
+        logger.info(
+            f"Playwright render {url}: blocked {metrics['blocked']}/{metrics['requests']} requests "
+            f"(~{metrics['est_bytes_saved'] // 1024} KB), waited {metrics['wait_ms']:.0f} ms"
+        )
+        if meta is not None:
+            meta["render"] = metrics
+
+    def _scrape_with_playwright(self, url: str, meta: Optional[Dict[str, Any]] = None) -> Optional[str]:
         if not PLAYWRIGHT_AVAILABLE:
             return None
         try:
-            html = asyncio.run(self._playwright_async(url))
-            if html:
-                return self._parse_html(html, url)
+            # Shared warm browser; no per-URL launch/teardown
+            rendered = get_browser_pool(self.headless).render(url, wait_selectors=self._wait_selectors(url))
+            self._record_render(url, rendered, meta)
+            if rendered["html"]:
+                return self._parse_html(rendered["html"], url, meta)
         except Exception as e:
             logger.warning(f"Playwright scrape failed: {e}")
         return None
 
-    async def _playwright_async(self, url: str) -> Optional[str]:
-        from model.utils.config import get_config
-        config = get_config()
-        browserless_url = config.BROWSERLESS_URL
-        use_stealth = getattr(config, "USE_STEALTH", True) and STEALTH_AVAILABLE
+    async def _playwright_async(self, url: str) -> Dict[str, Any]:
+        return await get_browser_pool(self.headless).render_async(url, wait_selectors=self._wait_selectors(url))
 
-        launch = {"headless": self.headless, "args": [
-            "--no-sandbox", "--disable-dev-shm-usage",
-            "--disable-blink-features=AutomationControlled",
-        ]}
+    # ---- async providers (shared httpx.AsyncClient; no thread held while waiting on I/O) ----
 
-        async with async_playwright() as p:
-            if browserless_url:
-                browser = await p.chromium.connect_over_cdp(browserless_url)
-            else:
-                browser = await p.chromium.launch(**launch)
-            ctx = await browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-                locale="en-US",
-            )
-            if use_stealth and STEALTH_AVAILABLE:
-                await Stealth().apply_stealth_async(ctx)
-            page = await ctx.new_page()
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(3)
-            html = await page.content()
-            await browser.close()
-        return html
+    async def _parse_html_async(self, html: str, url: str, meta: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        # Parsing is CPU-bound; keep it off the event loop (worker process, or a thread)
+        pool = get_parse_pool()
+        if pool is None:
+            return await asyncio.to_thread(self._parse_html, html, url, meta)
+        text, job = await pool.parse_job_async(html, url)
+        if job and meta is not None:
+            meta["job"] = job
+        return text
+
+    async def _scrape_with_requests_async(
+        self,
+        url: str,
+        meta: Optional[Dict[str, Any]] = None,
+        validators: Optional[Dict[str, str]] = None,
+    ) -> Optional[str]:
+        """Async version of _scrape_with_requests."""
+        try:
+            async with get_async_http_engine().stream(
+                url, timeout=15, headers=conditional_headers(validators) or None
+            ) as r:
+                if r.status_code == 304 and validators:
+                    if meta is not None:
+                        meta["not_modified"] = True
+                    return None
+                r.raise_for_status()
+                if meta is not None:
+                    meta["validators"] = response_validators(r.headers)
+                html = await self._read_body_async(r, meta)
+            text = await self._parse_html_async(html, url, meta)
+            if text and len(text) > 200:
+                return text
+        except Exception as e:
+            logger.debug(f"Async requests scrape failed: {e}")
+        return None
+
+    async def _scrape_with_ats_api_async(self, url: str, meta: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Async version of _scrape_with_ats_api."""
+        ref = self._ats_posting(url)
+        if ref is None:
+            return None
+        try:
+            r = await get_async_http_engine().get(ref.api_url, timeout=15, headers={"Accept": "application/json"})
+            r.raise_for_status()
+            return self._ats_text(ref, r.json(), meta)
+        except Exception as e:
+            logger.debug(f"Async {ref.site} API scrape failed: {e}")
+        return None
+
+    async def _scrape_with_scraper_api_async(self, url: str, meta: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Async version of _scrape_with_scraper_api."""
+        if not self.scraper_api_key:
+            return None
+        try:
+            async with get_async_http_engine().stream(self._scraper_api_url(url), timeout=60) as r:
+                r.raise_for_status()
+                html = await self._read_body_async(r, meta)
+            text = await self._parse_html_async(html, url, meta)
+            if text and len(text) > 200:
+                logger.info(f"ScraperAPI: extracted {len(text)} chars")
+                return text
+        except Exception as e:
+            logger.warning(f"ScraperAPI error: {e}")
+        return None
+
+    async def _scrape_with_playwright_async(self, url: str, meta: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        if not PLAYWRIGHT_AVAILABLE:
+            return None
+        try:
+            rendered = await self._playwright_async(url)
+            self._record_render(url, rendered, meta)
+            if rendered["html"]:
+                return await self._parse_html_async(rendered["html"], url, meta)
+        except Exception as e:
+            logger.warning(f"Playwright scrape failed: {e}")
+        return None
 
     def _scrape_with_selenium(self, url: str) -> Optional[str]:
         if not SELENIUM_AVAILABLE:
@@ -377,48 +1253,506 @@ class JobScraper:
         self,
         url: str,
         force_playwright: bool = False,
+        use_cache: bool = True,
     ) -> Dict:
         """
-        Scrape job description. Indeed/Greenhouse/Lever use requests; Glassdoor uses ScraperAPI or Playwright.
+        Scrape job description. Greenhouse/Lever postings come from their JSON board API;
+        Indeed (and those as fallback) use requests; Glassdoor uses ScraperAPI or Playwright.
+        Successful results are cached by canonical URL; a stale hit is returned immediately
+        and refreshed in the background. use_cache=False forces a live scrape.
         """
         logger.info(f"Scraping: {url}")
         site = self._detect_site(url)
         if site == "linkedin":
-            return {
-                "success": False,
-                "text": None,
-                "error": "LinkedIn is not supported. Use Indeed or Glassdoor job URLs.",
-                "url": url,
-            }
-        needs_js = site in self.JS_SITES
+            return self._unsupported_result(url)
+        if use_cache:
+            cached = self._cached_result(url, site)
+            if cached is not None:
+                return cached
+        result, shared = _scrape_flight.do(canonical_job_url(url), lambda: self._scrape_and_store(url, site))
+        return self._flight_result(url, result, shared)
+
+    async def scrape_async(self, url: str, use_cache: bool = True) -> Dict:
+        """
+        Async scrape on the shared httpx.AsyncClient and browser pool; same result shape,
+        provider order and caching as scrape(), without holding a thread while waiting.
+        """
+        logger.info(f"Scraping (async): {url}")
+        site = self._detect_site(url)
+        if site == "linkedin":
+            return self._unsupported_result(url)
+        if use_cache:
+            cached = self._cached_result(url, site)
+            if cached is not None:
+                return cached
+        result, shared = await _scrape_flight.do_async(
+            canonical_job_url(url), lambda: self._scrape_and_store_async(url, site)
+        )
+        return self._flight_result(url, result, shared)
+
+    @staticmethod
+    def _flight_result(url: str, result: Dict, shared: bool) -> Dict:
+        if not shared:
+            return result
+        # Joined another caller's scrape: own copy, own URL (may differ in tracking params)
+        logger.info(f"Coalesced scrape of {url} with one already in flight")
+        return {**result, "url": url, "coalesced": True}
+
+    def scrape_many(
+        self,
+        urls: List[str],
+        max_concurrency: Optional[int] = None,
+        per_domain: Optional[int] = None,
+        use_cache: bool = True,
+    ) -> List[Dict]:
+        """Scrape several URLs concurrently; results in input order (duplicates dropped)."""
+        by_url = {r["url"]: r for r in self.iter_scrape_many(urls, max_concurrency, per_domain, use_cache)}
+        return [by_url[url] for url in dedupe_job_urls(urls)]
+
+    def iter_scrape_many(
+        self,
+        urls: List[str],
+        max_concurrency: Optional[int] = None,
+        per_domain: Optional[int] = None,
+        use_cache: bool = True,
+    ) -> Iterator[Dict]:
+        """
+        Yield scrape results as they finish. At most max_concurrency URLs are in flight,
+        and at most per_domain for any one host (defaults: SCRAPE_BATCH_* config).
+        URLs are deduped by canonical form; each result carries method and latency_ms.
+        """
+        max_concurrency, per_domain = self._batch_limits(max_concurrency, per_domain)
+        queues: Dict[str, deque] = {}
+        for url in dedupe_job_urls(urls):
+            queues.setdefault(self._domain(url), deque()).append(url)
+        active: Dict[str, int] = {domain: 0 for domain in queues}
+        in_flight: Dict[Future, str] = {}
+        pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="scrape-batch")
+        try:
+            while queues or in_flight:
+                for domain in list(queues):
+                    queue = queues[domain]
+                    while queue and active[domain] < per_domain and len(in_flight) < max_concurrency:
+                        in_flight[pool.submit(self._timed_scrape, queue.popleft(), use_cache)] = domain
+                        active[domain] += 1
+                    if not queue:
+                        del queues[domain]
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    active[in_flight.pop(future)] -= 1
+                    yield future.result()
+        finally:
+            # Consumer stopped early: drop queued work, let running scrapes finish
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def scrape_many_async(
+        self,
+        urls: List[str],
+        max_concurrency: Optional[int] = None,
+        per_domain: Optional[int] = None,
+        use_cache: bool = True,
+    ) -> AsyncIterator[Dict]:
+        """Async generator version of iter_scrape_many (tasks on the running loop)."""
+        max_concurrency, per_domain = self._batch_limits(max_concurrency, per_domain)
+        batch_sem = asyncio.Semaphore(max_concurrency)
+        domain_sems: Dict[str, asyncio.Semaphore] = {}
+
+        async def run(url: str) -> Dict:
+            # Wait for the domain first so queued URLs don't hold a global slot
+            async with domain_sems.setdefault(self._domain(url), asyncio.Semaphore(per_domain)):
+                async with batch_sem:
+                    return await self._timed_scrape_async(url, use_cache)
+
+        tasks = [asyncio.ensure_future(run(url)) for url in dedupe_job_urls(urls)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _batch_limits(max_concurrency: Optional[int], per_domain: Optional[int]) -> Tuple[int, int]:
+        from model.utils.config import get_config
+        config = get_config()
+        return (
+            max(1, max_concurrency or config.SCRAPE_BATCH_CONCURRENCY),
+            max(1, per_domain or config.SCRAPE_BATCH_PER_DOMAIN),
+        )
 
-        # Indeed/Greenhouse/Lever: requests usually works
-        if not needs_js:
-            text = self._scrape_with_requests(url)
+    @staticmethod
+    def _domain(url: str) -> str:
+        return (urlparse(url).hostname or "").lower()
+
+    @staticmethod
+    def _batch_error_result(url: str, error: Exception) -> Dict:
+        logger.error(f"Batch scrape failed for {url}: {error}")
+        return {"success": False, "text": None, "error": f"Scraping failed: {error}", "url": url}
+
+    @staticmethod
+    def _with_latency(result: Dict, started: float) -> Dict:
+        latency_ms = round((time.perf_counter() - started) * 1000, 1)
+        return {**result, "method": result.get("method"), "latency_ms": latency_ms}
+
+    def _timed_scrape(self, url: str, use_cache: bool) -> Dict:
+        started = time.perf_counter()
+        try:
+            result = self.scrape(url, use_cache=use_cache)
+        except Exception as e:
+            result = self._batch_error_result(url, e)
+        return self._with_latency(result, started)
+
+    async def _timed_scrape_async(self, url: str, use_cache: bool) -> Dict:
+        started = time.perf_counter()
+        try:
+            result = await self.scrape_async(url, use_cache=use_cache)
+        except Exception as e:
+            result = self._batch_error_result(url, e)
+        return self._with_latency(result, started)
+
+    @staticmethod
+    def _unsupported_result(url: str) -> Dict:
+        return {
+            "success": False,
+            "text": None,
+            "error": "LinkedIn is not supported. Use Indeed or Glassdoor job URLs.",
+            "url": url,
+        }
+
+    @staticmethod
+    def _failure_result(url: str) -> Dict:
+        return {
+            "success": False,
+            "text": None,
+            "error": (
+                "Could not extract job description. Set one of: (1) SCRAPER_API_KEY (scraperapi.com, JS rendering), "
+                "(2) BROWSERLESS_URL (wss://chrome.browserless.io?token=YOUR_TOKEN). Or paste the job manually."
+            ),
+            "url": url,
+        }
+
+    def _cached_result(self, url: str, site: str) -> Optional[Dict]:
+        """Cached result for url, scheduling a background refresh when stale."""
+        if self.cache is None:
+            return None
+        hit = self.cache.get(url)
+        if hit is None:
+            return None
+        if hit.state == "stale":
+            entry = hit.entry
+            self.cache.revalidate(url, lambda: self._revalidate(url, site, entry))
+        logger.info(f"Scrape cache {hit.state} hit ({hit.age:.0f}s old): {url}")
+        return {**hit.value, "url": url, "cached": True, "cache_age_seconds": round(hit.age, 1)}
+
+    def _store_result(self, url: str, site: str, result: Dict, meta: Dict[str, Any]) -> None:
+        if result["success"] and self.cache is not None:
+            # Validators only describe the page when the plain GET produced the text
+            validators = meta.get("validators") if result.get("method") == "requests" else None
+            stored = {k: v for k, v in result.items() if k not in ("render", "hedged", "download")}  # per-scrape info
+            self.cache.set(url, stored, site, validators=validators or None)
+
+    def _scrape_and_store(self, url: str, site: str) -> Dict:
+        meta: Dict[str, Any] = {}
+        result = self._scrape_uncached(url, site, meta)
+        self._store_result(url, site, result, meta)
+        return result
+
+    async def _scrape_and_store_async(self, url: str, site: str) -> Dict:
+        meta: Dict[str, Any] = {}
+        result = await self._scrape_uncached_async(url, site, meta)
+        self._store_result(url, site, result, meta)
+        return result
+
+    def _revalidate(self, url: str, site: str, entry: Dict[str, Any]) -> Optional[Dict]:
+        """
+        Refresh a stale cache entry. With stored validators, a conditional GET that
+        returns 304 just re-stamps the entry (no download, no re-parse).
+        """
+        validators = entry.get("validators")
+        if validators:
+            meta: Dict[str, Any] = {}
+            text = self._scrape_with_requests(url, meta=meta, validators=validators)
+            if meta.get("not_modified"):
+                self.cache.touch(url)
+                return entry["value"]
             if text:
-                return {"success": True, "text": text, "method": "requests", "url": url}
+                result = self._success_result(url, text, "requests", meta)
+                self._store_result(url, site, result, meta)
+                return result
+        result = self._scrape_and_store(url, site)
+        return result if result["success"] else None
 
-        # LinkedIn/Glassdoor: try ScraperAPI (JS render) first, then Playwright, then requests
+    def _provider_chain(self, site: str, url: Optional[str] = None) -> List[str]:
+        """
+        Providers available for site, in default order. Greenhouse/Lever posting URLs start
+        with their JSON board API; Indeed/Greenhouse/Lever then use plain requests; JS sites
+        (Glassdoor) start with ScraperAPI/Playwright.
+        """
+        chain = [] if site in self.JS_SITES else ["requests"]
+        if url and self._ats_posting(url) is not None:
+            chain.insert(0, "ats_api")
         if self.scraper_api_key:
-            text = self._scrape_with_scraper_api(url)
-            if text:
-                return {"success": True, "text": text, "method": "scraperapi", "url": url}
+            chain.append("scraperapi")
         if self.use_playwright:
-            text = self._scrape_with_playwright(url)
-            if text:
-                return {"success": True, "text": text, "method": "playwright", "url": url}
-        text = self._scrape_with_requests(url)
-        if text:
-            return {"success": True, "text": text, "method": "requests", "url": url}
+            chain.append("playwright")
+        if "requests" not in chain:
+            chain.append("requests")
+        return chain
+
+    def _run_provider(self, provider: str, url: str, meta: Optional[Dict[str, Any]]) -> Optional[str]:
+        if provider == "ats_api":
+            return self._scrape_with_ats_api(url, meta=meta)
+        if provider == "scraperapi":
+            return self._scrape_with_scraper_api(url, meta=meta)
+        if provider == "playwright":
+            return self._scrape_with_playwright(url, meta=meta)
+        return self._scrape_with_requests(url, meta=meta)
+
+    async def _run_provider_async(self, provider: str, url: str, meta: Optional[Dict[str, Any]]) -> Optional[str]:
+        if provider == "ats_api":
+            return await self._scrape_with_ats_api_async(url, meta=meta)
+        if provider == "scraperapi":
+            return await self._scrape_with_scraper_api_async(url, meta=meta)
+        if provider == "playwright":
+            return await self._scrape_with_playwright_async(url, meta=meta)
+        return await self._scrape_with_requests_async(url, meta=meta)
+
+    @staticmethod
+    def _success_result(url: str, text: str, provider: str, meta: Optional[Dict[str, Any]]) -> Dict:
+        result = {"success": True, "text": text, "method": provider, "url": url}
+        if meta and meta.get("job"):
+            result["job"] = meta["job"]  # JobPosting structured data (title, company, location, ...)
+        if meta and meta.get("download") and provider != "playwright":
+            result["download"] = meta["download"]  # bytes read / stripped for this scrape
+        if provider == "playwright" and meta and meta.get("render"):
+            result["render"] = meta["render"]  # blocked requests / bytes and wait time saved
+        return result
 
+    def _plan_providers(self, url: str, site: str) -> Tuple[str, List[str], List[str]]:
+        """(domain, providers ordered by domain health, providers skipped by open breakers)."""
+        domain = self._domain(url)
+        chain = self._provider_chain(site, url)
+        ordered = self.health.order(domain, chain)
+        return domain, ordered, [p for p in chain if p not in ordered]
+
+    def _circuit_open_result(self, url: str, domain: str, skipped: List[str]) -> Dict:
+        logger.warning(f"All providers circuit-open for {domain}: {skipped}")
         return {
             "success": False,
             "text": None,
             "error": (
-                "Could not extract job description. Set one of: (1) SCRAPER_API_KEY (scraperapi.com, JS rendering), "
-                "(2) BROWSERLESS_URL (wss://chrome.browserless.io?token=YOUR_TOKEN). Or paste the job manually."
+                f"Scraping {domain} is temporarily paused after repeated failures "
+                f"({', '.join(skipped)}). Try again in a few minutes or paste the job manually."
             ),
             "url": url,
+            "circuit_open": skipped,
+        }
+
+    def _attempt(self, domain: str, provider: str, url: str, meta: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Run one provider and record the outcome in domain health."""
+        started = time.perf_counter()
+        text = None
+        try:
+            text = self._run_provider(provider, url, meta)
+        except Exception as e:
+            logger.warning(f"{provider} failed for {url}: {e}")
+        finally:
+            self.health.record(domain, provider, bool(text), (time.perf_counter() - started) * 1000)
+        return text
+
+    async def _attempt_async(self, domain: str, provider: str, url: str, meta: Optional[Dict[str, Any]]) -> Optional[str]:
+        started = time.perf_counter()
+        text = None
+        try:
+            text = await self._run_provider_async(provider, url, meta)
+        except asyncio.CancelledError:
+            # Cancelled hedge loser: no verdict on the provider
+            self.health.release(domain, provider)
+            raise
+        except Exception as e:
+            logger.warning(f"{provider} failed for {url}: {e}")
+        self.health.record(domain, provider, bool(text), (time.perf_counter() - started) * 1000)
+        return text
+
+    def _scrape_uncached(self, url: str, site: str, meta: Optional[Dict[str, Any]] = None) -> Dict:
+        """Run the provider chain for url (no cache), best provider for the domain first."""
+        if self.hedge and site in self.HEDGED_SITES:
+            return self._scrape_hedged(url, site, meta)
+        domain, providers, skipped = self._plan_providers(url, site)
+        attempted = False
+        for provider in providers:
+            if not self.health.acquire(domain, provider):
+                continue
+            attempted = True
+            text = self._attempt(domain, provider, url, meta)
+            if text:
+                return self._success_result(url, text, provider, meta)
+        if not attempted and skipped:
+            return self._circuit_open_result(url, domain, skipped)
+        return self._failure_result(url)
+
+    async def _scrape_uncached_async(self, url: str, site: str, meta: Optional[Dict[str, Any]] = None) -> Dict:
+        """Async provider chain; same ordering and breaker as _scrape_uncached."""
+        if self.hedge and site in self.HEDGED_SITES:
+            return await self._scrape_hedged_async(url, site, meta)
+        domain, providers, skipped = self._plan_providers(url, site)
+        attempted = False
+        for provider in providers:
+            if not self.health.acquire(domain, provider):
+                continue
+            attempted = True
+            text = await self._attempt_async(domain, provider, url, meta)
+            if text:
+                return self._success_result(url, text, provider, meta)
+        if not attempted and skipped:
+            return self._circuit_open_result(url, domain, skipped)
+        return self._failure_result(url)
+
+    # ---- hedged mode (Glassdoor / generic): requests first, slower providers raced after a delay ----
+
+    @staticmethod
+    def _usable(text: Optional[str]) -> bool:
+        # _parse_html already returns None for login walls
+        return bool(text) and len(text) > HEDGE_MIN_TEXT_CHARS
+
+    def _hedge_plan(self, url: str, site: str) -> Tuple[str, List[str], List[str]]:
+        domain, providers, skipped = self._plan_providers(url, site)
+        if "requests" in providers:
+            providers = ["requests"] + [p for p in providers if p != "requests"]
+        return domain, providers, skipped
+
+    def _hedged_result(
+        self,
+        url: str,
+        domain: str,
+        started: List[str],
+        skipped: List[str],
+        winner: Optional[Tuple[str, str, Dict[str, Any]]],
+        meta: Optional[Dict[str, Any]],
+        timed_out: bool,
+    ) -> Dict:
+        if winner is not None:
+            provider, text, provider_meta = winner
+            if meta is not None:
+                meta.update(provider_meta)
+            result = self._success_result(url, text, provider, provider_meta)
+        elif not started and skipped:
+            result = self._circuit_open_result(url, domain, skipped)
+        elif timed_out:
+            result = {
+                "success": False,
+                "text": None,
+                "error": f"No provider returned the job description within {self.deadline:.0f}s. Paste the job manually.",
+                "url": url,
+                "deadline_exceeded": True,
+            }
+        else:
+            result = self._failure_result(url)
+        result["hedged"] = started
+        return result
+
+    def _scrape_hedged(self, url: str, site: str, meta: Optional[Dict[str, Any]] = None) -> Dict:
+        """
+        requests starts immediately; each further provider starts when the ones in flight
+        have not produced usable text within hedge_delay (or have all failed). First usable
+        text wins, everything runs under one deadline. Losers still running on a thread
+        finish in the background (their outcome still feeds provider health).
+        """
+        domain, queue, skipped = self._hedge_plan(url, site)
+        deadline = time.monotonic() + self.deadline
+        pending: Dict[Future, Tuple[str, Dict[str, Any]]] = {}
+        started: List[str] = []
+        winner = None
+        next_hedge_at = 0.0
+        while winner is None:
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            if queue and (not pending or now >= next_hedge_at):
+                provider = queue.pop(0)
+                if self.health.acquire(domain, provider):
+                    provider_meta: Dict[str, Any] = {}
+                    future = _hedge_executor.submit(self._attempt, domain, provider, url, provider_meta)
+                    pending[future] = (provider, provider_meta)
+                    started.append(provider)
+                    next_hedge_at = now + self.hedge_delay
+                continue
+            if not pending:
+                break
+            timeout = deadline - now
+            if queue:
+                timeout = min(timeout, next_hedge_at - now)
+            done, _ = wait(pending, timeout=max(0.0, timeout), return_when=FIRST_COMPLETED)
+            for future in done:
+                provider, provider_meta = pending.pop(future)
+                text = future.result()
+                if winner is None and self._usable(text):
+                    winner = (provider, text, provider_meta)
+        for future, (provider, _) in pending.items():
+            if future.cancel():  # only attempts that have not started yet can be stopped
+                self.health.release(domain, provider)
+        return self._hedged_result(url, domain, started, skipped, winner, meta, winner is None and time.monotonic() >= deadline)
+
+    async def _scrape_hedged_async(self, url: str, site: str, meta: Optional[Dict[str, Any]] = None) -> Dict:
+        """Async hedged mode; losing providers are cancelled as soon as a winner is found."""
+        domain, queue, skipped = self._hedge_plan(url, site)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.deadline
+        pending: Dict[asyncio.Task, Tuple[str, Dict[str, Any]]] = {}
+        started: List[str] = []
+        winner = None
+        next_hedge_at = 0.0
+        try:
+            while winner is None:
+                now = loop.time()
+                if now >= deadline:
+                    break
+                if queue and (not pending or now >= next_hedge_at):
+                    provider = queue.pop(0)
+                    if self.health.acquire(domain, provider):
+                        provider_meta: Dict[str, Any] = {}
+                        task = asyncio.ensure_future(self._attempt_async(domain, provider, url, provider_meta))
+                        pending[task] = (provider, provider_meta)
+                        started.append(provider)
+                        next_hedge_at = now + self.hedge_delay
+                    continue
+                if not pending:
+                    break
+                timeout = deadline - now
+                if queue:
+                    timeout = min(timeout, next_hedge_at - now)
+                done, _ = await asyncio.wait(pending, timeout=max(0.0, timeout), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    provider, provider_meta = pending.pop(task)
+                    text = task.result()
+                    if winner is None and self._usable(text):
+                        winner = (provider, text, provider_meta)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        return self._hedged_result(url, domain, started, skipped, winner, meta, winner is None and loop.time() >= deadline)
+
+    def connection_stats(self) -> Dict[str, Any]:
+        """Keep-alive reuse on this instance's session: requests sent vs connections opened."""
+        requests_sent = connections = hosts = 0
+        for adapter in {id(a): a for a in self.session.adapters.values()}.values():
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                hosts += 1
+                requests_sent += pool.num_requests
+                connections += pool.num_connections
+        return {
+            "pool_maxsize": self.pool_maxsize,
+            "hosts": hosts,
+            "requests": requests_sent,
+            "connections_opened": connections,
+            "reused": max(0, requests_sent - connections),
+            "reuse_ratio": round(1 - connections / requests_sent, 3) if requests_sent else None,
         }
 
     def close(self):
@@ -426,8 +1760,6 @@ class JobScraper:
             self.driver.quit()
             self.driver = None
         self.session.close()
-        if hasattr(self, "executor"):
-            self.executor.shutdown(wait=False)
 
     def __enter__(self):
         return self
@@ -437,20 +1769,63 @@ class JobScraper:
         return False
 
 
+# Process-wide scrapers for the module-level entry points, one per provider setup, so every
+# call reuses the same pooled session instead of paying a new TCP/TLS handshake
+_shared_scrapers: Dict[Tuple[bool, Optional[str]], JobScraper] = {}
+_shared_scrapers_lock = threading.Lock()
+
+
+def get_job_scraper(use_playwright: bool = True, scraper_api_key: Optional[str] = None) -> JobScraper:
+    """Shared JobScraper for (use_playwright, ScraperAPI key). Do not close it; see close_job_scrapers()."""
+    key = (bool(use_playwright), scraper_api_key or None)
+    scraper = _shared_scrapers.get(key)
+    if scraper is None:
+        with _shared_scrapers_lock:
+            scraper = _shared_scrapers.get(key)
+            if scraper is None:
+                scraper = _shared_scrapers[key] = JobScraper(
+                    use_selenium=False,
+                    use_playwright=use_playwright,
+                    scraper_api_key=scraper_api_key,
+                )
+    return scraper
+
+
+def job_scraper_stats() -> Dict[str, Any]:
+    """Connection reuse per shared scraper (does not create one)."""
+    with _shared_scrapers_lock:
+        scrapers = dict(_shared_scrapers)
+    return {
+        f"playwright={p},scraperapi={k is not None}".lower(): scraper.connection_stats()
+        for (p, k), scraper in scrapers.items()
+    }
+
+
+def close_job_scrapers() -> None:
+    """Close the shared scrapers' sessions (app shutdown)."""
+    with _shared_scrapers_lock:
+        scrapers = list(_shared_scrapers.values())
+        _shared_scrapers.clear()
+    for scraper in scrapers:
+        scraper.close()
+
+
 async def scrape_job_description_async(
     url: str,
     use_selenium: bool = False,
     use_playwright: bool = True,
     scraper_api_key: Optional[str] = None,
 ) -> str:
-    """Async version. Raises ValueError on failure."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        None,
-        lambda: scrape_job_description(
-            url, use_selenium, use_playwright, scraper_api_key
-        ),
-    )
+    """Async version (native httpx/browser-pool I/O). Raises ValueError on failure."""
+    key = scraper_api_key or os.getenv("SCRAPER_API_KEY")
+    if use_selenium:  # a WebDriver can't be shared between threads
+        with JobScraper(use_selenium=True, use_playwright=use_playwright, scraper_api_key=key) as scraper:
+            result = await scraper.scrape_async(url)
+    else:
+        result = await get_job_scraper(use_playwright, key).scrape_async(url)
+    if result["success"]:
+        return result["text"]
+    raise ValueError(result.get("error", "Scraping failed"))
 
 
 def scrape_job_description(
@@ -461,15 +1836,11 @@ def scrape_job_description(
 ) -> str:
     """Convenience function. Raises ValueError on failure."""
     key = scraper_api_key or os.getenv("SCRAPER_API_KEY")
-    scraper = JobScraper(
-        use_selenium=use_selenium,
-        use_playwright=use_playwright,
-        scraper_api_key=key,
-    )
-    try:
-        result = scraper.scrape(url)
-        if result["success"]:
-            return result["text"]
-        raise ValueError(result.get("error", "Scraping failed"))
-    finally:
-        scraper.close()
+    if use_selenium:  # a WebDriver can't be shared between threads
+        with JobScraper(use_selenium=True, use_playwright=use_playwright, scraper_api_key=key) as scraper:
+            result = scraper.scrape(url)
+    else:
+        result = get_job_scraper(use_playwright, key).scrape(url)
+    if result["success"]:
+        return result["text"]
+    raise ValueError(result.get("error", "Scraping failed"))
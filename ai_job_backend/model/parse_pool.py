@@ -0,0 +1,195 @@
+"""
+Worker processes for CPU-bound HTML parsing.
+
+Job-page extraction (structured data, selectors, _clean_text) and the discovery card
+walkers hold the GIL: in the API process they serialize against every other request.
+With PARSE_POOL_WORKERS > 0 they run in a ProcessPoolExecutor instead. HTML goes in as
+UTF-8 bytes; (text, job fields) or card lists come back. Workers are spawned and
+pre-warmed (imports, parser backend, compiled selector plans) when the pool starts.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# ---- worker side ----
+
+_worker_scraper = None
+
+# One URL per site so every selector plan is compiled during warm-up
+_WARM_URLS = (
+    "https://www.indeed.com/viewjob?jk=warm",
+    "https://boards.greenhouse.io/warm/jobs/1",
+    "https://jobs.lever.co/warm/1",
+    "https://www.glassdoor.com/job-listing/warm",
+    "https://careers.example.com/jobs/warm",
+)
+_WARM_HTML = "<html><body><main><div class='description'>" + "warm up text " * 60 + "</div></main></body></html>"
+
+
+def _init_worker() -> None:
+    global _worker_scraper
+    from model.job_scraper import JobScraper
+    _worker_scraper = JobScraper(use_playwright=False, use_cache=False)
+
+
+def _warm(_: int) -> int:
+    """Run each site's extraction once (selector plans compiled, regexes cached)."""
+    for url in _WARM_URLS:
+        _worker_scraper._parse_page(_WARM_HTML, url)
+    time.sleep(0.05)  # keep this worker busy so the next warm task lands on another one
+    return os.getpid()
+
+
+def _parse_job(html: bytes, url: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    return _worker_scraper._parse_page(html.decode("utf-8", "replace"), url)
+
+
+def _parse_cards(parser_name: str, html: bytes) -> List[Dict[str, Any]]:
+    from model import job_discovery
+    return job_discovery.CARD_PARSERS[parser_name](html.decode("utf-8", "replace"))
+
+
+# ---- API side ----
+
+class ParsePool:
+    """
+    Spawned worker processes for parsing. A crashed worker (BrokenProcessPool) rebuilds
+    the pool once and retries the parse.
+    """
+
+    def __init__(self, workers: int, warm: bool = True):
+        self.workers = max(1, workers)
+        self._lock = threading.Lock()
+        self._executor = self._new_executor()
+        self.submitted = 0
+        self.failed = 0
+        self.restarts = 0
+        self.worker_pids: List[int] = []
+        self.warm_ms: Optional[float] = None
+        if warm:
+            self.warm()
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # spawn, not fork: the API process has threads, sockets and SQLite handles
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+
+    def warm(self) -> None:
+        """Start every worker and run one parse per site in it."""
+        started = time.perf_counter()
+        futures = [self._executor.submit(_warm, i) for i in range(self.workers)]
+        self.worker_pids = sorted({f.result() for f in futures})
+        self.warm_ms = round((time.perf_counter() - started) * 1000, 1)
+        logger.info(f"Parse pool ready: {len(self.worker_pids)} workers in {self.warm_ms:.0f} ms")
+
+    def _submit(self, fn: Callable, *args: Any) -> Future:
+        with self._lock:
+            self.submitted += 1
+            return self._executor.submit(fn, *args)
+
+    def _restart(self, broken: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is broken:
+                logger.error("Parse pool worker died; restarting the pool")
+                self.restarts += 1
+                self._executor = self._new_executor()
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def _call(self, fn: Callable, *args: Any) -> Any:
+        executor = self._executor
+        try:
+            return self._submit(fn, *args).result()
+        except BrokenProcessPool:
+            self._restart(executor)
+        except Exception:
+            self.failed += 1
+            raise
+        try:
+            return self._submit(fn, *args).result()
+        except Exception:
+            self.failed += 1
+            raise
+
+    async def _call_async(self, fn: Callable, *args: Any) -> Any:
+        executor = self._executor
+        try:
+            return await asyncio.wrap_future(self._submit(fn, *args))
+        except BrokenProcessPool:
+            self._restart(executor)
+        except Exception:
+            self.failed += 1
+            raise
+        try:
+            return await asyncio.wrap_future(self._submit(fn, *args))
+        except Exception:
+            self.failed += 1
+            raise
+
+    def parse_job(self, html: str, url: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """JobScraper._parse_page in a worker: (text, structured job fields)."""
+        return self._call(_parse_job, html.encode("utf-8"), url)
+
+    async def parse_job_async(self, html: str, url: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        return await self._call_async(_parse_job, html.encode("utf-8"), url)
+
+    def parse_cards(self, parser_name: str, html: str) -> List[Dict[str, Any]]:
+        """A job_discovery card parser (by its CARD_PARSERS name) in a worker."""
+        return self._call(_parse_cards, parser_name, html.encode("utf-8"))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "worker_pids": self.worker_pids,
+            "warm_ms": self.warm_ms,
+            "submitted": self.submitted,
+            "failed": self.failed,
+            "restarts": self.restarts,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+_parse_pool: Optional[ParsePool] = None
+_parse_pool_lock = threading.Lock()
+
+
+def get_parse_pool() -> Optional[ParsePool]:
+    """Process-wide ParsePool with PARSE_POOL_WORKERS workers; None when disabled (parse in-thread)."""
+    global _parse_pool
+    if _parse_pool is not None:
+        return _parse_pool
+    from model.utils.config import get_config
+    workers = get_config().PARSE_POOL_WORKERS
+    if workers <= 0:
+        return None
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ParsePool(workers)
+        return _parse_pool
+
+
+def parse_pool_stats() -> Dict[str, Any]:
+    """Stats of the shared pool without starting it."""
+    return _parse_pool.stats() if _parse_pool is not None else {}
+
+
+def close_parse_pool() -> None:
+    """Stop the worker processes (app shutdown)."""
+    global _parse_pool
+    with _parse_pool_lock:
+        pool, _parse_pool = _parse_pool, None
+    if pool is not None:
+        pool.shutdown()
@@ -3,13 +3,34 @@ Database function to retrieve a user's profile.
 Used by the agent as a tool to get profile data for tailored answers.
 """
 
+import logging
 import os
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+
+def _joined(value: Any) -> str:
+    return ", ".join(str(v) for v in value) if isinstance(value, list) else str(value or "")
+
+
+def _search_fields(prefs: Dict[str, Any], personal: Dict[str, Any]) -> Dict[str, str]:
+    """
+    current_title / skills / location that job searches are built from. Shared by the
+    per-user profile and the crawler's preference profiles so both search the same
+    (query, location): the personal location wins over the preferred locations.
+    """
+    locations = prefs.get("locations") or []
+    return {
+        "current_title": _joined(prefs.get("roles") or []),
+        "skills": _joined(prefs.get("skills_prefer") or []),
+        "location": personal.get("location") or (_joined(locations) if isinstance(locations, list) else ""),
+    }
+
 
 def get_user_profile_from_db(user_id: str) -> Dict[str, Any]:
     """
@@ -85,14 +106,8 @@ def get_user_profile_from_db(user_id: str) -> Dict[str, Any]:
     email = personal.get("email") or profile.get("email") or ""
     name = f"{first} {last}".strip() or (email.split("@")[0] if email else "")
 
-    roles = prefs.get("roles") or []
-    roles_str = ", ".join(str(r) for r in roles) if isinstance(roles, list) else str(roles)
-    skills = prefs.get("skills_prefer") or []
-    skills_str = ", ".join(str(s) for s in skills) if isinstance(skills, list) else str(skills)
-    locations = prefs.get("locations") or []
-    loc_str = personal.get("location") or (
-        ", ".join(str(l) for l in locations) if isinstance(locations, list) else ""
-    )
+    search = _search_fields(prefs, personal)
+    roles_str, skills_str, loc_str = search["current_title"], search["skills"], search["location"]
 
     work_history = personal.get("work_history_summary") or roles_str or "Not in database"
     education = personal.get("education_summary") or ""
@@ -111,3 +126,40 @@ def get_user_profile_from_db(user_id: str) -> Dict[str, Any]:
         "interests": interests,
         "industries_prefer": industries_prefer if isinstance(industries_prefer, list) else [],
     }
+
+
+def get_preference_profiles(limit: int = 50) -> List[Dict[str, Any]]:
+    """
+    Search preferences of up to limit users (user_preferences: roles, skills, locations;
+    user_personal_info: location), most recently updated first, with the same current_title /
+    skills / location as get_user_profile_from_db. Empty when Supabase is not configured or
+    the query fails.
+    """
+    url = os.getenv("SUPABASE_URL") or os.getenv("NEXT_PUBLIC_SUPABASE_URL")
+    key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+    if not url or not key or limit <= 0:
+        return []
+    try:
+        from supabase import create_client
+        client = create_client(url, key)
+        res = (
+            client.table("user_preferences")
+            .select("user_id, roles, skills_prefer, locations")
+            .order("updated_at", desc=True)
+            .limit(limit)
+            .execute()
+        )
+        rows = res.data or []
+        user_ids = [row["user_id"] for row in rows if row.get("user_id")]
+        personal_res = (
+            client.table("user_personal_info")
+            .select("user_id, location")
+            .in_("user_id", user_ids)
+            .execute()
+        ) if user_ids else None
+    except Exception as e:
+        logger.warning("Preference lookup for crawler failed: %s", e)
+        return []
+
+    personal = {row["user_id"]: row for row in (personal_res.data if personal_res else None) or []}
+    return [_search_fields(row, personal.get(row.get("user_id"), {})) for row in rows]
@@ -0,0 +1,200 @@
+"""
+Per-domain provider health for the job scraper.
+
+Every provider attempt (requests, scraperapi, playwright) is recorded per domain:
+success rate and an EWMA of latency decide the order providers are tried in.
+A circuit breaker per (domain, provider) skips providers that keep failing:
+- closed -> open after FAILURES failures within WINDOW seconds
+- open -> half-open after COOLDOWN seconds; one probe request is let through
+- probe success closes the breaker, probe failure re-opens it
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from model.utils.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _ProviderStat:
+    """Counters and breaker state for one provider on one domain."""
+
+    __slots__ = (
+        "attempts", "successes", "failures", "latency_ms",
+        "recent_failures", "state", "opened_at", "probing", "trips",
+    )
+
+    def __init__(self):
+        self.attempts = 0
+        self.successes = 0
+        self.failures = 0
+        self.latency_ms: Optional[float] = None  # EWMA
+        self.recent_failures: deque = deque()
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.probing = False
+        self.trips = 0
+
+    @property
+    def success_rate(self) -> float:
+        # Laplace-smoothed: an untried provider scores 0.5
+        return (self.successes + 1) / (self.attempts + 2)
+
+
+class ProviderHealth:
+    """
+    Thread-safe provider stats + circuit breakers, keyed by domain (LRU-bounded).
+    One instance is shared per process (see get_provider_health).
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        window_seconds: float = 300.0,
+        cooldown_seconds: float = 120.0,
+        max_domains: int = 512,
+        latency_alpha: float = 0.3,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.window_seconds = window_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.latency_alpha = latency_alpha
+        self._clock = clock
+        self._domains = LRUCache(max_domains)
+        self._lock = threading.Lock()
+
+    def _stat(self, domain: str, provider: str) -> _ProviderStat:
+        providers = self._domains.get(domain)
+        if providers is None:
+            providers = {}
+            self._domains.set(domain, providers)
+        stat = providers.get(provider)
+        if stat is None:
+            stat = providers[provider] = _ProviderStat()
+        return stat
+
+    def _refresh_state(self, stat: _ProviderStat, now: float) -> str:
+        if stat.state == OPEN and now - stat.opened_at >= self.cooldown_seconds:
+            stat.state = HALF_OPEN
+            stat.probing = False
+        return stat.state
+
+    def order(self, domain: str, providers: Sequence[str]) -> List[str]:
+        """
+        Providers to try for domain, best first: higher success rate, then lower
+        latency; ties keep the given order. Providers with an open breaker are left out.
+        """
+        with self._lock:
+            now = self._clock()
+            ranked = []
+            for index, provider in enumerate(providers):
+                stat = self._stat(domain, provider)
+                state = self._refresh_state(stat, now)
+                if state == OPEN or (state == HALF_OPEN and stat.probing):
+                    continue
+                ranked.append((-round(stat.success_rate, 1), stat.latency_ms or 0.0, index, provider))
+            ranked.sort()
+            return [provider for *_, provider in ranked]
+
+    def acquire(self, domain: str, provider: str) -> bool:
+        """True if provider may run now; claims the single half-open probe slot."""
+        with self._lock:
+            stat = self._stat(domain, provider)
+            state = self._refresh_state(stat, self._clock())
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not stat.probing:
+                stat.probing = True
+                return True
+            return False
+
+    def release(self, domain: str, provider: str) -> None:
+        """Give back an acquired slot without a verdict (attempt cancelled before it finished)."""
+        with self._lock:
+            self._stat(domain, provider).probing = False
+
+    def record(self, domain: str, provider: str, success: bool, latency_ms: float) -> None:
+        """Record one attempt; trips or resets the breaker."""
+        with self._lock:
+            now = self._clock()
+            stat = self._stat(domain, provider)
+            stat.attempts += 1
+            if stat.latency_ms is None:
+                stat.latency_ms = latency_ms
+            else:
+                stat.latency_ms += self.latency_alpha * (latency_ms - stat.latency_ms)
+            if success:
+                stat.successes += 1
+                stat.recent_failures.clear()
+                stat.state = CLOSED
+                stat.probing = False
+                return
+            stat.failures += 1
+            stat.recent_failures.append(now)
+            while stat.recent_failures and now - stat.recent_failures[0] > self.window_seconds:
+                stat.recent_failures.popleft()
+            if stat.state == HALF_OPEN or len(stat.recent_failures) >= self.failure_threshold:
+                if stat.state != OPEN:
+                    logger.warning(f"Circuit open for {provider} on {domain} ({len(stat.recent_failures)} recent failures)")
+                    stat.trips += 1
+                stat.state = OPEN
+                stat.opened_at = now
+                stat.probing = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = self._clock()
+            domains = {}
+            for domain, providers in self._domains.items():
+                domains[domain] = {
+                    provider: {
+                        "state": self._refresh_state(stat, now),
+                        "attempts": stat.attempts,
+                        "successes": stat.successes,
+                        "failures": stat.failures,
+                        "success_rate": round(stat.success_rate, 3),
+                        "latency_ms": round(stat.latency_ms, 1) if stat.latency_ms is not None else None,
+                        "recent_failures": len(stat.recent_failures),
+                        "trips": stat.trips,
+                    }
+                    for provider, stat in providers.items()
+                }
+        return {
+            "failure_threshold": self.failure_threshold,
+            "window_seconds": self.window_seconds,
+            "cooldown_seconds": self.cooldown_seconds,
+            "domains": domains,
+        }
+
+
+_provider_health: Optional[ProviderHealth] = None
+_provider_health_lock = threading.Lock()
+
+
+def get_provider_health() -> ProviderHealth:
+    """Process-wide ProviderHealth configured from PROVIDER_BREAKER_* settings."""
+    global _provider_health
+    with _provider_health_lock:
+        if _provider_health is None:
+            from model.utils.config import get_config
+            config = get_config()
+            _provider_health = ProviderHealth(
+                failure_threshold=config.PROVIDER_BREAKER_FAILURES,
+                window_seconds=config.PROVIDER_BREAKER_WINDOW,
+                cooldown_seconds=config.PROVIDER_BREAKER_COOLDOWN,
+            )
+        return _provider_health
+
+
+def provider_health_stats() -> Dict[str, Any]:
+    """Stats of the shared instance without creating it."""
+    return _provider_health.stats() if _provider_health is not None else {}
@@ -0,0 +1,316 @@
+"""
+Two-tier cache for scraped job postings.
+
+Tier 1: in-process LRU (microseconds). Tier 2: zlib-compressed JSON rows in SQLite
+(survives restarts, shared by workers on the same disk). Keys are canonical job URLs,
+so tracking-param variants of one posting share an entry.
+
+Entries have a per-site TTL; after it expires they are still served for STALE_TTL
+seconds while a background refresh runs (stale-while-revalidate).
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+from model.utils.cache import LRUCache
+from model.utils.urls import canonical_job_url
+
+logger = logging.getLogger(__name__)
+
+
+class CacheLookup(NamedTuple):
+    value: Dict[str, Any]
+    state: str          # "fresh" | "stale"
+    age: float          # seconds since stored
+    entry: Dict[str, Any]
+
+
+class ScrapeCache:
+    """
+    LRU in front of a compressed SQLite store, keyed by canonical job URL.
+    Thread-safe; one instance is shared per process (see get_scrape_cache).
+    """
+
+    # Seconds a scraped posting is considered fresh, per site. JS-rendered sites cost
+    # ScraperAPI credits / browser time, so they are kept longer.
+    SITE_TTLS = {
+        "indeed": 6 * 3600,
+        "glassdoor": 12 * 3600,
+        "greenhouse": 12 * 3600,
+        "lever": 12 * 3600,
+        "generic": 3 * 3600,
+    }
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        memory_entries: int = 256,
+        disk_max_entries: int = 5000,
+        default_ttl: int = 6 * 3600,
+        stale_ttl: int = 24 * 3600,
+        site_ttls: Optional[Dict[str, int]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.site_ttls = {**self.SITE_TTLS, **(site_ttls or {})}
+        self.disk_max_entries = disk_max_entries
+        self._clock = clock
+        self._memory = LRUCache(memory_entries)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_failed = False
+        self._db_lock = threading.Lock()
+        self._refreshing: set = set()
+        self._refresh_lock = threading.Lock()
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._writes_since_prune = 0
+        self._counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stale_hits": 0,
+            "expired": 0,
+            "sets": 0,
+            "disk_evictions": 0,
+            "revalidations": 0,
+            "revalidation_failures": 0,
+            "not_modified": 0,
+        }
+
+    # ---- disk tier ----
+
+    def _db(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None or self._disk_failed or not self.path:
+            return self._conn
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS scrape_cache ("
+                " key TEXT PRIMARY KEY, site TEXT, stored_at REAL NOT NULL, payload BLOB NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_scrape_cache_stored ON scrape_cache(stored_at)")
+            conn.commit()
+            self._conn = conn
+        except Exception as e:
+            logger.warning("Scrape cache: disk tier disabled (%s): %s", self.path, e)
+            self._disk_failed = True
+        return self._conn
+
+    @staticmethod
+    def _encode(entry: Dict[str, Any]) -> bytes:
+        return zlib.compress(json.dumps(entry, separators=(",", ":")).encode("utf-8"), 6)
+
+    @staticmethod
+    def _decode(blob: bytes) -> Dict[str, Any]:
+        return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+    def _disk_get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._db_lock:
+            conn = self._db()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute("SELECT payload FROM scrape_cache WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error as e:
+                logger.debug("Scrape cache read failed: %s", e)
+                return None
+        return self._decode(row[0]) if row else None
+
+    def _disk_set(self, key: str, entry: Dict[str, Any]) -> None:
+        blob = self._encode(entry)
+        with self._db_lock:
+            conn = self._db()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO scrape_cache (key, site, stored_at, payload) VALUES (?, ?, ?, ?)",
+                    (key, entry.get("site"), entry["stored_at"], sqlite3.Binary(blob)),
+                )
+                self._writes_since_prune += 1
+                if self._writes_since_prune >= 100:
+                    self._prune_locked(conn)
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.debug("Scrape cache write failed: %s", e)
+
+    def _disk_delete(self, key: str) -> None:
+        with self._db_lock:
+            conn = self._db()
+            if conn is None:
+                return
+            try:
+                conn.execute("DELETE FROM scrape_cache WHERE key = ?", (key,))
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def _prune_locked(self, conn: sqlite3.Connection) -> None:
+        """Drop rows past their stale window, then the oldest rows over disk_max_entries."""
+        self._writes_since_prune = 0
+        horizon = self._clock() - max(self.site_ttls.values(), default=self.default_ttl) - self.stale_ttl
+        cur = conn.execute("DELETE FROM scrape_cache WHERE stored_at < ?", (horizon,))
+        removed = cur.rowcount or 0
+        (count,) = conn.execute("SELECT COUNT(*) FROM scrape_cache").fetchone()
+        if count > self.disk_max_entries:
+            cur = conn.execute(
+                "DELETE FROM scrape_cache WHERE key IN ("
+                " SELECT key FROM scrape_cache ORDER BY stored_at ASC LIMIT ?)",
+                (count - self.disk_max_entries,),
+            )
+            removed += cur.rowcount or 0
+        self._counters["disk_evictions"] += removed
+
+    # ---- public API ----
+
+    def ttl_for(self, site: Optional[str]) -> int:
+        return self.site_ttls.get(site or "", self.default_ttl)
+
+    def get(self, url: str) -> Optional[CacheLookup]:
+        """Return a fresh or stale-but-servable entry, or None on miss/expiry."""
+        key = canonical_job_url(url)
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._counters["memory_hits"] += 1
+        else:
+            entry = self._disk_get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["disk_hits"] += 1
+            self._memory.set(key, entry)
+        age = self._clock() - entry["stored_at"]
+        ttl = entry.get("ttl") or self.ttl_for(entry.get("site"))
+        if age < ttl:
+            return CacheLookup(entry["value"], "fresh", age, entry)
+        if age < ttl + self.stale_ttl:
+            self._counters["stale_hits"] += 1
+            return CacheLookup(entry["value"], "stale", age, entry)
+        self._counters["expired"] += 1
+        self.invalidate(url)
+        return None
+
+    def set(self, url: str, value: Dict[str, Any], site: Optional[str] = None, **extra: Any) -> None:
+        """Store a successful scrape result. extra is kept on the entry (not in value)."""
+        key = canonical_job_url(url)
+        entry = {
+            "value": value,
+            "site": site,
+            "stored_at": self._clock(),
+            "ttl": self.ttl_for(site),
+            **extra,
+        }
+        self._memory.set(key, entry)
+        self._disk_set(key, entry)
+        self._counters["sets"] += 1
+
+    def touch(self, url: str) -> bool:
+        """Re-stamp an entry as fresh (origin answered 304 Not Modified)."""
+        key = canonical_job_url(url)
+        entry = self._memory.get(key) or self._disk_get(key)
+        if entry is None:
+            return False
+        entry = {**entry, "stored_at": self._clock()}
+        self._memory.set(key, entry)
+        self._disk_set(key, entry)
+        self._counters["not_modified"] += 1
+        return True
+
+    def invalidate(self, url: str) -> None:
+        key = canonical_job_url(url)
+        self._memory.pop(key)
+        self._disk_delete(key)
+
+    def revalidate(self, url: str, refresh: Callable[[], Optional[Dict[str, Any]]]) -> bool:
+        """
+        Refresh a stale entry in the background. refresh() returns the new entry value
+        (or None to keep serving the stale one) and is responsible for calling set().
+        Returns False if a refresh for this URL is already running.
+        """
+        key = canonical_job_url(url)
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="scrape-cache")
+        self._counters["revalidations"] += 1
+
+        def _run():
+            try:
+                if refresh() is None:
+                    self._counters["revalidation_failures"] += 1
+            except Exception as e:
+                self._counters["revalidation_failures"] += 1
+                logger.warning("Scrape cache revalidation failed for %s: %s", url[:80], e)
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+
+        self._refresh_executor.submit(_run)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self._counters["memory_hits"] + self._counters["disk_hits"]
+        lookups = hits + self._counters["misses"]
+        disk_entries = None
+        with self._db_lock:
+            if self._conn is not None:
+                try:
+                    (disk_entries,) = self._conn.execute("SELECT COUNT(*) FROM scrape_cache").fetchone()
+                except sqlite3.Error:
+                    pass
+        return {
+            **self._counters,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "memory": self._memory.stats(),
+            "disk_entries": disk_entries,
+            "disk_path": self.path,
+            "refreshing": len(self._refreshing),
+        }
+
+    def close(self) -> None:
+        if self._refresh_executor is not None:
+            self._refresh_executor.shutdown(wait=False)
+            self._refresh_executor = None
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_scrape_cache: Optional[ScrapeCache] = None
+_scrape_cache_lock = threading.Lock()
+
+
+def get_scrape_cache() -> Optional[ScrapeCache]:
+    """Process-wide ScrapeCache from config, or None when SCRAPE_CACHE_ENABLED=false."""
+    global _scrape_cache
+    from model.utils.config import get_config
+    config = get_config()
+    if not config.SCRAPE_CACHE_ENABLED:
+        return None
+    with _scrape_cache_lock:
+        if _scrape_cache is None:
+            _scrape_cache = ScrapeCache(
+                path=os.path.join(config.CACHE_DIR, "scrape_cache.sqlite3") if config.CACHE_DIR else None,
+                memory_entries=config.SCRAPE_CACHE_MEMORY_ENTRIES,
+                disk_max_entries=config.SCRAPE_CACHE_DISK_MAX_ENTRIES,
+                stale_ttl=config.SCRAPE_CACHE_STALE_TTL,
+            )
+        return _scrape_cache
+
+
+def scrape_cache_stats() -> Dict[str, Any]:
+    """Stats of the shared cache without creating it."""
+    return _scrape_cache.stats() if _scrape_cache is not None else {}
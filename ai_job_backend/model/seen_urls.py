@@ -0,0 +1,133 @@
+"""
+Persistent seen-posting set for incremental discovery.
+
+Every posting discovery returns is checked against a scalable Bloom filter keyed by its
+canonical URL (tracking params, case, trailing slash removed), so a crawl can tell postings
+it has never returned before from re-listings. The filter stays in memory (~2 bytes per
+posting at a 0.1% false-positive rate) and is snapshotted to CACHE_DIR; a false positive
+only means a new posting is reported as already seen.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from model.utils.bloom import ScalableBloomFilter
+from model.utils.urls import canonical_job_url
+
+logger = logging.getLogger(__name__)
+
+
+class SeenUrls:
+    """
+    Seen-set over canonical job URLs, snapshotted to path (None: memory only) when
+    changed and at least snapshot_interval seconds after the previous snapshot.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        capacity: int = 200_000,
+        error_rate: float = 0.001,
+        snapshot_interval: float = 300,
+    ):
+        self.path = path
+        self.snapshot_interval = snapshot_interval
+        self._bloom: Optional[ScalableBloomFilter] = None
+        if path and os.path.exists(path):
+            try:
+                self._bloom = ScalableBloomFilter.load(path)
+            except (OSError, ValueError) as e:
+                logger.warning("Ignoring unreadable seen-URL snapshot %s: %s", path, e)
+        if self._bloom is None:
+            self._bloom = ScalableBloomFilter(capacity, error_rate)
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        self._counters = {"checked": 0, "new": 0, "snapshots": 0}
+
+    def mark_seen(self, url: str) -> bool:
+        """Record a posting URL; True when it was not seen before (by canonical URL)."""
+        key = canonical_job_url(url)
+        if not key:
+            return False
+        new = self._bloom.add(key)
+        with self._lock:
+            self._counters["checked"] += 1
+            self._counters["new"] += new
+            self._dirty = self._dirty or new
+        return new
+
+    def mark_jobs(self, jobs: Iterable[Dict[str, Any]]) -> int:
+        """Set seen_before on each job dict; returns how many are new. Snapshots if due."""
+        new = 0
+        for job in jobs:
+            job["seen_before"] = not self.mark_seen(job.get("url") or "")
+            new += not job["seen_before"]
+        self.maybe_snapshot()
+        return new
+
+    def __contains__(self, url: str) -> bool:
+        return canonical_job_url(url) in self._bloom
+
+    def maybe_snapshot(self, force: bool = False) -> bool:
+        """Write the snapshot if there are unsaved additions and it is due (or force)."""
+        with self._lock:
+            due = force or time.monotonic() - self._saved_at >= self.snapshot_interval
+            if not self.path or not self._dirty or not due:
+                return False
+            self._dirty = False
+            self._saved_at = time.monotonic()
+        try:
+            self._bloom.save(self.path)
+        except OSError as e:
+            logger.warning("Seen-URL snapshot to %s failed: %s", self.path, e)
+            with self._lock:
+                self._dirty = True
+            return False
+        with self._lock:
+            self._counters["snapshots"] += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+        return {**counters, **self._bloom.stats(), "path": self.path}
+
+
+_seen_urls: Optional[SeenUrls] = None
+_seen_urls_lock = threading.Lock()
+
+
+def get_seen_urls() -> Optional[SeenUrls]:
+    """Process-wide SeenUrls under CACHE_DIR; None when SEEN_URLS_ENABLED=false."""
+    global _seen_urls
+    from model.utils.config import get_config
+    config = get_config()
+    if not config.SEEN_URLS_ENABLED:
+        return None
+    with _seen_urls_lock:
+        if _seen_urls is None:
+            _seen_urls = SeenUrls(
+                os.path.join(config.CACHE_DIR, "seen_urls.bloom") if config.CACHE_DIR else None,
+                capacity=config.SEEN_URLS_CAPACITY,
+                error_rate=config.SEEN_URLS_ERROR_RATE,
+                snapshot_interval=config.SEEN_URLS_SNAPSHOT_INTERVAL,
+            )
+        return _seen_urls
+
+
+def seen_urls_stats() -> Dict[str, Any]:
+    """Seen-set stats (items, bytes, estimated false-positive rate) without creating it."""
+    return _seen_urls.stats() if _seen_urls is not None else {}
+
+
+def close_seen_urls() -> None:
+    """Write a final snapshot (app shutdown)."""
+    global _seen_urls
+    with _seen_urls_lock:
+        seen, _seen_urls = _seen_urls, None
+    if seen is not None:
+        seen.maybe_snapshot(force=True)
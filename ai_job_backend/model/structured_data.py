@@ -0,0 +1,278 @@
+"""
+schema.org JobPosting extraction (JSON-LD and microdata) without building a DOM.
+
+Greenhouse, Lever, Indeed and most career sites embed the posting as structured data
+for search engines. Reading it is cheaper and cleaner than selector-based extraction:
+JSON-LD blocks are located with a regex and json-decoded; microdata is read with the
+stdlib streaming HTMLParser starting at the JobPosting itemscope, stopping when it closes.
+"""
+
+import html as html_lib
+import json
+import logging
+import re
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_LD_JSON_RE = re.compile(
+    r"<script\b[^>]*type\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>(.*?)</script\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_MICRODATA_RE = re.compile(r"itemtype\s*=\s*[\"']?https?://schema\.org/JobPosting", re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+
+# Elements that end a line of text when a description fragment is flattened
+_BLOCK_TAGS = frozenset({
+    "p", "div", "br", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6",
+    "section", "article", "tr", "table", "blockquote", "pre",
+})
+_VOID_TAGS = frozenset({"meta", "link", "img", "br", "hr", "input", "source", "area", "base", "col", "wbr"})
+_SKIP_TAGS = frozenset({"script", "style", "svg", "noscript", "template"})
+
+
+class _TextCollector(HTMLParser):
+    """Flatten an HTML fragment (e.g. a JSON-LD description) to plain text."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self._skip += 1
+        elif tag in _BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS:
+            self._skip = max(0, self._skip - 1)
+        elif tag in _BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+
+
+def html_fragment_to_text(fragment: str) -> str:
+    """Plain text of an HTML fragment, whitespace collapsed."""
+    if not fragment:
+        return ""
+    if "<" not in fragment:
+        return _WS_RE.sub(" ", html_lib.unescape(fragment)).strip()
+    collector = _TextCollector()
+    collector.feed(fragment)
+    collector.close()
+    return _WS_RE.sub(" ", "".join(collector.parts)).strip()
+
+
+# ---- JSON-LD ----
+
+def _is_job_posting(obj: Dict[str, Any]) -> bool:
+    kind = obj.get("@type")
+    kinds = kind if isinstance(kind, list) else [kind]
+    return any(isinstance(k, str) and k.rsplit("/", 1)[-1] == "JobPosting" for k in kinds)
+
+
+def _iter_ld_objects(data: Any) -> Iterator[Dict[str, Any]]:
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_ld_objects(item)
+    elif isinstance(data, dict):
+        yield data
+        graph = data.get("@graph")
+        if graph is not None:
+            yield from _iter_ld_objects(graph)
+
+
+def _load_ld_json(raw: str) -> Any:
+    raw = raw.strip()
+    if raw.startswith("<!--"):
+        raw = raw[4:].rsplit("-->", 1)[0]
+    try:
+        return json.loads(raw)
+    except ValueError:
+        pass
+    # Raw newlines/tabs inside strings are common in hand-written blocks; strict=False allows them
+    try:
+        return json.loads(raw, strict=False)
+    except ValueError:
+        return None
+
+
+def _name(value: Any) -> str:
+    if isinstance(value, list):
+        value = value[0] if value else ""
+    if isinstance(value, dict):
+        value = value.get("name") or ""
+    return str(value).strip() if value else ""
+
+
+def _place(value: Any) -> str:
+    """Readable location from a JSON-LD/microdata jobLocation (Place/PostalAddress/text)."""
+    if isinstance(value, list):
+        return "; ".join(p for p in (_place(v) for v in value) if p)
+    if isinstance(value, str):
+        return value.strip()
+    if not isinstance(value, dict):
+        return ""
+    address = value.get("address", value)
+    if isinstance(address, str):
+        return address.strip()
+    if not isinstance(address, dict):
+        return _name(value)
+    parts = [
+        _name(address.get(key))
+        for key in ("addressLocality", "addressRegion", "addressCountry")
+    ]
+    return ", ".join(p for p in parts if p) or _name(value)
+
+
+def _normalize(posting: Dict[str, Any], source: str) -> Dict[str, Any]:
+    location = _place(posting.get("jobLocation"))
+    if "TELECOMMUTE" in str(posting.get("jobLocationType", "")).upper():
+        location = f"Remote ({location})" if location else "Remote"
+    employment = posting.get("employmentType")
+    if isinstance(employment, list):
+        employment = ", ".join(str(e) for e in employment)
+    fields = {
+        "title": _name(posting.get("title") or posting.get("name")),
+        "company": _name(posting.get("hiringOrganization")),
+        "location": location,
+        "datePosted": str(posting.get("datePosted") or "").strip(),
+        "employmentType": str(employment or "").strip(),
+        "description": html_fragment_to_text(str(posting.get("description") or "")),
+        "source": source,
+    }
+    return {k: v for k, v in fields.items() if v}
+
+
+def _json_ld_posting(html: str) -> Optional[Dict[str, Any]]:
+    for match in _LD_JSON_RE.finditer(html):
+        data = _load_ld_json(match.group(1))
+        if data is None:
+            logger.debug("Skipping unparseable ld+json block")
+            continue
+        for obj in _iter_ld_objects(data):
+            if _is_job_posting(obj):
+                return _normalize(obj, "json-ld")
+    return None
+
+
+# ---- microdata ----
+
+class _StopParsing(Exception):
+    pass
+
+
+class _MicrodataParser(HTMLParser):
+    """
+    Collects itemprop values of the first schema.org JobPosting item. Nested items
+    (hiringOrganization, jobLocation/address) become dicts; parsing stops when the
+    JobPosting element closes.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.posting: Optional[Dict[str, Any]] = None
+        self._stack: List[Dict[str, Any]] = []   # open elements
+        self._skip = 0
+
+    def _current_scope(self) -> Optional[Dict[str, Any]]:
+        for entry in reversed(self._stack):
+            if entry["scope"] is not None:
+                return entry["scope"]
+        return None
+
+    def handle_starttag(self, tag, attrs):
+        a = dict(attrs)
+        entry = {
+            "tag": tag,
+            "prop": a.get("itemprop"),
+            "owner": self._current_scope(),
+            "scope": {"@type": a.get("itemtype") or ""} if "itemscope" in a else None,
+            "value": a.get("content") or a.get("datetime"),
+            "text": [],
+        }
+        if tag in _SKIP_TAGS:
+            self._skip += 1
+        elif tag in _BLOCK_TAGS:
+            self.handle_data(" ")
+        if tag in _VOID_TAGS:
+            self._finish(entry)
+        else:
+            self._stack.append(entry)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if not any(e["tag"] == tag for e in self._stack):
+            return  # stray end tag
+        if tag in _BLOCK_TAGS:
+            self.handle_data(" ")
+        while self._stack:
+            entry = self._stack.pop()
+            if entry["tag"] in _SKIP_TAGS:
+                self._skip = max(0, self._skip - 1)
+            self._finish(entry)
+            if entry["tag"] == tag:
+                break
+
+    def handle_data(self, data):
+        if self._skip:
+            return
+        for entry in self._stack:
+            if entry["prop"] and entry["value"] is None and entry["scope"] is None:
+                entry["text"].append(data)
+
+    def _finish(self, entry: Dict[str, Any]) -> None:
+        owner, prop = entry["owner"], entry["prop"]
+        if entry["scope"] is not None:
+            if owner is not None and prop:
+                owner.setdefault(prop, entry["scope"])
+            if _is_job_posting(entry["scope"]) and self.posting is None:
+                self.posting = entry["scope"]
+                raise _StopParsing
+        elif owner is not None and prop:
+            value = entry["value"]
+            if value is None:
+                value = _WS_RE.sub(" ", "".join(entry["text"])).strip()
+            owner.setdefault(prop, value)
+
+
+def _microdata_posting(html: str) -> Optional[Dict[str, Any]]:
+    match = _MICRODATA_RE.search(html)
+    if not match:
+        return None
+    start = html.rfind("<", 0, match.start())
+    parser = _MicrodataParser()
+    try:
+        parser.feed(html[start:])
+        parser.close()
+    except _StopParsing:
+        pass
+    if parser.posting is None:
+        return None
+    return _normalize(parser.posting, "microdata")
+
+
+def extract_job_posting(html: str) -> Optional[Dict[str, Any]]:
+    """
+    Structured JobPosting fields from a page: title, company, location, datePosted,
+    employmentType, description (plain text), source ("json-ld" | "microdata").
+    None when the page has no JobPosting structured data.
+    """
+    if not html:
+        return None
+    posting = None
+    if "ld+json" in html:
+        posting = _json_ld_posting(html)
+    if posting is None and "schema.org/JobPosting" in html:
+        posting = _microdata_posting(html)
+    return posting or None
@@ -0,0 +1,64 @@
+"""
+Local stand-in HTTP server for tests (no network). Serves canned responses by path.
+"""
+
+import http.server
+import threading
+from typing import Dict, List, Optional, Tuple
+
+
+class LocalServer:
+    """
+    Threaded HTTP server on 127.0.0.1. routes maps path (with query) to
+    (status, headers, body). Honors If-None-Match against the route's ETag.
+    keep_alive serves HTTP/1.1 so clients can reuse connections.
+    """
+
+    def __init__(
+        self,
+        routes: Optional[Dict[str, Tuple[int, Dict[str, str], bytes]]] = None,
+        keep_alive: bool = False,
+    ):
+        self.routes: Dict[str, Tuple[int, Dict[str, str], bytes]] = dict(routes or {})
+        self.requests: List[Tuple[str, Dict[str, str]]] = []
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1" if keep_alive else "HTTP/1.0"
+
+            def do_GET(self):
+                server.requests.append((self.path, dict(self.headers)))
+                status, headers, body = server.routes.get(self.path, (404, {}, b"not found"))
+                etag = headers.get("ETag")
+                if etag and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                self.send_response(status)
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_port}"
+
+    def hits(self, path: str) -> int:
+        return sum(1 for p, _ in self.requests if p == path)
+
+    def __enter__(self) -> "LocalServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -0,0 +1,122 @@
+"""
+Unit tests for the Greenhouse / Lever board API fast path (recorded payloads, local server).
+"""
+
+import asyncio
+import os
+import unittest
+from unittest import mock
+
+from model import ats_api, job_scraper
+from model.ats_api import AtsRef, resolve_ats_url
+from model.job_scraper import JobScraper
+from model.provider_health import ProviderHealth
+from model.tests.local_server import LocalServer
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+GREENHOUSE_URL = "https://boards.greenhouse.io/examplelabs/jobs/4012345?gh_src=abc"
+LEVER_ID = "5b9f2c1e-7a4d-4e8b-9c3f-1d2e3f4a5b6c"
+LEVER_URL = f"https://jobs.lever.co/examplelabs/{LEVER_ID}"
+
+
+def _payload(name: str) -> bytes:
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+
+class TestResolveAtsUrl(unittest.TestCase):
+    def test_posting_urls(self):
+        self.assertEqual(resolve_ats_url(GREENHOUSE_URL), AtsRef("greenhouse", "greenhouse", "examplelabs", "4012345"))
+        self.assertEqual(
+            resolve_ats_url("https://job-boards.greenhouse.io/examplelabs/jobs/4012345"),
+            AtsRef("greenhouse", "greenhouse", "examplelabs", "4012345"),
+        )
+        self.assertEqual(
+            resolve_ats_url("https://boards.greenhouse.io/embed/job_app?for=examplelabs&token=4012345"),
+            AtsRef("greenhouse", "greenhouse", "examplelabs", "4012345"),
+        )
+        self.assertEqual(resolve_ats_url(LEVER_URL + "/apply"), AtsRef("lever", "lever", "examplelabs", LEVER_ID))
+        self.assertEqual(
+            resolve_ats_url(f"https://jobs.eu.lever.co/examplelabs/{LEVER_ID}").api_url,
+            f"https://api.eu.lever.co/v0/postings/examplelabs/{LEVER_ID}",
+        )
+
+    def test_board_urls(self):
+        ref = resolve_ats_url("https://boards.greenhouse.io/examplelabs")
+        self.assertIsNone(ref.posting_id)
+        self.assertEqual(ref.api_url, "https://boards-api.greenhouse.io/v1/boards/examplelabs/jobs")
+        self.assertEqual(
+            resolve_ats_url("https://jobs.lever.co/examplelabs").api_url,
+            "https://api.lever.co/v0/postings/examplelabs?mode=json",
+        )
+
+    def test_other_urls(self):
+        for url in (
+            "https://www.indeed.com/viewjob?jk=abc",
+            "https://careers.example.com/jobs/1?gh_jid=4012345",
+            "https://jobs.lever.co/examplelabs/not-a-posting-id",
+            "https://boards.greenhouse.io/examplelabs/departments/12",
+        ):
+            with self.subTest(url=url):
+                self.assertIsNone(resolve_ats_url(url))
+
+
+class TestAtsApiScrape(unittest.TestCase):
+    def setUp(self):
+        routes = {
+            "/gh/examplelabs/jobs/4012345": (200, {"Content-Type": "application/json"}, _payload("greenhouse_api_job.json")),
+            f"/lever/examplelabs/{LEVER_ID}": (200, {"Content-Type": "application/json"}, _payload("lever_api_job.json")),
+        }
+        self.server = LocalServer(routes).__enter__()
+        self.addCleanup(self.server.__exit__)
+        bases = {"greenhouse": self.server.base_url + "/gh", "lever": self.server.base_url + "/lever"}
+        patcher = mock.patch.dict(ats_api.API_BASES, bases)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.scraper = JobScraper(use_playwright=False, use_cache=False, health=ProviderHealth())
+        self.addCleanup(self.scraper.close)
+
+    def test_greenhouse_posting_skips_html(self):
+        with mock.patch.object(self.scraper, "_scrape_with_requests") as html_fetch:
+            result = self.scraper.scrape(GREENHOUSE_URL)
+        html_fetch.assert_not_called()
+        self.assertTrue(result["success"])
+        self.assertEqual(result["method"], "ats_api")
+        self.assertIn("ingest millions of job postings a day", result["text"])
+        self.assertNotIn("<li>", result["text"])
+        self.assertNotIn("Apply now", result["text"])
+        self.assertEqual(result["job"], {
+            "title": "Senior Backend Engineer",
+            "company": "Example Labs",
+            "location": "Remote - US",
+            "datePosted": "2024-04-18T09:00:00-04:00",
+            "source": "greenhouse-api",
+        })
+        self.assertEqual(self.server.hits("/gh/examplelabs/jobs/4012345"), 1)
+
+    def test_lever_posting_async(self):
+        async def run():
+            try:
+                return await self.scraper.scrape_async(LEVER_URL)
+            finally:
+                await job_scraper.close_async_http_engine()
+
+        result = asyncio.run(run())
+        self.assertEqual(result["method"], "ats_api")
+        self.assertIn("Responsibilities Run Kubernetes clusters", result["text"])
+        self.assertNotIn("Apply for this job", result["text"])  # Lever site noise phrase
+        self.assertEqual(result["job"]["employmentType"], "Full-time")
+        self.assertEqual(result["job"]["location"], "Toronto, ON")
+        self.assertEqual(result["job"]["datePosted"], "2024-04-26")
+
+    def test_missing_posting_falls_back_to_html(self):
+        url = "https://boards.greenhouse.io/examplelabs/jobs/999"
+        with mock.patch.object(self.scraper, "_scrape_with_requests", return_value="Job text " * 40) as html_fetch:
+            result = self.scraper.scrape(url)
+        html_fetch.assert_called_once()
+        self.assertEqual(result["method"], "requests")
+        self.assertEqual(self.server.hits("/gh/examplelabs/jobs/999"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Unit tests for incremental company-board discovery (local server, in-memory sync state).
+"""
+
+import json
+import os
+import unittest
+from unittest import mock
+
+from model import ats_api, board_sync
+from model.ats_api import parse_board_spec
+from model.board_sync import BoardSyncStore, discover_boards, sync_boards
+from model.tests.local_server import LocalServer
+from model.utils.config import get_config
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _greenhouse_board(*jobs):
+    return json.dumps({
+        "jobs": [
+            {
+                "id": job_id,
+                "title": title,
+                "updated_at": updated,
+                "location": {"name": "Remote - US"},
+                "absolute_url": f"https://boards.greenhouse.io/examplelabs/jobs/{job_id}",
+                "company_name": "Example Labs",
+            }
+            for job_id, title, updated in jobs
+        ],
+        "meta": {"total": len(jobs)},
+    }).encode()
+
+
+def _lever_board():
+    with open(os.path.join(FIXTURES, "lever_api_job.json"), encoding="utf-8") as f:
+        return json.dumps([json.load(f)]).encode()
+
+
+class TestBoardSync(unittest.TestCase):
+    def setUp(self):
+        self.server = LocalServer({
+            "/gh/examplelabs/jobs": (200, {"Content-Type": "application/json", "ETag": '"v1"'}, _greenhouse_board(
+                (1, "Backend Engineer", "2024-05-01T10:00:00-04:00"),
+                (2, "Data Scientist", "2024-05-02T10:00:00-04:00"),
+            )),
+            "/lever/examplelabs?mode=json": (200, {"Content-Type": "application/json"}, _lever_board()),
+        }).__enter__()
+        self.addCleanup(self.server.__exit__)
+        bases = {"greenhouse": self.server.base_url + "/gh", "lever": self.server.base_url + "/lever"}
+        patcher = mock.patch.dict(ats_api.API_BASES, bases)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.store = BoardSyncStore(path=None)
+        self.addCleanup(self.store.close)
+        self.boards = [parse_board_spec("greenhouse:examplelabs"), parse_board_spec("lever:examplelabs")]
+
+    def test_only_new_or_changed_postings_emitted(self):
+        first = sync_boards(self.boards, store=self.store)
+        self.assertEqual(len(first["jobs"]), 3)
+        self.assertTrue(all(j["change"] == "new" for j in first["jobs"]))
+        self.assertEqual(first["boards"]["greenhouse:examplelabs"]["cursor"], "2024-05-02T10:00:00-04:00")
+
+        second = sync_boards(self.boards, store=self.store)
+        self.assertEqual(second["jobs"], [])  # Greenhouse: 304 on the stored ETag; Lever: same fingerprints
+        self.assertEqual(second["boards"]["greenhouse:examplelabs"]["status"], "not_modified")
+        greenhouse_headers = [h for path, h in self.server.requests if path == "/gh/examplelabs/jobs"]
+        self.assertEqual(greenhouse_headers[-1].get("If-None-Match"), '"v1"')
+
+        self.server.routes["/gh/examplelabs/jobs"] = (200, {"Content-Type": "application/json", "ETag": '"v2"'}, _greenhouse_board(
+            (2, "Senior Data Scientist", "2024-05-03T10:00:00-04:00"),
+            (3, "ML Engineer", "2024-05-04T10:00:00-04:00"),
+        ))
+        third = sync_boards(self.boards[:1], store=self.store)
+        self.assertEqual(
+            sorted((j["title"], j["change"]) for j in third["jobs"]),
+            [("ML Engineer", "new"), ("Senior Data Scientist", "changed")],
+        )
+        summary = third["boards"]["greenhouse:examplelabs"]
+        self.assertEqual((summary["removed"], summary["postings"]), (1, 2))
+        self.assertEqual(self.store.state("greenhouse:examplelabs")["validators"], {"etag": '"v2"'})
+
+    def test_discover_boards_filters_by_query(self):
+        with mock.patch.object(get_config(), "DISCOVERY_BOARDS", "greenhouse:examplelabs, lever:examplelabs, bogus"), \
+                mock.patch.object(board_sync, "get_board_sync_store", return_value=self.store):
+            jobs = discover_boards("engineer")
+        self.assertEqual(sorted(j["title"] for j in jobs), ["Backend Engineer", "Platform Engineer"])
+        lever = next(j for j in jobs if j["source"] == "lever")
+        self.assertEqual(lever["url"], "https://jobs.lever.co/examplelabs/5b9f2c1e-7a4d-4e8b-9c3f-1d2e3f4a5b6c")
+        self.assertEqual(lever["location"], "Toronto, ON")
+        self.assertEqual(lever["change"], "new")
+
+    def test_postings_synced_by_other_searches_still_found(self):
+        with mock.patch.object(get_config(), "DISCOVERY_BOARDS", "greenhouse:examplelabs"), \
+                mock.patch.object(board_sync, "get_board_sync_store", return_value=self.store):
+            self.assertEqual([j["title"] for j in discover_boards("data scientist")], ["Data Scientist"])
+            jobs = discover_boards("backend engineer")  # board answers 304 now
+        self.assertEqual([j["title"] for j in jobs], ["Backend Engineer"])
+        self.assertNotIn("change", jobs[0])
+
+    def test_board_specs(self):
+        self.assertEqual(parse_board_spec("https://jobs.eu.lever.co/examplelabs").key, "lever-eu:examplelabs")
+        self.assertEqual(parse_board_spec("https://boards.greenhouse.io/examplelabs/jobs/1").posting_id, None)
+        self.assertIsNone(parse_board_spec("workday:examplelabs"))
+
+
+if __name__ == "__main__":
+    unittest.main()
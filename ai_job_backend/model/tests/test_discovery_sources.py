@@ -0,0 +1,76 @@
+"""
+Unit tests for the discovery source registry: per-source policy and partial results at the deadline.
+"""
+
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+from model import job_discovery
+from model.discovery_sources import DiscoverySource
+
+
+def _job(n, source="test"):
+    return {"title": f"Engineer {n}", "company": f"Company {n}", "url": f"https://example.com/jobs/{n}", "source": source}
+
+
+class TestDiscoverySource(unittest.TestCase):
+    def test_retries_empty_result_and_counts_credits(self):
+        fetch = mock.Mock(side_effect=[[], RuntimeError("render failed"), [_job(1)]])
+        source = DiscoverySource("zip", "Zip", fetch, retries=2, retry_empty=True, cost=10)
+        with mock.patch.dict(os.environ, {"SCRAPER_API_KEY": "key"}):
+            record = source.run("q", "", 10, None, time.monotonic() + 5)
+        self.assertEqual((record["status"], record["found"], record["attempts"], record["credits"]), ("ok", 1, 3, 30))
+        self.assertNotIn("error", record)
+        stats = source.stats()
+        self.assertEqual((stats["runs"], stats["ok"], stats["retries"], stats["credits"]), (1, 1, 2, 30))
+
+        fetch = mock.Mock(side_effect=RuntimeError("down"))
+        record = DiscoverySource("x", "X", fetch).run("q", "", 10, None, time.monotonic() + 5)
+        self.assertEqual((record["status"], record["error"], record["attempts"]), ("error", "down", 1))
+
+    def test_concurrency_slot_wait_bounded_by_deadline(self):
+        release = threading.Event()
+        source = DiscoverySource("slow", "Slow", lambda *a: release.wait(5) and [], concurrency=1)
+        first = threading.Thread(target=source.run, args=("q", "", 10, None, time.monotonic() + 5))
+        first.start()
+        time.sleep(0.05)
+        record = source.run("q", "", 10, None, time.monotonic() + 0.1)
+        release.set()
+        first.join()
+        self.assertEqual((record["status"], record["attempts"]), ("timeout", 0))
+        self.assertEqual(source.stats()["timeout"], 1)
+
+
+class TestPartialDiscovery(unittest.TestCase):
+    def setUp(self):
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+        sources = [
+            DiscoverySource("fast", "Fast", lambda *a: [_job(1, "fast"), _job(2, "fast")]),
+            DiscoverySource("slow", "Slow", lambda *a: self.release.wait(5) and [_job(3, "slow")]),
+            DiscoverySource("quick_timeout", "Quick", lambda *a: self.release.wait(5) and [], timeout=0.05),
+        ]
+        for p in (
+            mock.patch.object(job_discovery, "discovery_sources", return_value=sources),
+            mock.patch.object(job_discovery, "get_seen_urls", return_value=None),
+        ):
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_deadline_returns_finished_sources(self):
+        start = time.monotonic()
+        result = job_discovery._discover_jobs("engineer", "", 20, deadline=0.3)
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertTrue(result["partial"])
+        self.assertEqual([j["url"] for j in result["jobs"]], ["https://example.com/jobs/1", "https://example.com/jobs/2"])
+        status = result["source_status"]
+        self.assertEqual({name: s["status"] for name, s in status.items()},
+                         {"fast": "ok", "slow": "timeout", "quick_timeout": "timeout"})
+        self.assertEqual((status["fast"]["found"], status["fast"]["kept"]), (2, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
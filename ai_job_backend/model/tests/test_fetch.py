@@ -0,0 +1,127 @@
+"""
+Unit tests for streamed, size-capped downloads and the script/style/svg stripper.
+"""
+
+import asyncio
+import random
+import unittest
+
+from model import job_scraper
+from model.job_scraper import JobScraper
+from model.tests.local_server import LocalServer
+from model.utils.fetch import CappedHtmlReader, HtmlStripper, is_html_content_type
+
+PAGE = (
+    "<html><head><title>Job</title><style>.a{color:red}</style>"
+    "<script>var state = {\"html\": \"<div>not markup</div>\"};</script>"
+    "<script type=\"application/ld+json\">{\"@type\": \"JobPosting\", \"title\": \"Engineer\"}</script>"
+    "</head><body><svg viewBox=\"0 0 1 1\"><title>logo</title><path d=\"M0 0\"/></svg>"
+    "<div id=\"jobDescriptionText\">" + "Build reliable data pipelines and ML services. " * 20 + "</div>"
+    "<SCRIPT src=\"/app.js\"></SCRIPT></body></html>"
+)
+
+
+class TestHtmlStripper(unittest.TestCase):
+    def test_strips_blocks_and_keeps_json_ld(self):
+        out = HtmlStripper().feed(PAGE)
+        self.assertNotIn("var state", out)
+        self.assertNotIn("color:red", out)
+        self.assertNotIn("logo", out)
+        self.assertNotIn("app.js", out)
+        self.assertIn('"title": "Engineer"', out)
+        self.assertIn("Build reliable data pipelines", out)
+
+    def test_self_closing_svg_keeps_following_text(self):
+        page = '<p>Apply <svg class="icon" viewBox="0 0 8 8" /> now</p><p>Salary: $150k</p><svg><g/></svg><p>Remote</p>'
+        stripper = HtmlStripper()
+        out = stripper.feed(page) + stripper.close()
+        self.assertEqual(out, "<p>Apply  now</p><p>Salary: $150k</p><p>Remote</p>")
+
+    def test_chunk_boundaries_do_not_matter(self):
+        page = PAGE.replace("<body>", '<body><svg class="icon"/><p>Senior role</p>')
+        expected = HtmlStripper().feed(page)
+        self.assertIn("Senior role", expected)
+        rng = random.Random(7)
+        for _ in range(50):
+            stripper, parts, pos = HtmlStripper(), [], 0
+            while pos < len(page):
+                size = rng.randint(1, 40)
+                parts.append(stripper.feed(page[pos:pos + size]))
+                pos += size
+            parts.append(stripper.close())
+            self.assertEqual("".join(parts), expected)
+
+
+class TestCappedHtmlReader(unittest.TestCase):
+    def _read(self, body: bytes, max_bytes: int, content_type="text/html; charset=utf-8", chunk=64):
+        reader = CappedHtmlReader(max_bytes, content_type)
+        for i in range(0, len(body), chunk):
+            if not reader.feed(body[i:i + chunk]):
+                break
+        return reader.finish()
+
+    def test_counts_and_stripping(self):
+        body = PAGE.encode("utf-8")
+        html, stats = self._read(body, 10 ** 6)
+        self.assertEqual(stats["bytes_downloaded"], len(body))
+        self.assertEqual(stats["html_chars"], len(html))
+        self.assertGreater(stats["stripped_chars"], 100)
+        self.assertFalse(stats["truncated"])
+
+    def test_cap_stops_reading(self):
+        html, stats = self._read(PAGE.encode("utf-8"), 300)
+        self.assertEqual(stats["bytes_downloaded"], 300)
+        self.assertTrue(stats["truncated"])
+        self.assertLess(len(html), 300)
+
+    def test_meta_charset_sniffed(self):
+        body = '<html><head><meta charset="iso-8859-1"></head><body>Zürich</body></html>'.encode("latin-1")
+        html, _ = self._read(body, 10 ** 6, content_type="text/html", chunk=7)
+        self.assertIn("Zürich", html)
+
+    def test_content_types(self):
+        self.assertTrue(is_html_content_type("text/html; charset=utf-8"))
+        self.assertTrue(is_html_content_type(None))
+        self.assertFalse(is_html_content_type("application/pdf"))
+
+
+class TestStreamedScrape(unittest.TestCase):
+    ROUTES = {
+        "/job/1": (200, {"Content-Type": "text/html"}, PAGE.encode("utf-8")),
+        "/job/big": (200, {"Content-Type": "text/html"}, PAGE.encode("utf-8") + b"<p>padding</p>" * 100000),
+        "/job/pdf": (200, {"Content-Type": "application/pdf"}, b"%PDF-1.4" + b"0" * 5000),
+    }
+
+    def test_download_stats_per_scrape(self):
+        with LocalServer(self.ROUTES) as srv, JobScraper(use_playwright=False, use_cache=False) as scraper:
+            result = scraper.scrape(srv.base_url + "/job/1")
+            self.assertTrue(result["success"])
+            self.assertEqual(result["download"]["bytes_downloaded"], len(PAGE.encode("utf-8")))
+            self.assertGreater(result["download"]["stripped_chars"], 0)
+
+    def test_cap_and_non_html_abort(self):
+        before = job_scraper.download_stats()
+        with LocalServer(self.ROUTES) as srv, JobScraper(use_playwright=False, use_cache=False, max_bytes=4096) as scraper:
+            result = scraper.scrape(srv.base_url + "/job/big")
+            self.assertTrue(result["success"])
+            self.assertEqual(result["download"]["bytes_downloaded"], 4096)
+            self.assertTrue(result["download"]["truncated"])
+            self.assertFalse(scraper.scrape(srv.base_url + "/job/pdf")["success"])
+        after = job_scraper.download_stats()
+        self.assertEqual(after["aborted_not_html"] - before["aborted_not_html"], 1)
+
+    def test_async_streams(self):
+        async def run(url):
+            with JobScraper(use_playwright=False, use_cache=False, max_bytes=4096) as scraper:
+                result = await scraper.scrape_async(url)
+            await job_scraper.close_async_http_engine()
+            return result
+
+        with LocalServer(self.ROUTES) as srv:
+            result = asyncio.run(run(srv.base_url + "/job/big"))
+        self.assertTrue(result["success"])
+        self.assertEqual(result["download"]["bytes_downloaded"], 4096)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Unit tests for the HTML parser backends: lxml and soup must extract the same text
+and cards from the saved fixtures.
+"""
+
+import os
+import unittest
+import warnings
+from unittest import mock
+
+from model import html_backends, job_discovery
+from model.job_scraper import JobScraper
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+JOB_PAGES = {
+    "indeed_job.html": "https://www.indeed.com/viewjob?jk=abc",
+    "greenhouse_job.html": "https://boards.greenhouse.io/example/jobs/1",
+    "lever_job.html": "https://jobs.lever.co/example/1",
+    "generic_job.html": "https://careers.example.com/jobs/1",
+}
+
+
+def _fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def _with_backend(name, fn, *args):
+    with mock.patch.object(html_backends.Config, "HTML_PARSER_BACKEND", name), warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return fn(*args)
+
+
+@unittest.skipUnless(html_backends.LXML_AVAILABLE, "lxml/cssselect not installed")
+class TestBackendParity(unittest.TestCase):
+    def test_job_pages_extract_same_text(self):
+        scraper = JobScraper(use_playwright=False, use_cache=False)
+        for name, url in JOB_PAGES.items():
+            with self.subTest(page=name):
+                html = _fixture(name)
+                fast = _with_backend("lxml", scraper._parse_html, html, url)
+                slow = _with_backend("soup", scraper._parse_html, html, url)
+                self.assertGreater(len(fast or ""), 500)
+                self.assertEqual(fast, slow)
+                self.assertNotIn("window.__STATE__", fast)
+                self.assertNotIn("hidden template text", fast)
+
+    def test_discovery_cards_match(self):
+        parsers = {
+            "ziprecruiter_search.html": job_discovery._parse_ziprecruiter_cards,
+            "dailyaijobs_listing.html": job_discovery._parse_dailyaijobs_cards,
+            "aiworkportal_jobs.html": job_discovery._parse_aiworkportal_cards,
+        }
+        for name, parse in parsers.items():
+            with self.subTest(page=name):
+                html = _fixture(name)
+                fast = _with_backend("lxml", parse, html)
+                self.assertTrue(fast)
+                self.assertEqual(fast, _with_backend("soup", parse, html))
+
+    def test_text_skips_comments_and_scripts(self):
+        backend = html_backends.get_parser_backend("lxml")
+        doc = backend.parse(
+            "<div id='x'>Hello <!-- hidden --><b>big</b><script>var a = 1;</script> world"
+            "<style>.c{}</style>&nbsp;!</div>"
+        )
+        node = backend.first(doc, backend.compiled("#x"))
+        self.assertEqual(backend.text(node), "Hello big world !")
+        self.assertEqual(backend.text(node, separator=""), "Hellobigworld!")
+
+    def test_select_excludes_context_node(self):
+        backend = html_backends.get_parser_backend("lxml")
+        doc = backend.parse("<body><div class='a'><div class='b'>x</div></div></body>")
+        outer = backend.first(doc, backend.compiled("div"))
+        inner = backend.select(outer, backend.compiled("div"))
+        self.assertEqual([backend.attr(el, "class") for el in inner], ["b"])
+
+
+class TestSelectorPlans(unittest.TestCase):
+    def test_plan_cached_per_site_and_backend(self):
+        scraper = JobScraper(use_playwright=False, use_cache=False)
+        backend = html_backends.get_parser_backend("soup")
+        plan = scraper._selector_plan("indeed", backend)
+        self.assertIs(plan, JobScraper(use_playwright=False, use_cache=False)._selector_plan("indeed", backend))
+        self.assertEqual(
+            [sel for sel, _ in plan.content],
+            JobScraper.SITE_SELECTORS["indeed"]["content_selectors"],
+        )
+
+    def test_invalid_selector_dropped(self):
+        backend = html_backends.SoupBackend()
+        with self.assertLogs("model.html_backends", level="WARNING"):
+            plan = html_backends.compile_plan(backend, ["div.ok", "div[["], ["nav"])
+        self.assertEqual([sel for sel, _ in plan.content], ["div.ok"])
+        self.assertEqual(len(plan.exclude), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
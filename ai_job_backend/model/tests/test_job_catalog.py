@@ -0,0 +1,222 @@
+"""
+Unit tests for the local job catalog (lookup, full-text search), the discovery crawler
+and catalog-first candidate jobs / discovery.
+"""
+
+import os
+import unittest
+from unittest import mock
+
+from model import job_discovery, job_matches
+from model.crawler import DiscoveryCrawler, parse_crawl_queries
+from model.job_catalog import JobCatalog
+from model.utils.cache import LRUCache
+from model.utils.config import get_config
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _job(n: int, **extra):
+    return {"title": f"Engineer {n}", "company": "Acme", "url": f"https://www.example.com/jobs/{n}?utm_source=x",
+            "snippet": "Build things", "source": "ziprecruiter", **extra}
+
+
+class TestJobCatalog(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.catalog = JobCatalog(path=None, clock=self.clock)
+        self.addCleanup(self.catalog.close)
+
+    def test_upsert_keeps_first_seen(self):
+        self.assertEqual(self.catalog.upsert([_job(1), _job(2)], "Software  Engineer", "Remote"), {"new": 2, "updated": 0})
+        self.clock.now += 600
+        self.assertEqual(self.catalog.upsert([_job(1, title="Senior Engineer 1")], "software engineer", "remote"),
+                         {"new": 0, "updated": 1})
+        jobs = self.catalog.lookup("software engineer", "Remote")
+        self.assertEqual([j["title"] for j in jobs], ["Senior Engineer 1", "Engineer 2"])
+        self.assertEqual((jobs[0]["first_seen"], jobs[0]["last_seen"]), (1_000_000.0, 1_000_600.0))
+        self.assertEqual(self.catalog.stats()["jobs"], 2)
+
+    def test_lookup_max_age_and_prune(self):
+        self.catalog.upsert([_job(1)], "data scientist", "")
+        self.clock.now += 7200
+        self.assertEqual(self.catalog.lookup("data scientist", "", max_age=3600), [])
+        self.assertEqual(len(self.catalog.lookup("data scientist", "", max_age=86400)), 1)
+        self.assertEqual(self.catalog.prune(3600), 1)
+        self.assertEqual(self.catalog.stats()["jobs"], 0)
+
+
+class TestJobSearch(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.catalog = JobCatalog(path=None, clock=self.clock)
+        self.addCleanup(self.catalog.close)
+        self.catalog.upsert([
+            _job(1, title="Data Engineer", snippet="Spark pipelines", location="Remote", source="dailyaijobs",
+                 posted_days_ago=1),
+            _job(2, title="Backend Engineer", snippet="Work with the data team", location="New York, NY"),
+            _job(3, title="Product Designer", snippet="Figma", location="Remote", posted_days_ago=10),
+        ])
+
+    def test_bm25_ranking_and_location(self):
+        self.assertTrue(self.catalog.fts)
+        self.assertEqual([j["title"] for j in self.catalog.search("data")], ["Data Engineer", "Backend Engineer"])
+        self.assertEqual([j["title"] for j in self.catalog.search("engineering", "remote")], ["Data Engineer"])
+        self.assertEqual(self.catalog.search('designer" OR "x'), [])  # query syntax is not interpreted
+
+    def test_location_from_the_search_that_found_a_card(self):
+        self.catalog.upsert([_job(4, title="Software Engineer", location="")], "software engineer", "Remote")
+        self.catalog.upsert([_job(5, title="Software Engineer II", location="")], "software engineer", "Austin, TX")
+        self.assertEqual([j["title"] for j in self.catalog.search("software engineer", "remote")], ["Software Engineer"])
+        self.catalog.fts = False
+        self.assertEqual([j["title"] for j in self.catalog.search("software engineer", "remote")], ["Software Engineer"])
+
+    def test_filters_and_incremental_updates(self):
+        self.assertEqual(len(self.catalog.search("engineer", source="dailyaijobs")), 1)
+        self.assertEqual([j["title"] for j in self.catalog.search("remote", posted_days_ago=7)], ["Data Engineer"])
+        self.assertEqual([j["title"] for j in self.catalog.search("engineer", posted_days_ago=7)], ["Data Engineer"])  # undated out
+        self.catalog.upsert([_job(2, title="Machine Learning Engineer", location="New York, NY")])
+        self.assertEqual([j["title"] for j in self.catalog.search("machine learning")], ["Machine Learning Engineer"])
+        self.assertEqual(self.catalog.search("backend"), [])
+        self.clock.now += 7200
+        self.catalog.upsert([_job(1, title="Data Engineer", location="Remote")])
+        self.catalog.prune(3600)
+        self.assertEqual([j["title"] for j in self.catalog.search("engineer")], ["Data Engineer"])
+
+    def test_substring_fallback_without_fts(self):
+        self.catalog.fts = False
+        self.assertEqual([j["title"] for j in self.catalog.search("engineer", "remote")], ["Data Engineer"])
+
+
+class TestIndexedDiscovery(unittest.TestCase):
+    def setUp(self):
+        self.catalog = JobCatalog(path=None)
+        self.addCleanup(self.catalog.close)
+        patcher = mock.patch.object(job_discovery, "get_job_catalog", return_value=self.catalog)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_index_hit_skips_live_discovery(self):
+        self.catalog.upsert([_job(n, title=f"Python Engineer {n}") for n in range(3)])
+        with mock.patch.object(job_discovery, "discover_jobs") as discover:
+            result = job_discovery.discover_jobs_indexed("python engineer", max_results=3)
+        discover.assert_not_called()
+        self.assertTrue(result["indexed"])
+        self.assertEqual(len(result["jobs"]), 3)
+        self.assertLessEqual({"new_jobs", "source_status", "partial"}, result.keys())  # same shape as live results
+        self.assertEqual(result["source_status"]["catalog"]["found"], 3)
+
+    def test_index_miss_discovers_and_indexes(self):
+        live = {"success": True, "jobs": [_job(1, title="Rust Engineer", source="ziprecruiter", posted_at="2020-01-01")],
+                "query": "rust", "location": "(any)", "sources": ["ziprecruiter"]}
+        with mock.patch.object(job_discovery, "discover_jobs", return_value=live) as discover:
+            result = job_discovery.discover_jobs_indexed("rust", max_results=5, posted_days_ago=7)
+        discover.assert_called_once()
+        self.assertFalse(result["indexed"])
+        self.assertEqual(result["jobs"], [])  # posted_at older than posted_days_ago
+        self.assertEqual(len(self.catalog.search("rust")), 1)
+
+    def test_filters_do_not_change_the_cached_live_result(self):
+        live = {"success": True, "query": "ml", "location": "(any)", "partial": False, "jobs": [
+            _job(1, title="ML Engineer", source="dailyaijobs"), _job(2, title="ML Researcher", source="ziprecruiter"),
+        ]}
+        config = get_config()
+        with mock.patch.object(job_discovery, "_discover_jobs", return_value=live), \
+                mock.patch.object(job_discovery, "_discovery_results", LRUCache(max_entries=2)), \
+                mock.patch.object(config, "DISCOVERY_CACHE_TTL", 60), \
+                mock.patch.object(config, "DISCOVERY_INDEX_MIN_RESULTS", 5):
+            filtered = job_discovery.discover_jobs_indexed("ml", max_results=5, source="dailyaijobs")
+            undated = job_discovery.discover_jobs_indexed("ml", max_results=5, posted_days_ago=7)
+            unfiltered = job_discovery.discover_jobs_indexed("ml", max_results=5)
+        self.assertEqual(len(filtered["jobs"]), 1)
+        self.assertEqual(undated["jobs"], [])
+        self.assertTrue(unfiltered["cached"])
+        self.assertEqual(len(unfiltered["jobs"]), 2)
+
+
+class TestCrawler(unittest.TestCase):
+    def test_crawl_once_upserts_configured_and_user_queries(self):
+        catalog = JobCatalog(path=None)
+        self.addCleanup(catalog.close)
+        crawler = DiscoveryCrawler(catalog, parse_crawl_queries("software engineer|Remote; Software Engineer|remote;;"))
+        self.assertEqual(crawler.queries, [("software engineer", "Remote")])
+        profiles = [{"current_title": "Data Scientist", "skills": "", "location": ""},
+                    {"current_title": "software engineer", "skills": "", "location": "Remote"}]
+        discovered = {"software engineer": [_job(1), _job(2)], "Data Scientist": [_job(3)]}
+        with mock.patch("model.profile_lookup.get_preference_profiles", return_value=profiles), \
+                mock.patch("model.job_discovery.discover_jobs",
+                           side_effect=lambda query, **kw: {"jobs": discovered[query]}) as discover:
+            run = crawler.crawl_once()
+        self.assertEqual(discover.call_count, 2)
+        self.assertEqual(run, {"queries": 2, "failures": 0, "upserted": 3, "new": 3, "new_postings": []})
+        self.assertEqual(len(catalog.lookup("data scientist")), 1)
+        self.assertEqual(crawler.stats()["runs"], 1)
+
+
+class _FakeSupabase:
+    """Chainable table queries answering with fixed rows per table."""
+
+    def __init__(self, tables):
+        self.tables = tables
+
+    def table(self, name):
+        query = mock.MagicMock()
+        for method in ("select", "eq", "in_", "order", "limit"):
+            getattr(query, method).return_value = query
+        query.execute.return_value = mock.Mock(data=self.tables[name])
+        return query
+
+
+class TestCrawlerKeysMatchRequests(unittest.TestCase):
+    def test_preference_profiles_search_like_the_user_profile(self):
+        client = _FakeSupabase({
+            "profiles": [{"first_name": "Ada"}],
+            "user_preferences": [{"user_id": "u1", "roles": ["Data Scientist"], "skills_prefer": ["python"],
+                                  "locations": ["Remote", "Berlin"]}],
+            "user_personal_info": [{"user_id": "u1", "location": "London"}],
+        })
+        env = {"SUPABASE_URL": "https://example.supabase.co", "SUPABASE_SERVICE_ROLE_KEY": "key"}
+        with mock.patch.dict(os.environ, env), mock.patch("supabase.create_client", return_value=client):
+            from model import profile_lookup
+            crawled = profile_lookup.get_preference_profiles(5)
+            requested = profile_lookup.get_user_profile_from_db("u1")
+        key = job_matches._discovery_query_and_location(requested)
+        self.assertEqual(key[1], "London")
+        self.assertEqual([job_matches._discovery_query_and_location(p) for p in crawled], [key])
+
+
+class TestCandidateJobsFromCatalog(unittest.TestCase):
+    def setUp(self):
+        self.catalog = JobCatalog(path=None)
+        self.addCleanup(self.catalog.close)
+        profile = {"current_title": "software engineer", "skills": "", "location": "Remote"}
+        for target, value in (("get_user_profile_from_db", profile), ("get_job_catalog", self.catalog)):
+            patcher = mock.patch.object(job_matches, target, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_catalog_hit_skips_live_discovery(self):
+        self.catalog.upsert([_job(1)], "software engineer", "Remote")
+        with mock.patch.object(job_matches, "discover_jobs") as discover:
+            result = job_matches.get_candidate_jobs_for_user("user-1")
+        discover.assert_not_called()
+        self.assertEqual(result["jobs_from"], "catalog")
+        self.assertEqual([j["title"] for j in result["jobs"]], ["Engineer 1"])
+
+    def test_catalog_miss_discovers_and_records(self):
+        live = {"query": "software engineer", "location": "Remote", "jobs": [_job(2)]}
+        with mock.patch.object(job_matches, "discover_jobs", return_value=live) as discover:
+            result = job_matches.get_candidate_jobs_for_user("user-1")
+        discover.assert_called_once()
+        self.assertEqual(result["jobs_from"], "live")
+        self.assertEqual(len(self.catalog.lookup("software engineer", "Remote")), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,248 @@
+"""
+Unit tests for job discovery parsing, conditional re-discovery and the result cache.
+"""
+
+import asyncio
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+from model import job_discovery
+from model.html_backends import parse_document
+from model.tests.local_server import LocalServer
+from model.utils.cache import LRUCache
+from model.utils.config import get_config
+
+ZIP_PAGE = b"""<html><body><div class="results">
+<article><a href="/job/backend-engineer-1">Backend Engineer</a><span>Acme</span><span>2 days ago</span></article>
+<article><a href="/job/old-role-2">Old Role</a><span>3 weeks ago</span></article>
+<article><a href="/jobs/data-scientist-3">Data Scientist</a><span>5 hours ago</span></article>
+</div></body></html>"""
+
+
+class TestParsePostedDaysAgo(unittest.TestCase):
+    def test_units(self):
+        self.assertEqual(job_discovery._parse_posted_days_ago("Posted 5 hours ago"), 0)
+        self.assertEqual(job_discovery._parse_posted_days_ago("3 days ago"), 3)
+        self.assertEqual(job_discovery._parse_posted_days_ago("1 week ago"), 7)
+        self.assertEqual(job_discovery._parse_posted_days_ago("2 months ago"), 60)
+        self.assertEqual(job_discovery._parse_posted_days_ago("Posted 2 weeks ago, updated 3 days ago"), 3)
+        self.assertEqual(job_discovery._parse_posted_days_ago("Just now"), 0)
+        self.assertIsNone(job_discovery._parse_posted_days_ago("Remote"))
+
+
+class TestCardTexts(unittest.TestCase):
+    def test_shared_ancestors_read_once(self):
+        backend, doc = parse_document(ZIP_PAGE.decode())
+        links = backend.select(doc, backend.compiled("a"))
+        with mock.patch.object(backend, "text", wraps=backend.text) as text:
+            card_text_of = job_discovery._CardTexts(backend)
+            texts = [card_text_of(a) for a in links]
+            again = [card_text_of(a) for a in links]
+        self.assertEqual(texts, again)
+        self.assertIn("2 days ago", texts[0])
+        self.assertNotIn("Old Role", texts[0])
+        self.assertEqual(text.call_count, 3)  # one per <article>; none again on the second pass
+
+
+class TestZipRecruiterCards(unittest.TestCase):
+    def test_recent_cards_only(self):
+        cards = job_discovery._parse_ziprecruiter_cards(ZIP_PAGE.decode())
+        self.assertEqual([c["title"] for c in cards], ["Backend Engineer", "Data Scientist"])
+        self.assertEqual(cards[0]["url"], "https://www.ziprecruiter.com/job/backend-engineer-1")
+        self.assertEqual(cards[0]["posted_days_ago"], 2)
+
+
+class TestConditionalRediscovery(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(os.environ, {"SCRAPER_API_KEY": ""})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        job_discovery._page_cards.clear()
+
+    def test_304_reuses_parsed_cards(self):
+        routes = {"/search": (200, {"Content-Type": "text/html", "ETag": '"v1"'}, ZIP_PAGE)}
+        parse = mock.Mock(side_effect=job_discovery._parse_ziprecruiter_cards)
+        with LocalServer(routes) as srv, mock.patch.dict(job_discovery.CARD_PARSERS, {"ziprecruiter": parse}):
+            url = srv.base_url + "/search"
+            first = job_discovery._fetch_cards(url, "ziprecruiter")
+            second = job_discovery._fetch_cards(url, "ziprecruiter")
+            self.assertEqual(srv.requests[-1][1].get("If-None-Match"), '"v1"')
+        self.assertEqual(first, second)
+        self.assertEqual(parse.call_count, 1)
+        self.assertGreaterEqual(job_discovery.page_cache_stats()["not_modified"], 1)
+
+
+
+class TestDiscoverSingleFlight(unittest.TestCase):
+    def setUp(self):
+        job_discovery._discovery_results.clear()
+        self.addCleanup(job_discovery._discovery_results.clear)
+
+    def test_concurrent_searches_share_one_fanout(self):
+        calls, results = [], []
+
+        def slow_discover(query, location, max_results, deadline=None):
+            calls.append((query, location))
+            time.sleep(0.2)
+            return {"success": True, "jobs": [{"title": "ML Engineer"}], "query": query, "location": location}
+
+        with mock.patch.object(job_discovery, "_discover_jobs", side_effect=slow_discover):
+            threads = [
+                threading.Thread(target=lambda q=q: results.append(job_discovery.discover_jobs(q, "Remote", 20)))
+                for q in ("ml engineer", "ML  Engineer", "ml engineer")
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            job_discovery.discover_jobs("data analyst", "Remote", 20)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(len(results), 3)
+        results[0]["jobs"][0]["title"] = "changed"  # callers get their own job dicts
+        self.assertEqual(results[1]["jobs"][0]["title"], "ML Engineer")
+
+
+class TestDiscoveryCache(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        patches = [
+            mock.patch.object(job_discovery, "_discover_jobs", side_effect=self._discover),
+            mock.patch.object(job_discovery, "_discovery_results", LRUCache(max_entries=2)),
+            mock.patch.object(get_config(), "DISCOVERY_CACHE_TTL", 60),
+            mock.patch.object(get_config(), "DISCOVERY_CACHE_STALE_TTL", 600),
+            mock.patch.object(get_config(), "DISCOVERY_PARTIAL_CACHE_TTL", 10),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.partial = False
+
+    def _discover(self, query, location, max_results, deadline=None):
+        self.calls.append((query, location, max_results))
+        jobs = [{"title": f"{query} {i}", "url": f"https://example.com/{len(self.calls)}/{i}"} for i in range(max_results)]
+        return {"success": True, "jobs": jobs, "query": query, "location": location, "partial": self.partial}
+
+    def _age(self, query, location, seconds):
+        entry = job_discovery._discovery_results.get((query, location))
+        entry["stored_at"] -= seconds
+
+    def test_fresh_hit_by_normalized_key(self):
+        first = job_discovery.discover_jobs("Software Engineer", "Remote", 5)
+        self.assertNotIn("cached", first)
+        second = job_discovery.discover_jobs("  software   ENGINEER", "remote ", 3)
+        self.assertEqual(len(self.calls), 1)
+        self.assertTrue(second["cached"])
+        self.assertEqual(second["cache_state"], "fresh")
+        self.assertLess(second["cache_age_seconds"], 5)
+        self.assertEqual(len(second["jobs"]), 3)
+        second["jobs"][0]["title"] = "changed"  # caller-owned copies
+        self.assertEqual(job_discovery.discover_jobs("software engineer", "remote", 5)["jobs"][0]["title"], "Software Engineer 0")
+        job_discovery.discover_jobs("software engineer", "remote", 10)  # wants more jobs than cached
+        self.assertEqual(len(self.calls), 2)
+
+    def test_stale_hit_served_while_refreshing(self):
+        job_discovery.discover_jobs("data scientist", "", 2)
+        self._age("data scientist", "", 120)
+        stale = job_discovery.discover_jobs("data scientist", "", 2)
+        self.assertEqual(stale["cache_state"], "stale")
+        self.assertGreaterEqual(stale["cache_age_seconds"], 120)
+        self.assertEqual(stale["jobs"][0]["url"], "https://example.com/1/0")
+        for _ in range(50):
+            if not job_discovery._refreshing and len(self.calls) == 2:
+                break
+            time.sleep(0.02)
+        refreshed = job_discovery.discover_jobs("data scientist", "", 2)
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(refreshed["cache_state"], "fresh")
+        self.assertEqual(refreshed["jobs"][0]["url"], "https://example.com/2/0")
+
+    def test_expired_and_evicted_entries_miss(self):
+        job_discovery.discover_jobs("a", "", 1)
+        self._age("a", "", 1000)
+        job_discovery.discover_jobs("a", "", 1)
+        self.assertEqual(len(self.calls), 2)
+        job_discovery.discover_jobs("b", "", 1)
+        job_discovery.discover_jobs("c", "", 1)  # max 2 entries: "a" is evicted
+        job_discovery.discover_jobs("a", "", 1)
+        self.assertEqual(len(self.calls), 5)
+        self.assertEqual(job_discovery.page_cache_stats()["results"]["evictions"], 2)
+
+    def test_partial_results_cached_briefly_and_never_stale(self):
+        self.partial = True  # e.g. one source timed out
+        job_discovery.discover_jobs("ml engineer", "", 2)
+        self.assertTrue(job_discovery.discover_jobs("ml engineer", "", 2)["cached"])
+        self._age("ml engineer", "", 30)  # past DISCOVERY_PARTIAL_CACHE_TTL, well within the stale window
+        self.partial = False
+        again = job_discovery.discover_jobs("ml engineer", "", 2)
+        self.assertNotIn("cached", again)
+        self.assertEqual(len(self.calls), 2)
+
+        with mock.patch.object(get_config(), "DISCOVERY_PARTIAL_CACHE_TTL", 0):
+            self.partial = True
+            job_discovery.discover_jobs("nlp engineer", "", 2)
+            job_discovery.discover_jobs("nlp engineer", "", 2)
+        self.assertEqual(len(self.calls), 4)
+
+
+
+class TestDiscoveryStream(unittest.TestCase):
+    def setUp(self):
+        def slow_zip(*args, **kwargs):
+            time.sleep(0.3)
+            return [
+                {"title": "Backend Engineer", "company": "Acme", "url": "https://www.ziprecruiter.com/job/1", "source": "ziprecruiter"},
+                {"title": "Data Engineer", "company": "Initech", "url": "https://boards.greenhouse.io/initech/jobs/2?utm_source=zip", "source": "ziprecruiter"},
+            ]
+
+        patches = [
+            mock.patch.object(job_discovery, "get_seen_urls", return_value=None),
+            mock.patch.object(job_discovery, "get_job_catalog", return_value=None),
+            mock.patch.object(job_discovery, "_discovery_results", LRUCache(max_entries=2)),
+            mock.patch.object(job_discovery, "discover_ziprecruiter", side_effect=slow_zip),
+            mock.patch.object(job_discovery, "discover_dailyaijobs", return_value=[]),
+            mock.patch.object(job_discovery, "discover_aiworkportal", side_effect=RuntimeError("down")),
+            mock.patch.object(job_discovery, "discover_boards", return_value=[
+                {"title": "Backend Engineer (Remote)", "company": "Acme Inc", "url": "https://boards.greenhouse.io/acme/jobs/1", "source": "greenhouse"},
+                {"title": "Data Engineer", "company": "Initech", "url": "https://boards.greenhouse.io/initech/jobs/2", "source": "greenhouse"},
+            ]),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _events(self, max_results=20):
+        async def collect():
+            return [e async for e in job_discovery.discover_jobs_stream("backend engineer", "", max_results)]
+        return asyncio.run(collect())
+
+    def test_batches_in_completion_order_then_summary(self):
+        events = self._events()
+        batches = {e["source"]: e for e in events[:-1]}
+        self.assertEqual(events[-2]["source"], "ziprecruiter")  # slowest source arrives last
+        self.assertEqual(len(batches["boards"]["jobs"]), 2)
+        self.assertEqual(batches["aiworkportal"]["error"], "down")
+        # URL duplicate dropped, near-duplicate folded into the job already sent
+        self.assertEqual(batches["ziprecruiter"]["jobs"], [])
+        self.assertEqual(batches["ziprecruiter"]["alternate_urls"],
+                         {"https://boards.greenhouse.io/acme/jobs/1": ["https://www.ziprecruiter.com/job/1"]})
+        self.assertEqual((events[-1]["event"], events[-1]["total"], events[-1]["pending"]), ("done", 2, []))
+        self.assertEqual(len(job_discovery._discovery_results), 1)  # complete result cached
+
+        cached = self._events()
+        self.assertEqual([e["source"] for e in cached[:-1]], ["cache"])
+        self.assertEqual(len(cached[0]["jobs"]), 2)
+
+    def test_stops_once_max_results_sent(self):
+        start = time.monotonic()
+        events = self._events(max_results=2)
+        self.assertLess(time.monotonic() - start, 0.25)
+        self.assertEqual(events[-1]["total"], 2)
+        self.assertIn("ziprecruiter", events[-1]["pending"])
+        self.assertEqual(len(job_discovery._discovery_results), 0)  # partial fan-out not cached
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Unit tests for SimHash near-duplicate detection (in-memory and against the job catalog).
+"""
+
+import random
+import unittest
+
+from model import job_discovery
+from model.job_catalog import JobCatalog
+from model.utils.simhash import SimHashIndex, collapse_near_duplicates, hamming, job_simhash
+
+SNIPPET = "Build distributed systems in Go and Python for our payments platform."
+
+
+def _job(url, title="Senior Backend Engineer", company="Acme", snippet=SNIPPET, source="ziprecruiter"):
+    return {"title": title, "company": company, "url": url, "snippet": snippet, "source": source}
+
+
+class TestSimHash(unittest.TestCase):
+    def test_fingerprint_distances(self):
+        base = job_simhash(_job("a", title="Senior Backend Engineer (Remote)", company="Acme, Inc."))
+        self.assertLessEqual(hamming(base, job_simhash(_job("b", snippet=SNIPPET.rstrip(".") + "!"))), 3)
+        self.assertGreater(hamming(base, job_simhash(_job("c", title="Senior Frontend Engineer"))), 3)
+        self.assertGreater(hamming(base, job_simhash(_job("d", company="Globex"))), 3)
+        self.assertIsNone(job_simhash(_job("e", title="Remote")))  # no title words left
+        self.assertIsNone(job_simhash(_job("f", company="")))  # employer unknown
+
+    def test_banded_index_finds_every_near_fingerprint(self):
+        rng = random.Random(7)
+        index = SimHashIndex(max_distance=3)
+        fingerprints = [rng.getrandbits(64) for _ in range(2000)]
+        for i, fp in enumerate(fingerprints):
+            index.add(i, fp)
+        probe = fingerprints[42] ^ (1 << 3) ^ (1 << 30) ^ (1 << 61)  # 3 bits off, in 3 different bands
+        self.assertEqual(index.near(probe), [42])
+        self.assertEqual(index.near(fingerprints[42] ^ 0b1111), [])
+
+    def test_collapse_keeps_first_with_alternates(self):
+        jobs = collapse_near_duplicates([
+            _job("https://boards.greenhouse.io/acme/jobs/1", source="greenhouse"),
+            _job("https://www.ziprecruiter.com/job/1", title="Senior Backend Engineer - Remote"),
+            _job("https://dailyaijobs.com/job/2", title="Staff ML Engineer"),
+            _job("https://aiworkportal.com/job/3", company="Acme LLC", source="aiworkportal"),
+        ])
+        self.assertEqual([j["url"] for j in jobs], ["https://boards.greenhouse.io/acme/jobs/1", "https://dailyaijobs.com/job/2"])
+        self.assertEqual(jobs[0]["alternate_urls"], ["https://www.ziprecruiter.com/job/1", "https://aiworkportal.com/job/3"])
+
+
+class TestSearchCardDuplicates(unittest.TestCase):
+    """Cards as the search-page parsers produce them (no snippet, company only when the page shows one)."""
+
+    def test_same_posting_on_two_boards_collapses(self):
+        zip_cards = job_discovery._parse_ziprecruiter_cards(
+            '<ul><li><a href="https://www.ziprecruiter.com/c/Acme-Inc/Job/ML-Engineer/-in-Remote?jid=1" data-job-id="1">ML Engineer</a>'
+            '<span>1 day ago</span></li>'
+            '<li><a href="https://www.ziprecruiter.com/jobs/data-engineer?jid=2">Data Engineer</a><span>2 days ago</span></li></ul>'
+        )
+        portal_cards = job_discovery._parse_aiworkportal_cards(
+            '<ul><li><div><a href="/job/ml-engineer-acme">ML Engineer</a><div class="company">Acme</div></div>'
+            '<time>1 day ago</time></li></ul>'
+        )
+        daily_cards = job_discovery._parse_dailyaijobs_cards(
+            '<ul><li><a href="/job/data-engineer-9">Data Engineer</a> Remote · 2 days ago</li>'
+            '<li><a href="/job/data-engineer-10">Data Engineer</a> Remote · 5 days ago</li></ul>'
+        )
+        self.assertEqual((zip_cards[0]["company"], portal_cards[0]["company"]), ("Acme Inc", "Acme"))
+        self.assertEqual(daily_cards[0]["company"], "")
+
+        jobs = collapse_near_duplicates(zip_cards + portal_cards + daily_cards)
+        self.assertEqual([j["url"] for j in jobs], [zip_cards[0]["url"], zip_cards[1]["url"]] + [j["url"] for j in daily_cards])
+        self.assertEqual(jobs[0]["alternate_urls"], [portal_cards[0]["url"]])
+        self.assertNotIn("alternate_urls", jobs[1])  # company-less cards are never merged
+
+    def test_same_title_dailyaijobs_cards_survive(self):
+        for age in ("1 day ago", ""):
+            with self.subTest(age=age or "undated"):
+                cards = job_discovery._parse_dailyaijobs_cards(
+                    f'<ul><li><a href="/job/mle-1">Machine Learning Engineer</a> {age}</li>'
+                    f'<li><a href="/job/mle-2">Machine Learning Engineer</a> {age}</li></ul>'
+                )
+                self.assertEqual(len(cards), 2)
+                self.assertEqual(len(collapse_near_duplicates(cards)), 2)
+
+
+class TestCatalogClusters(unittest.TestCase):
+    def setUp(self):
+        self.catalog = JobCatalog(path=None)
+        self.addCleanup(self.catalog.close)
+
+    def test_new_posting_joins_cataloged_cluster(self):
+        self.catalog.upsert([_job("https://boards.greenhouse.io/acme/jobs/1", source="greenhouse")], "backend engineer")
+        self.catalog.upsert([
+            _job("https://www.ziprecruiter.com/job/1"),
+            _job("https://www.ziprecruiter.com/job/2", title="Data Scientist"),
+        ], "backend engineer")
+        self.assertEqual(self.catalog.stats()["near_duplicates"], 1)
+
+        jobs = self.catalog.lookup("backend engineer")
+        self.assertEqual(len(jobs), 2)
+        merged = next(j for j in jobs if j["title"] == "Senior Backend Engineer")
+        self.assertEqual(len(merged["alternate_urls"]), 1)
+        self.assertEqual(len(self.catalog.search("backend engineer")), 1)
+
+        self.assertEqual(self.catalog.prune(-1), 3)  # band rows go with their postings
+        self.assertEqual(self.catalog._conn.execute("SELECT COUNT(*) FROM job_simhash_bands").fetchone(), (0,))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Unit tests for the parse worker pool: worker results match in-thread parsing.
+"""
+
+import asyncio
+import os
+import signal
+import unittest
+from unittest import mock
+
+from model import job_discovery, parse_pool
+from model.job_scraper import JobScraper
+from model.parse_pool import ParsePool
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+class TestParsePool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ParsePool(workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+
+    def test_workers_prewarmed(self):
+        stats = self.pool.stats()
+        self.assertTrue(stats["worker_pids"])
+        self.assertNotIn(os.getpid(), stats["worker_pids"])
+        self.assertIsNotNone(stats["warm_ms"])
+
+    def test_job_pages_match_inline(self):
+        scraper = JobScraper(use_playwright=False, use_cache=False)
+        for name, url in (
+            ("indeed_job.html", "https://www.indeed.com/viewjob?jk=abc"),
+            ("jsonld_job.html", "https://boards.greenhouse.io/example/jobs/2"),
+        ):
+            with self.subTest(page=name):
+                html = _fixture(name)
+                self.assertEqual(self.pool.parse_job(html, url), scraper._parse_page(html, url))
+
+    def test_cards_match_inline(self):
+        html = _fixture("ziprecruiter_search.html")
+        self.assertEqual(
+            self.pool.parse_cards("ziprecruiter", html),
+            job_discovery._parse_ziprecruiter_cards(html),
+        )
+
+    def test_worker_errors_counted(self):
+        failed = self.pool.stats()["failed"]
+        with self.assertRaises(KeyError):
+            self.pool.parse_cards("no-such-board", "<html></html>")
+        with self.assertRaises(KeyError):
+            asyncio.run(self.pool._call_async(parse_pool._parse_cards, "no-such-board", b""))
+        self.assertEqual(self.pool.stats()["failed"] - failed, 2)
+        self.assertEqual(self.pool.stats()["restarts"], 0)
+
+    def test_scraper_uses_pool(self):
+        scraper = JobScraper(use_playwright=False, use_cache=False)
+        html, url = _fixture("jsonld_job.html"), "https://boards.greenhouse.io/example/jobs/2"
+        submitted = self.pool.submitted
+        meta = {}
+        with mock.patch.object(parse_pool, "_parse_pool", self.pool):
+            text = scraper._parse_html(html, url, meta)
+            async_text = asyncio.run(scraper._parse_html_async(html, url))
+        self.assertEqual(self.pool.submitted - submitted, 2)
+        self.assertEqual(text, async_text)
+        self.assertEqual(meta["job"]["company"], "Example Labs")
+
+    def test_dead_worker_restarts_pool(self):
+        pool = ParsePool(workers=1)
+        self.addCleanup(pool.shutdown)
+        os.kill(pool.worker_pids[0], signal.SIGKILL)
+        text, _ = pool.parse_job(_fixture("generic_job.html"), "https://careers.example.com/jobs/1")
+        self.assertGreater(len(text), 500)
+        self.assertEqual(pool.stats()["restarts"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
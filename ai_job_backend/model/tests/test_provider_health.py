@@ -0,0 +1,89 @@
+"""
+Unit tests for per-domain provider ordering and circuit breakers.
+"""
+
+import unittest
+
+from model.job_scraper import JobScraper
+from model.provider_health import CLOSED, HALF_OPEN, OPEN, ProviderHealth
+from model.tests.local_server import LocalServer
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestProviderHealth(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.health = ProviderHealth(failure_threshold=3, window_seconds=60, cooldown_seconds=30, clock=self.clock)
+
+    def _state(self, domain, provider):
+        return self.health.stats()["domains"][domain][provider]["state"]
+
+    def test_untried_providers_keep_default_order(self):
+        self.assertEqual(self.health.order("a.com", ["requests", "scraperapi"]), ["requests", "scraperapi"])
+
+    def test_reorders_by_success_rate(self):
+        for _ in range(2):
+            self.health.record("a.com", "requests", False, 200)
+            self.health.record("a.com", "scraperapi", True, 4000)
+        self.assertEqual(self.health.order("a.com", ["requests", "scraperapi"]), ["scraperapi", "requests"])
+        # Other domains are unaffected
+        self.assertEqual(self.health.order("b.com", ["requests", "scraperapi"]), ["requests", "scraperapi"])
+
+    def test_breaker_opens_after_k_failures_in_window(self):
+        self.health.record("a.com", "requests", False, 100)
+        self.clock.now += 61  # first failure falls out of the window
+        self.health.record("a.com", "requests", False, 100)
+        self.health.record("a.com", "requests", False, 100)
+        self.assertEqual(self._state("a.com", "requests"), CLOSED)
+        self.health.record("a.com", "requests", False, 100)
+        self.assertEqual(self._state("a.com", "requests"), OPEN)
+        self.assertEqual(self.health.order("a.com", ["requests", "playwright"]), ["playwright"])
+        self.assertFalse(self.health.acquire("a.com", "requests"))
+
+    def test_half_open_probe_recovers(self):
+        for _ in range(3):
+            self.health.record("a.com", "requests", False, 100)
+        self.clock.now += 30
+        self.assertEqual(self._state("a.com", "requests"), HALF_OPEN)
+        self.assertTrue(self.health.acquire("a.com", "requests"))
+        self.assertFalse(self.health.acquire("a.com", "requests"))  # single probe in flight
+        self.health.record("a.com", "requests", True, 100)
+        self.assertEqual(self._state("a.com", "requests"), CLOSED)
+        self.assertTrue(self.health.acquire("a.com", "requests"))
+
+    def test_failed_probe_reopens(self):
+        for _ in range(3):
+            self.health.record("a.com", "requests", False, 100)
+        self.clock.now += 30
+        self.assertTrue(self.health.acquire("a.com", "requests"))
+        self.health.record("a.com", "requests", False, 100)
+        self.assertEqual(self._state("a.com", "requests"), OPEN)
+        self.clock.now += 29
+        self.assertFalse(self.health.acquire("a.com", "requests"))
+
+
+class TestScraperCircuitBreaker(unittest.TestCase):
+    def test_blocked_domain_fails_fast(self):
+        health = ProviderHealth(failure_threshold=2, cooldown_seconds=300, clock=FakeClock())
+        routes = {"/job/blocked": (403, {"Content-Type": "text/html"}, b"forbidden")}
+        with LocalServer(routes) as srv, JobScraper(use_playwright=False, use_cache=False, health=health) as scraper:
+            url = srv.base_url + "/job/blocked"
+            for _ in range(2):
+                self.assertFalse(scraper.scrape(url)["success"])
+            hits = srv.hits("/job/blocked")
+            result = scraper.scrape(url)
+            self.assertEqual(result["circuit_open"], ["requests"])
+            self.assertEqual(srv.hits("/job/blocked"), hits)  # no request made
+        stats = health.stats()["domains"]["127.0.0.1"]["requests"]
+        self.assertEqual((stats["failures"], stats["trips"]), (2, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Unit tests for the two-tier scrape cache (LRU + SQLite).
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from model.scrape_cache import ScrapeCache
+from model.utils.urls import canonical_job_url
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCanonicalJobUrl(unittest.TestCase):
+    def test_tracking_params_and_case_removed(self):
+        self.assertEqual(
+            canonical_job_url("HTTPS://WWW.Indeed.com:443/viewjob/?utm_source=x&jk=123#apply"),
+            "https://www.indeed.com/viewjob?jk=123",
+        )
+
+    def test_non_http_unchanged(self):
+        self.assertEqual(canonical_job_url("  not a url "), "not a url")
+
+    def test_invalid_port_unchanged(self):
+        for url in ("http://x.com:abc/job", "https://x.com:99999/job?utm_source=y"):
+            with self.subTest(url=url):
+                self.assertEqual(canonical_job_url(f" {url} "), url)
+
+
+class TestScrapeCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.path = os.path.join(self.tmp, "cache.sqlite3")
+        self.clock = FakeClock()
+
+    def _cache(self, **kwargs) -> ScrapeCache:
+        cache = ScrapeCache(path=self.path, clock=self.clock, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_memory_hit_by_canonical_url(self):
+        cache = self._cache()
+        cache.set("https://indeed.com/viewjob?jk=1", {"success": True, "text": "desc"}, "indeed")
+        hit = cache.get("https://indeed.com/viewjob?jk=1&utm_campaign=abc")
+        self.assertIsNotNone(hit)
+        self.assertEqual(hit.state, "fresh")
+        self.assertEqual(hit.value["text"], "desc")
+        self.assertEqual(cache.stats()["memory_hits"], 1)
+
+    def test_disk_tier_survives_new_instance(self):
+        self._cache().set("https://jobs.lever.co/acme/1", {"success": True, "text": "x" * 500}, "lever")
+        hit = self._cache().get("https://jobs.lever.co/acme/1")
+        self.assertIsNotNone(hit)
+        self.assertEqual(hit.value["text"], "x" * 500)
+
+    def test_lru_eviction_falls_back_to_disk(self):
+        cache = self._cache(memory_entries=1)
+        cache.set("https://a.com/job/1", {"text": "one"}, "generic")
+        cache.set("https://a.com/job/2", {"text": "two"}, "generic")
+        self.assertEqual(cache.stats()["memory"]["evictions"], 1)
+        self.assertEqual(cache.get("https://a.com/job/1").value["text"], "one")
+        self.assertEqual(cache.stats()["disk_hits"], 1)
+
+    def test_per_site_ttl_stale_then_expired(self):
+        cache = self._cache(stale_ttl=100, site_ttls={"indeed": 10})
+        cache.set("https://indeed.com/viewjob?jk=2", {"text": "t"}, "indeed")
+        self.clock.now += 50
+        self.assertEqual(cache.get("https://indeed.com/viewjob?jk=2").state, "stale")
+        self.clock.now += 100
+        self.assertIsNone(cache.get("https://indeed.com/viewjob?jk=2"))
+        self.assertEqual(cache.stats()["expired"], 1)
+
+    def test_revalidate_runs_once_per_url(self):
+        cache = self._cache()
+        release = threading.Event()
+        done = threading.Event()
+        calls = []
+
+        def refresh():
+            calls.append(1)
+            release.wait(5)
+            cache.set("https://a.com/job/3", {"text": "new"}, "generic")
+            done.set()
+            return {"text": "new"}
+
+        self.assertTrue(cache.revalidate("https://a.com/job/3", refresh))
+        self.assertFalse(cache.revalidate("https://a.com/job/3?utm_medium=email", refresh))
+        release.set()
+        self.assertTrue(done.wait(5))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.get("https://a.com/job/3").value["text"], "new")
+
+
+if __name__ == "__main__":
+    unittest.main()
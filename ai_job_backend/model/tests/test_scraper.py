@@ -2,8 +2,22 @@
 Unit tests for job scraper
 """
 
+import asyncio
+import threading
+import time
 import unittest
-from model.job_scraper import JobScraper, scrape_job_description
+from unittest import mock
+
+from model import job_scraper
+from model.job_scraper import BrowserPool, JobScraper, scrape_job_description
+from model.scrape_cache import ScrapeCache
+from model.tests.local_server import LocalServer
+
+JOB_PAGE = (
+    "<html><body><main><h1>Backend Engineer</h1>"
+    + "<p>Build and operate Python services for our hiring platform, own APIs end to end.</p>" * 10
+    + "</main></body></html>"
+).encode()
 
 
 class TestJobScraper(unittest.TestCase):
@@ -44,6 +58,443 @@ class TestJobScraper(unittest.TestCase):
             self.assertIsNotNone(scraper)
         # Should be cleaned up after context exit
 
+    def test_cached_scrape_revalidates_with_etag(self):
+        """Stale entry + 304 -> entry re-stamped without re-download."""
+        routes = {"/job/1": (200, {"Content-Type": "text/html", "ETag": '"abc"'}, JOB_PAGE)}
+        cache = ScrapeCache(path=None)
+        self.addCleanup(cache.close)
+        with LocalServer(routes) as srv, JobScraper(use_playwright=False, cache=cache) as scraper:
+            url = srv.base_url + "/job/1"
+            first = scraper.scrape(url)
+            self.assertTrue(first["success"])
+            second = scraper.scrape(url)
+            self.assertTrue(second.get("cached"))
+            self.assertEqual(srv.hits("/job/1"), 1)
+
+            entry = cache.get(url).entry
+            self.assertEqual(entry["validators"]["etag"], '"abc"')
+            refreshed = scraper._revalidate(url, "generic", entry)
+            self.assertEqual(refreshed["text"], first["text"])
+            self.assertEqual(srv.requests[-1][1].get("If-None-Match"), '"abc"')
+        self.assertEqual(cache.stats()["not_modified"], 1)
+
+    def test_scrape_async_uses_shared_client(self):
+        routes = {path: (200, {"Content-Type": "text/html"}, JOB_PAGE) for path in ("/job/2", "/job/3")}
+
+        async def run(base):
+            with JobScraper(use_playwright=False, use_cache=False) as scraper:
+                results = await asyncio.gather(scraper.scrape_async(base + "/job/2"), scraper.scrape_async(base + "/job/3"))
+            engine = job_scraper.get_async_http_engine()
+            requests_made = engine.requests
+            await job_scraper.close_async_http_engine()
+            return results, requests_made
+
+        with LocalServer(routes) as srv:
+            results, requests_made = asyncio.run(run(srv.base_url))
+        self.assertTrue(all(r["success"] and r["method"] == "requests" for r in results))
+        self.assertEqual(requests_made, 2)
+
+    def test_module_scrapes_share_pooled_session(self):
+        routes = {f"/job/{i}": (200, {"Content-Type": "text/html"}, JOB_PAGE) for i in range(10, 14)}
+        self.addCleanup(job_scraper.close_job_scrapers)
+        with LocalServer(routes, keep_alive=True) as srv, \
+                mock.patch.object(job_scraper, "get_scrape_cache", return_value=ScrapeCache(path=None)):
+            for path in routes:
+                self.assertIn("Backend Engineer", scrape_job_description(srv.base_url + path, use_playwright=False))
+        scraper = job_scraper.get_job_scraper(use_playwright=False)
+        self.assertIs(scraper, job_scraper.get_job_scraper(False, None))
+        stats = job_scraper.job_scraper_stats()["playwright=false,scraperapi=false"]
+        self.assertEqual(stats["requests"], 4)
+        self.assertEqual(stats["connections_opened"], 1)
+        self.assertEqual(stats["reused"], 3)
+
+
+
+class TestNoiseCleaning(unittest.TestCase):
+    def test_single_pass_matches_pattern_loop(self):
+        scraper = JobScraper(use_playwright=False, use_cache=False)
+        dirty = (
+            "Home | Careers | Senior Engineer\n\nApply   now Save job We build ML systems. "
+            "See more\t© 2024 Acme Corp. All rights reserved. Privacy Policy | TERMS OF SERVICE"
+        )
+        self.assertEqual(
+            scraper._clean_text(dirty),
+            "Careers | Senior Engineer We build ML systems. Acme Corp. |",
+        )
+        self.assertEqual(scraper._clean_text("[Advertisement] Role overview"), "Role overview")
+
+    def test_site_phrases(self):
+        scraper = JobScraper(use_playwright=False, use_cache=False)
+        text = "Apply for this job Build data pipelines. Back to jobs"
+        self.assertEqual(scraper._clean_text(text, "greenhouse"), "Build data pipelines.")
+        self.assertEqual(scraper._clean_text(text), text)
+
+    def test_phrase_regex_prefers_longest(self):
+        from model.utils.text import compile_phrases, phrase_regex
+        self.assertEqual(phrase_regex(["see more", "See less"]), r"see\s+(?:less|more)")
+        self.assertEqual(compile_phrases(["join", "join now"]).search("x JOIN  NOW").group(0), "JOIN  NOW")
+
+    def test_login_wall(self):
+        padding = "<p>" + "x" * 600 + "</p>"
+        self.assertTrue(job_scraper._is_login_wall("<h1>Sign in to LinkedIn</h1>" + padding))
+        self.assertFalse(job_scraper._is_login_wall("<h1>Data Engineer</h1>" + padding))
+        self.assertFalse(job_scraper._is_login_wall(padding * 20 + "join now"))  # beyond the first 8000 chars
+
+
+class _ConcurrencyProbe:
+    """Fake scrape: records peak in-flight calls overall and per host."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = {}
+        self.peak = {}
+        self.peak_total = 0
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _enter(self, url):
+        host = JobScraper._domain(url)
+        with self._lock:
+            self.calls.append(url)
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+            self.peak_total = max(self.peak_total, sum(self.active.values()))
+
+    def _exit(self, url):
+        with self._lock:
+            self.active[JobScraper._domain(url)] -= 1
+
+    def scrape(self, url, use_cache=True):
+        self._enter(url)
+        time.sleep(self.delay)
+        self._exit(url)
+        return {"success": True, "text": "x", "method": "requests", "url": url}
+
+    async def scrape_async(self, url, use_cache=True):
+        self._enter(url)
+        await asyncio.sleep(self.delay)
+        self._exit(url)
+        return {"success": True, "text": "x", "method": "requests", "url": url}
+
+
+BATCH_URLS = (
+    [f"https://www.indeed.com/viewjob?jk={i}" for i in range(6)]
+    + [f"https://jobs.lever.co/acme/{i}" for i in range(4)]
+    + ["https://www.indeed.com/viewjob?jk=0&utm_source=mail", "  "]
+)
+
+
+class TestScrapeMany(unittest.TestCase):
+    def test_caps_and_dedupe(self):
+        probe = _ConcurrencyProbe()
+        scraper = JobScraper(use_playwright=False, use_cache=False)
+        with mock.patch.object(scraper, "scrape", probe.scrape):
+            results = scraper.scrape_many(BATCH_URLS, max_concurrency=3, per_domain=2)
+        self.assertEqual([r["url"] for r in results], BATCH_URLS[:10])
+        self.assertEqual(len(probe.calls), 10)
+        self.assertLessEqual(probe.peak_total, 3)
+        self.assertLessEqual(max(probe.peak.values()), 2)
+        self.assertTrue(all(r["method"] == "requests" and r["latency_ms"] >= 0 for r in results))
+
+    def test_iter_yields_errors_as_results(self):
+        scraper = JobScraper(use_playwright=False, use_cache=False)
+        with mock.patch.object(scraper, "scrape", side_effect=RuntimeError("boom")):
+            results = list(scraper.iter_scrape_many(BATCH_URLS[:2]))
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(not r["success"] and "boom" in r["error"] and r["method"] is None for r in results))
+
+    def test_async_caps_and_streaming(self):
+        probe = _ConcurrencyProbe()
+        scraper = JobScraper(use_playwright=False, use_cache=False)
+
+        async def collect():
+            return [r async for r in scraper.scrape_many_async(BATCH_URLS, max_concurrency=3, per_domain=2)]
+
+        with mock.patch.object(scraper, "scrape_async", probe.scrape_async):
+            results = asyncio.run(collect())
+        self.assertEqual(sorted(r["url"] for r in results), sorted(BATCH_URLS[:10]))
+        self.assertLessEqual(probe.peak_total, 3)
+        self.assertEqual(max(probe.peak.values()), 2)
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Concurrent scrapes of one canonical URL share a single fetch."""
+
+    URLS = ["https://www.indeed.com/viewjob?jk=sf1", "https://www.indeed.com/viewjob?jk=sf1&utm_source=mail"]
+
+    def _slow_scrape(self, calls):
+        def run(url, site, meta):
+            calls.append(url)
+            time.sleep(0.2)
+            return {"success": True, "text": "x" * 300, "method": "requests", "url": url}
+        return run
+
+    def test_threads_share_one_scrape(self):
+        calls, results = [], []
+        scraper = JobScraper(use_playwright=False, use_cache=False)
+        with mock.patch.object(scraper, "_scrape_uncached", side_effect=self._slow_scrape(calls)):
+            threads = [
+                threading.Thread(target=lambda u=u: results.append(scraper.scrape(u)))
+                for u in self.URLS * 3
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 6)
+        self.assertEqual(sum(1 for r in results if r.get("coalesced")), 5)
+        self.assertEqual(sorted(r["url"] for r in results), sorted(self.URLS * 3))
+
+    def test_async_callers_share_one_scrape(self):
+        calls = []
+
+        async def run(url, site, meta):
+            calls.append(url)
+            await asyncio.sleep(0.1)
+            return {"success": True, "text": "x" * 300, "method": "requests", "url": url}
+
+        async def main():
+            return await asyncio.gather(*(scraper.scrape_async(u) for u in self.URLS * 2))
+
+        scraper = JobScraper(use_playwright=False, use_cache=False)
+        with mock.patch.object(scraper, "_scrape_uncached_async", side_effect=run):
+            results = asyncio.run(main())
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(r["success"] for r in results))
+
+    def test_cancelled_leader_hands_over(self):
+        from model.utils.cache import SingleFlight
+        flight = SingleFlight()
+        runs = []
+
+        async def work():
+            runs.append(1)
+            await asyncio.sleep(0.1)
+            return len(runs)
+
+        async def main():
+            leader = asyncio.create_task(flight.do_async("k", work))
+            await asyncio.sleep(0.01)
+            follower = asyncio.create_task(flight.do_async("k", work))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await follower
+
+        self.assertEqual(asyncio.run(main()), (2, False))
+        self.assertEqual(flight.stats()["in_flight"], 0)
+
+
+LONG_TEXT = "Responsibilities include building data pipelines and ML services. " * 10
+
+
+class TestHedgedScrape(unittest.TestCase):
+    """Hedged mode: requests first, ScraperAPI raced after hedge_delay, one deadline."""
+
+    def _scraper(self, **kwargs):
+        from model.provider_health import ProviderHealth
+        kwargs.setdefault("hedge_delay", 0.1)
+        kwargs.setdefault("deadline", 5)
+        scraper = JobScraper(use_playwright=False, scraper_api_key="k", use_cache=False,
+                             health=ProviderHealth(), hedge=True, **kwargs)
+        self.addCleanup(scraper.close)
+        return scraper
+
+    @staticmethod
+    def _providers(delays, texts):
+        def run(provider, url, meta):
+            time.sleep(delays[provider])
+            return texts[provider]
+
+        async def run_async(provider, url, meta):
+            await asyncio.sleep(delays[provider])
+            return texts[provider]
+        return run, run_async
+
+    def test_fast_requests_wins_without_hedge(self):
+        scraper = self._scraper()
+        run, _ = self._providers({"requests": 0.01, "scraperapi": 0.01}, {"requests": LONG_TEXT, "scraperapi": LONG_TEXT})
+        with mock.patch.object(scraper, "_run_provider", side_effect=run):
+            result = scraper.scrape("https://careers.example.com/job/1")
+        self.assertEqual((result["method"], result["hedged"]), ("requests", ["requests"]))
+
+    def test_slow_requests_is_hedged(self):
+        scraper = self._scraper()
+        # requests returns a too-short shell page late; ScraperAPI wins the race
+        run, _ = self._providers({"requests": 0.6, "scraperapi": 0.05}, {"requests": "short", "scraperapi": LONG_TEXT})
+        start = time.perf_counter()
+        with mock.patch.object(scraper, "_run_provider", side_effect=run):
+            result = scraper.scrape("https://www.glassdoor.com/job-listing/1")
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual((result["method"], result["hedged"]), ("scraperapi", ["requests", "scraperapi"]))
+
+    def test_deadline_bounds_scrape(self):
+        scraper = self._scraper(deadline=0.3)
+        run, _ = self._providers({"requests": 2, "scraperapi": 2}, {"requests": LONG_TEXT, "scraperapi": LONG_TEXT})
+        start = time.perf_counter()
+        with mock.patch.object(scraper, "_run_provider", side_effect=run):
+            result = scraper.scrape("https://careers.example.com/job/2")
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertTrue(result["deadline_exceeded"])
+        self.assertFalse(result["success"])
+
+    def test_async_cancels_losers(self):
+        scraper = self._scraper()
+        _, run_async = self._providers({"requests": 1.0, "scraperapi": 0.05}, {"requests": LONG_TEXT, "scraperapi": LONG_TEXT})
+        with mock.patch.object(scraper, "_run_provider_async", side_effect=run_async):
+            start = time.perf_counter()
+            result = asyncio.run(scraper.scrape_async("https://careers.example.com/job/3"))
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(result["method"], "scraperapi")
+        stats = scraper.health.stats()["domains"]["careers.example.com"]
+        self.assertEqual(stats["requests"]["attempts"], 0)  # cancelled, not counted as a failure
+        self.assertEqual(stats["scraperapi"]["successes"], 1)
+
+
+class _FakeRequest:
+    def __init__(self, url, resource_type):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class _FakeRoute:
+    def __init__(self, request, outcomes):
+        self.request = request
+        self.outcomes = outcomes
+
+    async def abort(self):
+        self.outcomes.append(("abort", self.request.url))
+
+    async def continue_(self):
+        self.outcomes.append(("continue", self.request.url))
+
+
+class _FakePage:
+    # Subresources the fake "page" requests during goto()
+    SUBRESOURCES = [
+        ("https://example.com/app.js", "script"),
+        ("https://example.com/logo.png", "image"),
+        ("https://fonts.example.com/inter.woff2", "font"),
+        ("https://www.google-analytics.com/analytics.js", "script"),
+        ("https://example.com/api/job", "xhr"),
+    ]
+
+    def __init__(self):
+        self.outcomes = []
+        self._route = None
+
+    async def route(self, pattern, handler):
+        self._route = handler
+
+    async def goto(self, url, **kwargs):
+        await asyncio.sleep(0.01)
+        if self._route:
+            for sub_url, kind in self.SUBRESOURCES:
+                await self._route(_FakeRoute(_FakeRequest(sub_url, kind), self.outcomes))
+
+    async def wait_for_selector(self, selector, timeout=None, **kwargs):
+        if "#jobDescriptionText" not in selector:
+            await asyncio.sleep(timeout / 1000)
+            raise TimeoutError(f"Timeout {timeout}ms waiting for {selector}")
+
+    async def content(self):
+        return "<html><body>job</body></html>"
+
+    async def close(self):
+        pass
+
+
+class _FakeContext:
+    async def new_page(self):
+        return _FakePage()
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **kwargs):
+        return _FakeContext()
+
+    async def close(self):
+        self.connected = False
+
+
+class _FakePlaywright:
+    class chromium:
+        @staticmethod
+        async def launch(**kwargs):
+            return _FakeBrowser()
+
+    async def stop(self):
+        pass
+
+
+class _FakeAsyncPlaywright:
+    async def start(self):
+        return _FakePlaywright()
+
+
+class TestBrowserPool(unittest.TestCase):
+    """BrowserPool leasing/recycling against a fake Playwright driver."""
+
+    def setUp(self):
+        patches = [
+            mock.patch.object(job_scraper, "PLAYWRIGHT_AVAILABLE", True),
+            mock.patch.object(job_scraper, "async_playwright", _FakeAsyncPlaywright, create=True),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.pool = BrowserPool(size=2, max_pages_per_browser=2, recycle_after=3, use_stealth=False)
+        self.addCleanup(self.pool.close)
+
+    def test_browsers_reused_across_fetches(self):
+        for _ in range(2):
+            self.assertIn("job", self.pool.fetch_html("https://example.com/job", settle_seconds=0))
+        stats = self.pool.stats()
+        self.assertEqual(stats["leases"], 2)
+        self.assertEqual(stats["launches"], 1)
+
+    def test_render_blocks_assets_and_waits_for_selector(self):
+        rendered = self.pool.render(
+            "https://www.indeed.com/viewjob?jk=1", wait_selectors=["div#jobDescriptionText"], settle_seconds=3.0,
+        )
+        metrics = rendered["metrics"]
+        self.assertIn("job", rendered["html"])
+        self.assertEqual((metrics["requests"], metrics["blocked"]), (5, 3))
+        self.assertEqual(metrics["blocked_by_type"], {"image": 1, "font": 1, "tracker": 1})
+        self.assertGreater(metrics["est_bytes_saved"], 0)
+        self.assertTrue(metrics["selector_matched"])
+        self.assertGreater(metrics["wait_time_saved_ms"], 2500)
+
+        missing = self.pool.render("https://example.com/x", wait_selectors=["main"], selector_timeout_ms=50)
+        self.assertFalse(missing["metrics"]["selector_matched"])
+        self.assertEqual(self.pool.stats()["blocked_requests"], 6)
+
+        # No selector ever appears: the wait lasts selector_timeout_ms, even past the settle time
+        slow = self.pool.render("https://example.com/y", wait_selectors=["main"], selector_timeout_ms=300, settle_seconds=0.1)
+        self.assertGreaterEqual(slow["metrics"]["wait_ms"], 250)
+        self.assertEqual(slow["metrics"]["wait_time_saved_ms"], 0)
+
+    def test_recycle_after_k_uses(self):
+        async def run_many():
+            async def title(page):
+                return "ok"
+            return await asyncio.gather(*[
+                self.pool.run_page_async("https://example.com/job", title) for _ in range(9)
+            ])
+
+        self.assertEqual(asyncio.run(run_many()), ["ok"] * 9)
+        stats = self.pool.stats()
+        self.assertEqual(stats["active_pages"], 0)
+        self.assertGreaterEqual(stats["recycles"], 2)
+        for b in stats["browsers"]:
+            self.assertLessEqual(b["uses"], 3)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,114 @@
+"""
+Unit tests for canonical job URLs, the scalable Bloom filter and incremental (seen-URL) discovery.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from model import job_discovery
+from model.crawler import DiscoveryCrawler
+from model.job_catalog import JobCatalog
+from model.seen_urls import SeenUrls
+from model.utils.bloom import ScalableBloomFilter
+from model.utils.cache import LRUCache
+from model.utils.urls import canonical_job_url
+
+ZIP_URL = "https://www.ziprecruiter.com/c/Acme/Job/Backend-Engineer/-in-Remote?jid=abc123"
+
+
+class TestCanonicalJobUrl(unittest.TestCase):
+    def test_tracking_variants_collapse(self):
+        for url in (
+            ZIP_URL + "&lvk=Xy9&tsid=77&zrclid=0f1",
+            "https://WWW.ZipRecruiter.com./c/Acme/Job//Backend-Engineer/-in-Remote/?utm_campaign=mail&jid=abc123#apply",
+        ):
+            with self.subTest(url=url):
+                self.assertEqual(canonical_job_url(url), ZIP_URL)
+        self.assertNotEqual(canonical_job_url(ZIP_URL.replace("abc123", "abc124")), ZIP_URL)
+
+
+class TestScalableBloomFilter(unittest.TestCase):
+    def test_no_false_negatives_and_bounded_error_rate(self):
+        bloom = ScalableBloomFilter(capacity=1000, error_rate=0.01)
+        keys = [f"https://example.com/jobs/{i}" for i in range(3000)]
+        self.assertGreater(sum(bloom.add(k) for k in keys), len(keys) * 0.99)  # misses only on false positives
+        self.assertTrue(all(k in bloom for k in keys))
+        self.assertEqual(bloom.stats()["slices"], 2)  # 1000 + 2000 capacity
+        false_positives = sum(f"https://example.com/other/{i}" in bloom for i in range(20000))
+        self.assertLess(false_positives / 20000, 0.01)
+        self.assertLess(bloom.stats()["estimated_error_rate"], 0.01)
+
+    def test_snapshot_round_trip(self):
+        bloom = ScalableBloomFilter(capacity=50, error_rate=0.001)
+        for i in range(120):
+            bloom.add(f"k{i}")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "seen.bloom")
+            bloom.save(path)
+            restored = ScalableBloomFilter.load(path)
+            with open(path, "r+b") as f:
+                f.truncate(os.path.getsize(path) - 1)
+            with self.assertRaises(ValueError):
+                ScalableBloomFilter.load(path)
+        self.assertEqual(len(restored), 120)
+        self.assertTrue(all(f"k{i}" in restored for i in range(120)))
+        self.assertFalse(restored.add("k7"))
+
+
+class TestIncrementalDiscovery(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "seen_urls.bloom")
+        self.seen = SeenUrls(self.path, capacity=100, snapshot_interval=3600)
+        self.zip_jobs = [{"title": "Backend Engineer", "url": ZIP_URL + "&lvk=1", "source": "ziprecruiter"}]
+        patches = [
+            mock.patch.object(job_discovery, "get_seen_urls", side_effect=lambda: self.seen),
+            mock.patch.object(job_discovery, "_discovery_results", LRUCache(max_entries=8)),
+            mock.patch.object(job_discovery, "discover_ziprecruiter", side_effect=lambda *a, **kw: self.zip_jobs),
+            mock.patch.object(job_discovery, "discover_dailyaijobs", return_value=[]),
+            mock.patch.object(job_discovery, "discover_aiworkportal", return_value=[]),
+            mock.patch.object(job_discovery, "discover_boards", return_value=[
+                {"title": "Backend Engineer", "url": ZIP_URL + "&utm_source=board", "source": "greenhouse"},
+            ]),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_repeat_postings_flagged_across_runs_and_restarts(self):
+        first = job_discovery._discover_jobs("backend engineer", "", 20)
+        self.assertEqual(len(first["jobs"]), 1)  # tracking-string variants collapse to one posting
+        self.assertEqual((first["new_jobs"], first["jobs"][0]["seen_before"]), (1, False))
+
+        self.zip_jobs = self.zip_jobs + [{"title": "Data Engineer", "url": ZIP_URL.replace("abc123", "d1") + "&lvk=2",
+                                          "source": "ziprecruiter"}]
+        second = job_discovery._discover_jobs("backend engineer", "", 20)
+        self.assertEqual(second["new_jobs"], 1)
+        self.assertEqual([j["seen_before"] for j in second["jobs"]], [True, False])
+
+        self.assertTrue(self.seen.maybe_snapshot(force=True))
+        self.seen = SeenUrls(self.path, capacity=100)
+        third = job_discovery._discover_jobs("backend engineer", "", 20)
+        self.assertEqual(third["new_jobs"], 0)
+
+    def test_new_only_and_crawler_report_just_new_postings(self):
+        job_discovery.discover_jobs("backend engineer", "", 20)
+        self.zip_jobs = self.zip_jobs + [{"title": "Data Engineer", "url": ZIP_URL.replace("abc123", "d1"),
+                                          "source": "ziprecruiter"}]
+        fresh = job_discovery.discover_jobs("backend engineer", "", 20, new_only=True)  # bypasses the cached result
+        self.assertEqual([j["title"] for j in fresh["jobs"]], ["Data Engineer"])
+
+        catalog = JobCatalog(path=None)
+        self.addCleanup(catalog.close)
+        self.zip_jobs = self.zip_jobs + [{"title": "ML Engineer", "url": ZIP_URL.replace("abc123", "m1"),
+                                          "source": "ziprecruiter"}]
+        run = DiscoveryCrawler(catalog, [("backend engineer", "")], user_queries=0).crawl_once()
+        self.assertEqual(run["new_postings"], [ZIP_URL.replace("abc123", "m1")])
+        self.assertEqual(run["upserted"], 3)  # known postings still refresh the catalog
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Unit tests for the JSON-LD / microdata JobPosting fast path.
+"""
+
+import os
+import unittest
+from unittest import mock
+
+from model import job_scraper
+from model.contracts import to_scraper_output
+from model.job_scraper import JobScraper
+from model.structured_data import extract_job_posting, html_fragment_to_text
+from model.tests.local_server import LocalServer
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+class TestExtractJobPosting(unittest.TestCase):
+    def test_json_ld_graph(self):
+        job = extract_job_posting(_fixture("jsonld_job.html"))
+        self.assertEqual(job["source"], "json-ld")
+        self.assertEqual(job["title"], "Senior Machine Learning Engineer")
+        self.assertEqual(job["company"], "Example Labs")
+        self.assertEqual(job["location"], "San Francisco, CA, US")
+        self.assertEqual(job["datePosted"], "2026-09-30")
+        self.assertEqual(job["employmentType"], "FULL_TIME")
+        self.assertTrue(job["description"].startswith("About the role Responsibility 0:"))
+        self.assertIn("Python & SQL PyTorch", job["description"])
+        self.assertNotIn("<", job["description"])
+
+    def test_microdata(self):
+        job = extract_job_posting(_fixture("microdata_job.html"))
+        self.assertEqual(job["source"], "microdata")
+        self.assertEqual(
+            (job["title"], job["company"], job["location"], job["datePosted"]),
+            ("Data Analyst", "Acme Analytics", "Austin, TX", "2026-10-01"),
+        )
+        self.assertIn("leadership. Item 1:", job["description"])
+        self.assertNotIn("trackView", job["description"])
+
+    def test_remote_and_lenient_json(self):
+        html = (
+            '<script type="application/ld+json">[{"@type": ["JobPosting"], "title": "Analyst",'
+            ' "jobLocationType": "TELECOMMUTE", "hiringOrganization": "Acme",'
+            ' "description": "line one\nline two"}]</script>'
+        )
+        job = extract_job_posting(html)
+        self.assertEqual(job["location"], "Remote")
+        self.assertEqual(job["company"], "Acme")
+        self.assertEqual(job["description"], "line one line two")
+
+    def test_no_structured_data(self):
+        self.assertIsNone(extract_job_posting(_fixture("generic_job.html")))
+        self.assertIsNone(extract_job_posting('<script type="application/ld+json">{not json</script>'))
+        self.assertIsNone(extract_job_posting(
+            '<script type="application/ld+json">{"@type": "Organization", "name": "Acme"}</script>'
+        ))
+
+    def test_fragment_to_text(self):
+        self.assertEqual(html_fragment_to_text("<p>a&amp;b</p><p>c<style>x{}</style></p>"), "a&b c")
+        self.assertEqual(html_fragment_to_text("plain &lt;text&gt;"), "plain <text>")
+
+
+class TestScraperFastPath(unittest.TestCase):
+    def test_structured_page_skips_dom(self):
+        scraper = JobScraper(use_playwright=False, use_cache=False)
+        meta = {}
+        with mock.patch.object(job_scraper, "parse_document") as parse:
+            text = scraper._parse_html(_fixture("jsonld_job.html"), "https://boards.greenhouse.io/example/jobs/1", meta)
+        parse.assert_not_called()
+        self.assertTrue(text.startswith("About the role"))
+        self.assertEqual(meta["job"]["company"], "Example Labs")
+        self.assertNotIn("description", meta["job"])
+
+    def test_short_description_falls_back_to_selectors(self):
+        html = _fixture("generic_job.html").replace(
+            "<head>",
+            '<head><script type="application/ld+json">'
+            '{"@type": "JobPosting", "title": "Engineer", "description": "Short."}</script>',
+            1,
+        )
+        scraper = JobScraper(use_playwright=False, use_cache=False)
+        meta = {}
+        text = scraper._parse_html(html, "https://careers.example.com/jobs/1", meta)
+        self.assertGreater(len(text), 500)
+        self.assertEqual(meta["job"], {"title": "Engineer", "source": "json-ld"})
+
+    def test_scrape_result_carries_fields(self):
+        routes = {"/job/1": (200, {"Content-Type": "text/html"}, _fixture("jsonld_job.html").encode())}
+        with LocalServer(routes) as srv, JobScraper(use_playwright=False, use_cache=False) as scraper:
+            result = scraper.scrape(srv.base_url + "/job/1")
+        self.assertTrue(result["success"])
+        self.assertEqual(result["job"]["title"], "Senior Machine Learning Engineer")
+        output = to_scraper_output(result)
+        self.assertEqual(output["location"], "San Francisco, CA, US")
+        self.assertEqual(output["description"], result["text"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,5 +4,7 @@ Utility modules for model package.
 
 from model.utils.logging_config import setup_logging
 from model.utils.config import Config, get_config
+from model.utils.cache import LRUCache
+from model.utils.urls import canonical_job_url, dedupe_job_urls
 
-__all__ = ["setup_logging", "Config", "get_config"]
+__all__ = ["setup_logging", "Config", "get_config", "LRUCache", "canonical_job_url", "dedupe_job_urls"]
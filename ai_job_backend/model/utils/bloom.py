@@ -0,0 +1,151 @@
+"""
+Memory-compact probabilistic set (scalable Bloom filter) with a binary disk snapshot.
+"""
+
+import hashlib
+import json
+import math
+import os
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+_SNAPSHOT_MAGIC = b"BLOOM1\n"
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter sized for capacity items at error_rate false positives.
+    No false negatives; not thread-safe on its own (see ScalableBloomFilter).
+    """
+
+    def __init__(self, capacity: int, error_rate: float, bits: Optional[bytearray] = None, count: int = 0):
+        self.capacity = max(1, capacity)
+        self.error_rate = min(max(error_rate, 1e-9), 0.5)
+        # Optimal size for n items at rate p: m = -n ln p / (ln 2)^2 bits, k = (m / n) ln 2 hashes
+        self.num_bits = max(8, math.ceil(-self.capacity * math.log(self.error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bits if bits is not None else bytearray((self.num_bits + 7) // 8)
+        self.count = count
+
+    def _positions(self, key: str) -> List[int]:
+        # Double hashing (Kirsch-Mitzenmacher): g_i = h1 + i * h2, from one 128-bit digest
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def add(self, key: str) -> bool:
+        """Add key; True if it was (probably) not present before."""
+        added = False
+        for p in self._positions(key):
+            mask = 1 << (p & 7)
+            if not self.bits[p >> 3] & mask:
+                self.bits[p >> 3] |= mask
+                added = True
+        self.count += added
+        return added
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+
+class ScalableBloomFilter:
+    """
+    Thread-safe Bloom filter that keeps its false-positive rate bounded as it grows:
+    when the current slice reaches its capacity a new one is added with twice the
+    capacity and half the error rate. Slice rates are error_rate / 2, / 4, ..., so
+    the overall rate stays below error_rate.
+    save()/load() snapshot it to a compact binary file.
+    """
+
+    GROWTH = 2
+    TIGHTENING = 0.5
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        self.initial_capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self._slices: List[BloomFilter] = [BloomFilter(self.initial_capacity, error_rate * (1 - self.TIGHTENING))]
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return any(key in s for s in self._slices)
+
+    def add(self, key: str) -> bool:
+        """Add key; True if it was (probably) not seen before."""
+        with self._lock:
+            if any(key in s for s in self._slices):
+                return False
+            current = self._slices[-1]
+            if current.full:
+                current = BloomFilter(current.capacity * self.GROWTH, current.error_rate * self.TIGHTENING)
+                self._slices.append(current)
+            current.add(key)
+            return True
+
+    def __len__(self) -> int:
+        return sum(s.count for s in self._slices)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            # P(false positive) = 1 - prod(1 - p_i) with each slice's fill-based rate p_i = (1 - e^(-kn/m))^k
+            miss = 1.0
+            for s in self._slices:
+                miss *= 1 - (1 - math.exp(-s.num_hashes * s.count / s.num_bits)) ** s.num_hashes
+            return {
+                "items": sum(s.count for s in self._slices),
+                "slices": len(self._slices),
+                "bytes": sum(len(s.bits) for s in self._slices),
+                "target_error_rate": self.error_rate,
+                "estimated_error_rate": round(1 - miss, 8),
+            }
+
+    def save(self, path: str) -> None:
+        """Atomically write a snapshot (JSON header line + raw bit arrays)."""
+        with self._lock:
+            header = {
+                "capacity": self.initial_capacity,
+                "error_rate": self.error_rate,
+                "slices": [[s.capacity, s.error_rate, s.count] for s in self._slices],
+            }
+            chunks: List[bytes] = [bytes(s.bits) for s in self._slices]
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".bloom-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_SNAPSHOT_MAGIC)
+                f.write(json.dumps(header).encode("utf-8") + b"\n")
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "ScalableBloomFilter":
+        """Read a snapshot written by save(); ValueError if the file is not a valid snapshot."""
+        with open(path, "rb") as f:
+            if f.readline() != _SNAPSHOT_MAGIC:
+                raise ValueError(f"{path} is not a Bloom filter snapshot")
+            header = json.loads(f.readline())
+            slices: List[Tuple[int, float, int]] = header["slices"]
+            bloom = cls(header["capacity"], header["error_rate"])
+            bloom._slices = []
+            for capacity, error_rate, count in slices:
+                s = BloomFilter(capacity, error_rate, count=count)
+                bits = f.read(len(s.bits))
+                if len(bits) != len(s.bits):
+                    raise ValueError(f"{path} is truncated")
+                s.bits = bytearray(bits)
+                bloom._slices.append(s)
+        if not bloom._slices:
+            raise ValueError(f"{path} has no filter slices")
+        return bloom
@@ -0,0 +1,154 @@
+"""
+In-process caching primitives shared by the scraper and discovery layers.
+"""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded LRU map. Least recently used entries are evicted
+    once max_entries is exceeded; the eviction count is exposed via stats().
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max(1, max_entries)
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Snapshot of (key, value) pairs, least recently used first (no recency update)."""
+        with self._lock:
+            return list(self._data.items())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def stats(self) -> Dict[str, Optional[int]]:
+        return {
+            "entries": len(self._data),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class SingleFlight:
+    """
+    In-process request coalescing: concurrent calls with the same key share one execution.
+    The first caller (leader) runs the work; callers arriving while it is in flight wait
+    for the same result (or exception). Works across threads and event loops: sync and
+    async callers of one key share the flight. Nothing is kept after the flight lands.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.flights = 0
+        self.shared = 0
+
+    def _join(self, key: Hashable) -> Tuple[Future, bool]:
+        """(future, is_leader)"""
+        with self._lock:
+            self.calls += 1
+            future = self._flights.get(key)
+            if future is not None:
+                self.shared += 1
+                return future, False
+            future = self._flights[key] = Future()
+            self.flights += 1
+            return future, True
+
+    def _land(self, key: Hashable, future: Future) -> None:
+        with self._lock:
+            if self._flights.get(key) is future:
+                del self._flights[key]
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """(result of fn, shared) where shared is True if another caller's flight was joined."""
+        while True:
+            future, leader = self._join(key)
+            if not leader:
+                try:
+                    return future.result(), True
+                except CancelledError:
+                    continue  # leader was cancelled; start a new flight
+            try:
+                value = fn()
+            except BaseException as e:
+                self._land(key, future)
+                future.set_exception(e)
+                raise
+            self._land(key, future)
+            future.set_result(value)
+            return value, False
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Async do(): fn is a coroutine factory. A cancelled waiter does not cancel the flight."""
+        while True:
+            future, leader = self._join(key)
+            if not leader:
+                try:
+                    return await asyncio.shield(asyncio.wrap_future(future)), True
+                except asyncio.CancelledError:
+                    if future.cancelled():
+                        continue  # leader was cancelled; start a new flight
+                    raise
+            try:
+                value = await fn()
+            except asyncio.CancelledError:
+                self._land(key, future)
+                future.cancel()
+                raise
+            except BaseException as e:
+                self._land(key, future)
+                future.set_exception(e)
+                raise
+            self._land(key, future)
+            future.set_result(value)
+            return value, False
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "flights": self.flights,
+            "shared": self.shared,
+            "in_flight": len(self._flights),
+        }
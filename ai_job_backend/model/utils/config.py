@@ -4,6 +4,7 @@ Handles environment variables and application configuration.
 """
 
 import os
+from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
 from openai import OpenAI
@@ -17,6 +18,9 @@ load_dotenv()
 # Inference API requires deployment name "DeepSeek-R1"
 DEEPSEEK_R1_MODEL = "DeepSeek-R1"
 
+# Default location for local caches/stores (ai_job_backend/.cache)
+_DEFAULT_CACHE_DIR = str(Path(__file__).resolve().parents[2] / ".cache")
+
 
 class Config:
     """Application configuration."""
@@ -35,6 +39,97 @@ class Config:
     USE_PLAYWRIGHT: bool = bool(os.getenv('BROWSERLESS_URL'))  # True when BROWSERLESS_URL set
     USE_SELENIUM: bool = False  # Not used; Browserless only
     USE_STEALTH: bool = os.getenv('USE_STEALTH', 'true').lower() == 'true'  # Anti-detection
+
+    # Playwright browser pool - warm browsers shared by every scrape in the process
+    PLAYWRIGHT_POOL_SIZE: int = int(os.getenv('PLAYWRIGHT_POOL_SIZE', '2'))  # browsers kept open
+    PLAYWRIGHT_MAX_PAGES_PER_BROWSER: int = int(os.getenv('PLAYWRIGHT_MAX_PAGES_PER_BROWSER', '4'))
+    PLAYWRIGHT_RECYCLE_AFTER: int = int(os.getenv('PLAYWRIGHT_RECYCLE_AFTER', '50'))  # relaunch after N pages
+    PLAYWRIGHT_BLOCK_RESOURCES: bool = os.getenv('PLAYWRIGHT_BLOCK_RESOURCES', 'true').lower() == 'true'  # images/fonts/media/trackers
+    PLAYWRIGHT_SELECTOR_TIMEOUT_MS: int = int(os.getenv('PLAYWRIGHT_SELECTOR_TIMEOUT_MS', '3000'))  # wait for job body (default = old settle sleep)
+
+    # Async HTTP client (shared httpx.AsyncClient per event loop)
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv('HTTP_MAX_CONNECTIONS', '100'))
+    HTTP_MAX_KEEPALIVE: int = int(os.getenv('HTTP_MAX_KEEPALIVE', '20'))
+    HTTP_MAX_PER_HOST: int = int(os.getenv('HTTP_MAX_PER_HOST', '6'))  # concurrent requests per host
+    HTTP2_ENABLED: bool = os.getenv('HTTP2_ENABLED', 'true').lower() == 'true'  # needs httpx[http2]
+    # Sync scraper session (requests): keep-alive connections per host / hosts kept pooled.
+    # The module-level scrape functions share one scraper per process, so size for its threads.
+    SCRAPER_POOL_MAXSIZE: int = int(os.getenv('SCRAPER_POOL_MAXSIZE', '16'))
+    SCRAPER_POOL_HOSTS: int = int(os.getenv('SCRAPER_POOL_HOSTS', '20'))
+
+    # Provider circuit breaker (per domain): open after N failures in WINDOW s, probe after COOLDOWN s
+    PROVIDER_BREAKER_FAILURES: int = int(os.getenv('PROVIDER_BREAKER_FAILURES', '3'))
+    PROVIDER_BREAKER_WINDOW: float = float(os.getenv('PROVIDER_BREAKER_WINDOW', '300'))
+    PROVIDER_BREAKER_COOLDOWN: float = float(os.getenv('PROVIDER_BREAKER_COOLDOWN', '120'))
+
+    # Hedged scraping (Glassdoor / generic sites): start ScraperAPI/Playwright if requests has no
+    # usable text after SCRAPE_HEDGE_DELAY s; SCRAPE_DEADLINE caps the whole scrape
+    SCRAPE_HEDGE_ENABLED: bool = os.getenv('SCRAPE_HEDGE_ENABLED', 'true').lower() == 'true'
+    SCRAPE_HEDGE_DELAY: float = float(os.getenv('SCRAPE_HEDGE_DELAY', '2.5'))
+    SCRAPE_DEADLINE: float = float(os.getenv('SCRAPE_DEADLINE', '45'))
+
+    # Streamed page downloads (scraper + discovery): stop reading after SCRAPE_MAX_BYTES, drop
+    # <script>/<style>/<svg> blocks as they arrive (JSON-LD kept)
+    SCRAPE_MAX_BYTES: int = int(os.getenv('SCRAPE_MAX_BYTES', '5000000'))
+    SCRAPE_STRIP_SCRIPTS: bool = os.getenv('SCRAPE_STRIP_SCRIPTS', 'true').lower() == 'true'
+
+    # Batch scraping (JobScraper.scrape_many / POST /api/job/scrape/batch)
+    SCRAPE_BATCH_CONCURRENCY: int = int(os.getenv('SCRAPE_BATCH_CONCURRENCY', '8'))  # URLs in flight
+    SCRAPE_BATCH_PER_DOMAIN: int = int(os.getenv('SCRAPE_BATCH_PER_DOMAIN', '2'))  # per host
+    SCRAPE_BATCH_MAX_URLS: int = int(os.getenv('SCRAPE_BATCH_MAX_URLS', '50'))  # per API request
+
+    # HTML parsing: lxml (cssselect, fast) | soup (BeautifulSoup) | auto (lxml when installed)
+    HTML_PARSER_BACKEND: str = os.getenv('HTML_PARSER_BACKEND', 'auto')
+    # Discovery results per (query, location): fresh for TTL s, then served stale for STALE_TTL s
+    # while refreshed in the background (0 TTL disables the cache)
+    DISCOVERY_CACHE_TTL: int = int(os.getenv('DISCOVERY_CACHE_TTL', '900'))
+    DISCOVERY_CACHE_STALE_TTL: int = int(os.getenv('DISCOVERY_CACHE_STALE_TTL', '3600'))
+    # Overall seconds a live discovery waits for its sources; sources still running are reported
+    # as timed out and the finished ones returned (each source also has its own timeout)
+    DISCOVERY_DEADLINE: float = float(os.getenv('DISCOVERY_DEADLINE', '75'))
+    # Partial results (a source failed or timed out) stay cached this many s, never served stale; 0 disables
+    DISCOVERY_PARTIAL_CACHE_TTL: int = int(os.getenv('DISCOVERY_PARTIAL_CACHE_TTL', '60'))
+    # Local job catalog (SQLite under CACHE_DIR) answering rank requests before live discovery:
+    # postings seen within CATALOG_MAX_AGE s count, rows unseen for CATALOG_RETENTION s are pruned
+    CATALOG_ENABLED: bool = os.getenv('CATALOG_ENABLED', 'true').lower() == 'true'
+    CATALOG_MAX_AGE: int = int(os.getenv('CATALOG_MAX_AGE', '86400'))
+    CATALOG_RETENTION: int = int(os.getenv('CATALOG_RETENTION', str(14 * 86400)))
+    # Persistent seen-URL Bloom filter flagging postings no earlier discovery returned
+    # (snapshot in CACHE_DIR; sized for SEEN_URLS_CAPACITY postings at SEEN_URLS_ERROR_RATE
+    # false positives, grows in slices with tighter rates beyond that)
+    SEEN_URLS_ENABLED: bool = os.getenv('SEEN_URLS_ENABLED', 'true').lower() == 'true'
+    SEEN_URLS_CAPACITY: int = int(os.getenv('SEEN_URLS_CAPACITY', '200000'))
+    SEEN_URLS_ERROR_RATE: float = float(os.getenv('SEEN_URLS_ERROR_RATE', '0.001'))
+    SEEN_URLS_SNAPSHOT_INTERVAL: int = int(os.getenv('SEEN_URLS_SNAPSHOT_INTERVAL', '300'))
+    # Near-duplicate postings (SimHash of title + company + snippet within this many of 64 bits)
+    # collapse to one job with alternate_urls; 0 disables
+    NEAR_DUPLICATE_MAX_DISTANCE: int = int(os.getenv('NEAR_DUPLICATE_MAX_DISTANCE', '3'))
+    # /api/job/discover answers from the catalog's full-text index when it has this many matches
+    DISCOVERY_INDEX_MIN_RESULTS: int = int(os.getenv('DISCOVERY_INDEX_MIN_RESULTS', '10'))
+    # Background crawler filling the catalog every CRAWLER_INTERVAL s: CRAWLER_QUERIES
+    # ("role|location;...") plus queries of the CRAWLER_USER_QUERIES latest user_preferences
+    CRAWLER_ENABLED: bool = os.getenv('CRAWLER_ENABLED', 'false').lower() == 'true'
+    CRAWLER_INTERVAL: int = int(os.getenv('CRAWLER_INTERVAL', '3600'))
+    CRAWLER_QUERIES: str = os.getenv(
+        'CRAWLER_QUERIES',
+        'software engineer|Remote;software engineer|;data scientist|Remote;machine learning engineer|Remote;'
+        'data analyst|;product manager|;frontend developer|Remote;devops engineer|Remote',
+    )
+    CRAWLER_USER_QUERIES: int = int(os.getenv('CRAWLER_USER_QUERIES', '50'))
+    CRAWLER_MAX_RESULTS: int = int(os.getenv('CRAWLER_MAX_RESULTS', '60'))
+    # Company boards for incremental discovery: "greenhouse:<board token>, lever:<company>, ..."
+    # (or board URLs); synced in parallel from their JSON feeds, only new/changed postings returned
+    DISCOVERY_BOARDS: str = os.getenv('DISCOVERY_BOARDS', '')
+    DISCOVERY_BOARD_WORKERS: int = int(os.getenv('DISCOVERY_BOARD_WORKERS', '8'))
+    # Worker processes for job-page / card parsing (0 = parse in the calling thread)
+    PARSE_POOL_WORKERS: int = int(os.getenv('PARSE_POOL_WORKERS', '0'))
+
+    # Local caches (SQLite files under CACHE_DIR; empty CACHE_DIR = memory only)
+    CACHE_DIR: str = os.getenv('CACHE_DIR', _DEFAULT_CACHE_DIR)
+    SCRAPE_CACHE_ENABLED: bool = os.getenv('SCRAPE_CACHE_ENABLED', 'true').lower() == 'true'
+    SCRAPE_CACHE_MEMORY_ENTRIES: int = int(os.getenv('SCRAPE_CACHE_MEMORY_ENTRIES', '256'))
+    SCRAPE_CACHE_DISK_MAX_ENTRIES: int = int(os.getenv('SCRAPE_CACHE_DISK_MAX_ENTRIES', '5000'))
+    SCRAPE_CACHE_STALE_TTL: int = int(os.getenv('SCRAPE_CACHE_STALE_TTL', '86400'))  # serve stale + refresh
     
     # Logging Configuration
     LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
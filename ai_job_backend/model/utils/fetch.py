@@ -0,0 +1,241 @@
+"""
+HTTP fetch helpers shared by the scraper and discovery layers.
+"""
+
+import codecs
+import re
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+
+def response_validators(headers: Mapping[str, str]) -> Dict[str, str]:
+    """Cache validators (ETag / Last-Modified) from response headers; empty if none."""
+    out: Dict[str, str] = {}
+    etag = headers.get("ETag") or headers.get("etag")
+    last_modified = headers.get("Last-Modified") or headers.get("last-modified")
+    if etag:
+        out["etag"] = etag
+    if last_modified:
+        out["last_modified"] = last_modified
+    return out
+
+
+def conditional_headers(validators: Optional[Mapping[str, str]]) -> Dict[str, str]:
+    """If-None-Match / If-Modified-Since headers for a revalidation request."""
+    if not validators:
+        return {}
+    out: Dict[str, str] = {}
+    if validators.get("etag"):
+        out["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        out["If-Modified-Since"] = validators["last_modified"]
+    return out
+
+
+# ---- bounded streaming downloads ----
+
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+_STRIP_OPEN_RE = re.compile(r"<(script|style|svg)\b[^>]*>", re.IGNORECASE)
+_CLOSE_RES = {
+    tag: re.compile(rf"</{tag}\b[^>]*>", re.IGNORECASE) for tag in ("script", "style", "svg")
+}
+_LD_JSON_TYPE_RE = re.compile(r"type\s*=\s*[\"']?application/ld\+json", re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?([a-zA-Z0-9_.:-]+)", re.IGNORECASE)
+_CLOSE_TAG_TAIL = 16  # chars kept while skipping, so a closing tag split across chunks is still seen
+
+
+class DownloadAborted(Exception):
+    """Body not read; reason is e.g. "not_html" (content-type)."""
+
+    def __init__(self, reason: str, detail: str = ""):
+        super().__init__(f"{reason}: {detail}" if detail else reason)
+        self.reason = reason
+
+
+def is_html_content_type(content_type: Optional[str]) -> bool:
+    """True for HTML/XHTML (or a missing header, which is treated as HTML)."""
+    if not content_type:
+        return True
+    mime = content_type.split(";", 1)[0].strip().lower()
+    return mime in HTML_CONTENT_TYPES
+
+
+def _charset(content_type: Optional[str]) -> Optional[str]:
+    for part in (content_type or "").split(";")[1:]:
+        key, _, value = part.partition("=")
+        if key.strip().lower() == "charset" and value.strip():
+            return value.strip().strip("\"'")
+    return None
+
+
+class HtmlStripper:
+    """
+    Incremental pre-parse pass: drops <script>, <style> and <svg> blocks from HTML as it
+    arrives, so the parser only sees markup and text. JSON-LD scripts are kept (structured
+    data fast path); a self-closing <svg/> is dropped on its own. feed() returns the cleaned
+    text available so far.
+    """
+
+    def __init__(self):
+        self._pending = ""
+        self._skipping: Optional[str] = None  # tag being dropped
+        self._keeping: Optional[str] = None   # ld+json script being passed through
+        self.stripped_chars = 0
+
+    def feed(self, chunk: str) -> str:
+        data = self._pending + chunk
+        self._pending = ""
+        out = []
+        pos = 0
+        while pos < len(data):
+            inside = self._skipping or self._keeping
+            if inside:
+                close = _CLOSE_RES[inside].search(data, pos)
+                if close is None:
+                    # Hold back a tail in case the closing tag is split across chunks
+                    keep_from = max(pos, len(data) - _CLOSE_TAG_TAIL)
+                    if self._keeping:
+                        out.append(data[pos:keep_from])
+                    else:
+                        self.stripped_chars += keep_from - pos
+                    self._pending = data[keep_from:]
+                    break
+                if self._keeping:
+                    out.append(data[pos:close.end()])
+                else:
+                    self.stripped_chars += close.end() - pos
+                self._skipping = self._keeping = None
+                pos = close.end()
+                continue
+            opening = _STRIP_OPEN_RE.search(data, pos)
+            if opening is None:
+                # An unterminated "<..." at the end may be the start of a tag to strip
+                lt = data.rfind("<", pos)
+                if lt != -1 and ">" not in data[lt:]:
+                    out.append(data[pos:lt])
+                    self._pending = data[lt:]
+                else:
+                    out.append(data[pos:])
+                break
+            tag = opening.group(1).lower()
+            out.append(data[pos:opening.start()])
+            if tag == "script" and _LD_JSON_TYPE_RE.search(opening.group(0)):
+                self._keeping = tag
+                out.append(opening.group(0))
+            elif tag == "svg" and opening.group(0)[:-1].rstrip().endswith("/"):
+                # <svg .../> (inline icon) is complete; HTML ignores "/" on script / style
+                self.stripped_chars += opening.end() - opening.start()
+            else:
+                self._skipping = tag
+                self.stripped_chars += opening.end() - opening.start()
+            pos = opening.end()
+        return "".join(out)
+
+    def close(self) -> str:
+        rest, self._pending = self._pending, ""
+        if self._skipping:
+            self.stripped_chars += len(rest)
+            return ""
+        return rest
+
+
+class CappedHtmlReader:
+    """
+    Accumulates a streamed HTML body: decodes incrementally, optionally strips
+    script/style/svg as it goes, and stops once max_bytes have been read.
+    Use feed(chunk) until it returns False, then finish() -> (html, stats).
+    """
+
+    def __init__(self, max_bytes: int, content_type: Optional[str] = None, strip: bool = True):
+        self.max_bytes = max(1, max_bytes)
+        self._encoding = _charset(content_type)
+        self._decoder = None
+        self._head = b""
+        self._stripper = HtmlStripper() if strip else None
+        self._parts: List[str] = []
+        self._kept_chars = 0
+        self.bytes_downloaded = 0
+        self.peak_buffered_chars = 0
+        self.truncated = False
+
+    def _decode(self, data: bytes, final: bool = False) -> str:
+        if self._decoder is None:
+            encoding = self._encoding
+            if encoding is None:
+                match = _META_CHARSET_RE.search(data[:4096])
+                encoding = match.group(1).decode("ascii") if match else "utf-8"
+            try:
+                self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+            except LookupError:
+                self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        return self._decoder.decode(data, final)
+
+    def _append(self, text: str) -> None:
+        if self._stripper is not None:
+            text = self._stripper.feed(text)
+        if text:
+            self._parts.append(text)
+            self._kept_chars += len(text)
+        pending = len(self._stripper._pending) if self._stripper is not None else 0
+        self.peak_buffered_chars = max(self.peak_buffered_chars, self._kept_chars + pending)
+
+    def feed(self, chunk: bytes) -> bool:
+        """Add a chunk; False once the byte cap is reached (stop reading)."""
+        chunk = chunk[:self.max_bytes - self.bytes_downloaded]
+        self.bytes_downloaded += len(chunk)
+        # Cap reached: the rest of the body is never read
+        self.truncated = self.bytes_downloaded >= self.max_bytes
+        if self._decoder is None and len(self._head) + len(chunk) < 1024 and not self.truncated:
+            self._head += chunk  # wait for enough bytes to sniff <meta charset>
+            return True
+        data, self._head = self._head + chunk, b""
+        self._append(self._decode(data))
+        return not self.truncated
+
+    def finish(self) -> Tuple[str, Dict[str, Any]]:
+        tail = self._decode(self._head, final=True)
+        self._head = b""
+        if self._stripper is not None:
+            tail = self._stripper.feed(tail) + self._stripper.close()
+        if tail:
+            self._parts.append(tail)
+            self._kept_chars += len(tail)
+        html = "".join(self._parts)
+        self._parts = [html]
+        return html, {
+            "bytes_downloaded": self.bytes_downloaded,
+            "html_chars": len(html),
+            "stripped_chars": self._stripper.stripped_chars if self._stripper is not None else 0,
+            "peak_buffered_chars": max(self.peak_buffered_chars, len(html)),
+            "truncated": self.truncated,
+        }
+
+
+def check_html_response(headers: Mapping[str, str]) -> None:
+    """Raise DownloadAborted before reading a body that is not HTML."""
+    content_type = headers.get("Content-Type") or headers.get("content-type")
+    if not is_html_content_type(content_type):
+        raise DownloadAborted("not_html", content_type or "")
+
+
+def read_html(response: Any, max_bytes: int, strip: bool = True, chunk_size: int = 65536) -> Tuple[str, Dict[str, Any]]:
+    """
+    Stream a requests response opened with stream=True into HTML, reading at most
+    max_bytes (decompressed). Raises DownloadAborted for non-HTML content types.
+    """
+    check_html_response(response.headers)
+    reader = CappedHtmlReader(max_bytes, response.headers.get("Content-Type"), strip)
+    for chunk in response.iter_content(chunk_size):
+        if chunk and not reader.feed(chunk):
+            break
+    return reader.finish()
+
+
+async def read_html_async(response: Any, max_bytes: int, strip: bool = True) -> Tuple[str, Dict[str, Any]]:
+    """read_html for a streamed httpx response (client.stream(...))."""
+    check_html_response(response.headers)
+    reader = CappedHtmlReader(max_bytes, response.headers.get("Content-Type"), strip)
+    async for chunk in response.aiter_bytes():
+        if chunk and not reader.feed(chunk):
+            break
+    return reader.finish()
@@ -0,0 +1,149 @@
+"""
+Near-duplicate detection for job postings: 64-bit SimHash fingerprints over normalized
+title + company + snippet, and a banded LSH index for sub-linear candidate lookup.
+"""
+
+import hashlib
+import re
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+SIMHASH_BITS = 64
+_MASK = (1 << SIMHASH_BITS) - 1
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+# Legal-form suffixes and filler that differ between boards for the same employer / role
+_COMPANY_SUFFIXES = frozenset({"inc", "llc", "ltd", "limited", "corp", "corporation", "co", "gmbh", "plc", "the"})
+_TITLE_NOISE = frozenset({"remote", "hybrid", "onsite", "job", "hiring", "urgently", "now", "new"})
+TITLE_WEIGHT = 3
+
+
+def _words(text: str) -> List[str]:
+    return _WORD_RE.findall((text or "").lower())
+
+
+def normalized_company(company: str) -> str:
+    return " ".join(w for w in _words(company) if w not in _COMPANY_SUFFIXES)
+
+
+def job_features(job: Dict[str, Any]) -> Optional[Dict[str, int]]:
+    """
+    Weighted SimHash features of a job: title words and word pairs (weighted TITLE_WEIGHT),
+    the normalized company as one feature, snippet word pairs. None when the title has no
+    words or the company is unknown: search-result cards without one (DailyAIJobs) share
+    titles across employers, so nothing tells two of them apart.
+    """
+    title = [w for w in _words(job.get("title") or "") if w not in _TITLE_NOISE]
+    company = normalized_company(job.get("company") or "")
+    if not title or not company:
+        return None
+    features: Dict[str, int] = {f"company:{company}": TITLE_WEIGHT * 2}
+    for w in title:
+        features[f"t:{w}"] = features.get(f"t:{w}", 0) + TITLE_WEIGHT
+    for a, b in zip(title, title[1:]):
+        features[f"t:{a} {b}"] = features.get(f"t:{a} {b}", 0) + TITLE_WEIGHT
+    snippet = _words(job.get("snippet") or "")
+    for a, b in zip(snippet, snippet[1:]):
+        features[f"s:{a} {b}"] = features.get(f"s:{a} {b}", 0) + 1
+    return features
+
+
+def simhash(features: Dict[str, int]) -> int:
+    """64-bit SimHash: per bit, the sign of the weighted vote of the features' hashes."""
+    votes = [0] * SIMHASH_BITS
+    for feature, weight in features.items():
+        h = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+        for i in range(SIMHASH_BITS):
+            votes[i] += weight if h >> i & 1 else -weight
+    return sum(1 << i for i, v in enumerate(votes) if v > 0)
+
+
+def job_simhash(job: Dict[str, Any]) -> Optional[int]:
+    """SimHash of a job posting, or None when it cannot take part in dedupe (see job_features)."""
+    features = job_features(job)
+    return simhash(features) if features else None
+
+
+def hamming(a: int, b: int) -> int:
+    return bin((a ^ b) & _MASK).count("1")
+
+
+def bands(fingerprint: int, max_distance: int) -> List[Tuple[int, int]]:
+    """
+    (band index, band value) pairs: the fingerprint split into max_distance + 1 bands. Two
+    fingerprints within max_distance bits differ in at most max_distance bands, so they
+    share at least one (pigeonhole) - exact band matches give every candidate.
+    """
+    n = max_distance + 1
+    width = SIMHASH_BITS // n
+    result = []
+    for i in range(n):
+        shift = i * width
+        bits = width if i < n - 1 else SIMHASH_BITS - shift
+        result.append((i, fingerprint >> shift & ((1 << bits) - 1)))
+    return result
+
+
+def to_signed(fingerprint: int) -> int:
+    """Fingerprint as a signed 64-bit int (SQLite INTEGER range)."""
+    return fingerprint - (1 << SIMHASH_BITS) if fingerprint >> (SIMHASH_BITS - 1) else fingerprint
+
+
+def from_signed(value: int) -> int:
+    return value & _MASK
+
+
+class SimHashIndex:
+    """
+    In-memory banded LSH index: near(fp) returns keys within max_distance bits, looking at
+    the few keys that share a band instead of every fingerprint added.
+    """
+
+    def __init__(self, max_distance: int = 3):
+        self.max_distance = max_distance
+        self._buckets: Dict[Tuple[int, int], List[Hashable]] = {}
+        self._fingerprints: Dict[Hashable, int] = {}
+
+    def add(self, key: Hashable, fingerprint: int) -> None:
+        self._fingerprints[key] = fingerprint
+        for band in bands(fingerprint, self.max_distance):
+            self._buckets.setdefault(band, []).append(key)
+
+    def near(self, fingerprint: int) -> List[Hashable]:
+        seen: Set[Hashable] = set()
+        found: List[Hashable] = []
+        for band in bands(fingerprint, self.max_distance):
+            for key in self._buckets.get(band, ()):
+                if key not in seen:
+                    seen.add(key)
+                    if hamming(self._fingerprints[key], fingerprint) <= self.max_distance:
+                        found.append(key)
+        return found
+
+
+def merge_alternate_urls(rep: Dict[str, Any], duplicate: Dict[str, Any]) -> bool:
+    """Add a duplicate's URL (and its alternates) to rep's alternate_urls; True if any was new."""
+    alternates = rep.setdefault("alternate_urls", [])
+    added = False
+    for url in [duplicate.get("url")] + list(duplicate.get("alternate_urls") or []):
+        if url and url != rep.get("url") and url not in alternates:
+            alternates.append(url)
+            added = True
+    return added
+
+
+def collapse_near_duplicates(jobs: Iterable[Dict[str, Any]], max_distance: int = 3) -> List[Dict[str, Any]]:
+    """
+    One job per near-duplicate cluster, first occurrence kept as the representative; the
+    other cluster members' URLs are appended to its alternate_urls. Order is preserved.
+    """
+    index = SimHashIndex(max_distance)
+    kept: List[Dict[str, Any]] = []
+    for job in jobs:
+        fingerprint = job_simhash(job)
+        if fingerprint is not None:
+            matches = index.near(fingerprint)
+            if matches:
+                merge_alternate_urls(kept[matches[0]], job)
+                continue
+            index.add(len(kept), fingerprint)
+        kept.append(job)
+    return kept
@@ -0,0 +1,96 @@
+"""
+Single-pass cleanup of scraped text: noise phrases/patterns removed and whitespace
+collapsed by one precompiled regex instead of a re.sub per pattern.
+"""
+
+import re
+from typing import Dict, Iterable, Optional
+
+_REGEX_META = set(".^$*+?{}[]\\|()")
+_WHITESPACE = " \t\n\r\f\v"
+# Whitespace that is not a single plain space (a lone " " needs no rewrite)
+_WS_RUN = r"[^\S ]\s*|\s{2,}"
+_MULTI_SPACE = re.compile(r" {2,}")
+
+
+def phrase_regex(phrases: Iterable[str]) -> str:
+    """
+    Case-folded literal phrases as one trie-shaped alternation, e.g. ["see more", "see less"]
+    -> "see\\s+(?:less|more)". Words may be separated by any whitespace; when one phrase
+    is a prefix of another the longer match wins.
+    """
+    trie: Dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for ch in " ".join(phrase.lower().split()):
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end of a phrase
+
+    def build(node: Dict[str, dict]) -> str:
+        alts = [
+            (r"\s+" if ch == " " else re.escape(ch)) + build(child)
+            for ch, child in sorted(node.items()) if ch
+        ]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        if "" in node:
+            body = f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
+def compile_phrases(phrases: Iterable[str]) -> "re.Pattern[str]":
+    """Case-insensitive matcher for any of the literal phrases."""
+    return re.compile(phrase_regex(phrases), re.IGNORECASE)
+
+
+def _first_chars(pattern: str) -> Optional[str]:
+    """Characters a match of pattern can start with; None if not obvious from its prefix."""
+    if pattern.startswith("^"):
+        return _first_chars(pattern[1:])
+    if pattern.startswith(r"\s*"):
+        rest = _first_chars(pattern[3:])
+        return None if rest is None else _WHITESPACE + rest
+    if pattern.startswith("\\") and len(pattern) > 1 and not pattern[1].isalnum():
+        return pattern[1]
+    if pattern and pattern[0] not in _REGEX_META:
+        return pattern[0].lower() + pattern[0].upper()
+    return None
+
+
+class NoiseCleaner:
+    """
+    Removes noise phrases (literal, case-insensitive) and regex patterns, replacing each
+    with a space, and collapses whitespace in the same pass. Spaces in patterns match any
+    whitespace run, so raw extracted text can be cleaned without collapsing it first.
+    """
+
+    def __init__(self, phrases: Iterable[str] = (), patterns: Iterable[str] = ()):
+        phrases, patterns = list(phrases), list(patterns)
+        alternatives = [f"(?:{phrase_regex(phrases)})\\s*"] if phrases else []
+        alternatives += [f"(?:{p.replace(' ', chr(92) + 's+')})" for p in patterns]
+        alternatives.append(_WS_RUN)
+        regex = "|".join(alternatives)
+
+        # Pre-check the first character so most positions are rejected with one test
+        starts: Optional[set] = {c for phrase in phrases for c in (phrase.strip()[:1].lower(), phrase.strip()[:1].upper())}
+        for p in patterns:
+            first = _first_chars(p)
+            if first is None:
+                starts = None
+                break
+            starts.update(first)
+        if starts is not None:
+            charset = "".join(sorted(re.escape(c) for c in starts if c and c not in _WHITESPACE))
+            regex = f"(?=[\\s{charset}])(?:{regex})"
+        self.pattern = re.compile(regex, re.IGNORECASE | re.DOTALL)
+
+    def clean(self, text: str) -> str:
+        if not text:
+            return ""
+        out = self.pattern.sub(" ", text)
+        if "  " in out:  # removed noise next to a single space
+            out = _MULTI_SPACE.sub(" ", out)
+        return out.strip()
@@ -0,0 +1,65 @@
+"""
+URL helpers: canonical form of job URLs used as cache / dedupe keys.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, List
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query params that only track the click, never select a different posting
+# (ad clicks, newsletters, ZipRecruiter listing / search tokens, ATS referral sources)
+TRACKING_PARAMS = frozenset({
+    "gclid", "fbclid", "msclkid", "mc_cid", "mc_eid", "_hsenc", "_hsmi", "mkt_tok",
+    "lvk", "tsid", "zrclid", "search_id", "trk", "trackingid", "refid", "ref", "src",
+    "gh_src", "lever-origin", "lever-source",
+})
+TRACKING_PREFIXES = ("utm_",)
+
+
+def _is_tracking_param(name: str) -> bool:
+    n = name.lower()
+    return n in TRACKING_PARAMS or n.startswith(TRACKING_PREFIXES)
+
+
+@lru_cache(maxsize=4096)  # pure; the same links recur across pages, re-discoveries and cache lookups
+def canonical_job_url(url: str) -> str:
+    """
+    Canonical form of a job URL: lowercase scheme/host (trailing dot dropped), no default
+    port, no fragment, no tracking params, sorted query, no repeated or trailing slashes
+    in the path.
+    Returns the stripped input unchanged if it is not an http(s) URL (or its port is invalid).
+    """
+    raw = (url or "").strip()
+    parts = urlsplit(raw)
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https") or not parts.netloc:
+        return raw
+    host = (parts.hostname or "").lower().rstrip(".")
+    try:
+        port = parts.port
+    except ValueError:  # non-numeric or out of range, e.g. "x.com:abc"
+        return raw
+    if port and not ((scheme == "http" and port == 80) or (scheme == "https" and port == 443)):
+        host = f"{host}:{port}"
+    path = re.sub(r"/{2,}", "/", parts.path).rstrip("/") or "/"
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(k)
+    ))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def dedupe_job_urls(urls: Iterable[str]) -> List[str]:
+    """First occurrence of each job URL (by canonical form), blanks dropped, order kept."""
+    seen = set()
+    unique: List[str] = []
+    for url in urls:
+        url = (url or "").strip()
+        if not url:
+            continue
+        key = canonical_job_url(url)
+        if key not in seen:
+            seen.add(key)
+            unique.append(url)
+    return unique
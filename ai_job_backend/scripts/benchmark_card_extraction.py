@@ -0,0 +1,130 @@
+"""
+Discovery card parsing with the shared card extractor (_CardTexts: each ancestor's text once
+per page, one posting-age regex) vs the previous per-link ancestor walk with six regexes,
+on the saved ZipRecruiter / DailyAIJobs / AIWorkPortal result pages. --scale repeats each
+page's cards (with distinct URLs) to model big result pages. Also checks both give the same cards.
+Run from ai_job_backend:  python scripts/benchmark_card_extraction.py [--iterations 20] [--scale 1 4 16]
+"""
+import argparse
+import logging
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Optional, Tuple
+
+backend_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_root)
+
+from model import job_discovery
+from model.html_backends import ParserBackend
+
+FIXTURES = os.path.join(backend_root, "model", "tests", "fixtures")
+PAGES = [
+    ("ziprecruiter_search.html", job_discovery._parse_ziprecruiter_cards),
+    ("dailyaijobs_listing.html", job_discovery._parse_dailyaijobs_cards),
+    ("aiworkportal_jobs.html", job_discovery._parse_aiworkportal_cards),
+]
+_BODY_RE = re.compile(r"(<body[^>]*>)(.*)(</body>)", re.S | re.I)
+# Posting ids in job links: /job/<slug> paths and ZipRecruiter's ?jid=<id>
+_JOB_ID_RE = re.compile(r'(href="[^"#?]*/jobs?/[^"#?/]+|jid=\w+)')
+
+
+class LegacyCardTexts:
+    """The per-link walk this replaced: text of up to 5 ancestors recomputed for every link."""
+
+    def __init__(self, backend: ParserBackend, markers: Tuple[str, ...] = ("ago",)):
+        self.backend = backend
+        self.markers = markers
+
+    def __call__(self, link: Any) -> str:
+        card_text = ""
+        parent = self.backend.parent(link)
+        for _ in range(5):
+            if parent is None:
+                break
+            card_text = self.backend.text(parent)[:500]
+            lowered = card_text.lower()
+            if any(m in lowered for m in self.markers):
+                break
+            parent = self.backend.parent(parent)
+        return card_text
+
+
+def legacy_parse_posted_days_ago(text: str) -> Optional[int]:
+    if not text:
+        return None
+    text = text.lower().strip()
+    if re.search(r"(\d+)\s*hours?\s*ago", text):
+        return 0
+    if "today" in text or "just now" in text:
+        return 0
+    m = re.search(r"(\d+)\s*days?\s*ago", text)
+    if m:
+        return min(int(m.group(1)), 999)
+    if re.search(r"1\s*week\s*ago", text):
+        return 7
+    m = re.search(r"(\d+)\s*weeks?\s*ago", text)
+    if m:
+        return int(m.group(1)) * 7
+    m = re.search(r"(\d+)\s*months?\s*ago", text)
+    if m:
+        return int(m.group(1)) * 30
+    return None
+
+
+@contextmanager
+def legacy_extraction():
+    saved = job_discovery._CardTexts, job_discovery._parse_posted_days_ago
+    job_discovery._CardTexts, job_discovery._parse_posted_days_ago = LegacyCardTexts, legacy_parse_posted_days_ago
+    try:
+        yield
+    finally:
+        job_discovery._CardTexts, job_discovery._parse_posted_days_ago = saved
+
+
+def scaled_page(html: str, scale: int) -> str:
+    """The page with its body repeated scale times, job links made distinct per copy."""
+    m = _BODY_RE.search(html)
+    if scale <= 1 or not m:
+        return html
+    copies = [_JOB_ID_RE.sub(lambda h: f"{h.group(1)}-{i}", m.group(2)) for i in range(scale)]
+    return html[:m.start(2)] + "".join(copies) + html[m.end(2):]
+
+
+def _bench(fn, html: str, iterations: int) -> float:
+    fn(html)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(html)
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 4, 16], help="copies of each page's cards")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"{'page':28} {'scale':>5} {'cards':>6} {'per-link walk':>14} {'shared extractor':>17} {'speedup':>8}  same")
+    for name, parse in PAGES:
+        with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+            base = f.read()
+        for scale in args.scale:
+            html = scaled_page(base, scale)
+            iterations = max(1, args.iterations // scale)
+            with legacy_extraction():
+                old_cards = parse(html)
+                old_ms = _bench(parse, html, iterations)
+            new_cards = parse(html)
+            new_ms = _bench(parse, html, iterations)
+            print(
+                f"{name:28} {scale:>5} {len(new_cards):>6} {old_ms:>11.2f} ms {new_ms:>14.2f} ms"
+                f" {old_ms / new_ms:>7.1f}x  {old_cards == new_cards}"
+            )
+
+
+if __name__ == "__main__":
+    main()
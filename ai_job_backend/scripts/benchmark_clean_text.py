@@ -0,0 +1,83 @@
+"""
+JobScraper._clean_text (one combined matcher) vs the previous loop of re.sub calls,
+on large job descriptions built from the fixtures. Also checks both give the same text.
+Run from ai_job_backend:  python scripts/benchmark_clean_text.py [--iterations 20] [--kb 150]
+"""
+import argparse
+import logging
+import os
+import re
+import sys
+import time
+
+backend_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_root)
+
+from model.job_scraper import JobScraper, LOGIN_WALL_PATTERNS, _is_login_wall
+
+FIXTURES = os.path.join(backend_root, "model", "tests", "fixtures")
+
+# The per-pattern implementation this replaced
+LEGACY_NOISE_PATTERNS = [
+    r"Apply now\s*", r"Save job\s*", r"Share job\s*", r"See more\s*", r"See less\s*",
+    r"Easy apply\s*", r"Sign in to save\s*", r"© \d{4}.*?\.?\s*", r"All rights reserved\.?\s*",
+    r"Privacy policy\s*", r"Terms of (use|service)\s*", r"Cookie policy\s*", r"Follow us on\s*",
+    r"Connect with us\s*", r"^\s*Home\s*\|\s*", r"\s*Home\s*\|\s*Careers\s*\|\s*", r"^\s*\[.*?\]\s*",
+]
+
+
+def legacy_clean_text(text: str) -> str:
+    text = re.sub(r"\s+", " ", text).strip()
+    for pat in LEGACY_NOISE_PATTERNS:
+        text = re.sub(pat, " ", text, flags=re.IGNORECASE)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def legacy_is_login_wall(html: str) -> bool:
+    if not html or len(html) < 500:
+        return True
+    text = html.lower()[:8000]
+    return any(re.search(pat, text) for pat in LOGIN_WALL_PATTERNS)
+
+
+def _bench(fn, arg, iterations: int) -> float:
+    fn(arg)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(arg)
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--kb", type=int, default=150, help="size of the synthetic description")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    scraper = JobScraper(use_playwright=False, use_cache=False)
+    with open(os.path.join(FIXTURES, "indeed_job.html"), encoding="utf-8") as f:
+        html = f.read()
+    body, _ = scraper._parse_page(html, "https://www.indeed.com/viewjob?jk=bench")
+    block = (
+        "Apply now  Save job\n" + body
+        + "\n\n  See more\n© 2024 Acme Corp. All rights reserved. Privacy policy\t Terms of use "
+    )
+    text = block * max(1, args.kb * 1024 // len(block))
+
+    same = legacy_clean_text(text) == scraper._clean_text(text)
+    old_ms = _bench(legacy_clean_text, text, args.iterations)
+    new_ms = _bench(scraper._clean_text, text, args.iterations)
+    print(f"_clean_text on {len(text) / 1024:.0f} KB (identical output: {same})")
+    print(f"  re.sub per pattern   {old_ms:8.2f} ms")
+    print(f"  combined matcher     {new_ms:8.2f} ms   {old_ms / new_ms:.1f}x")
+
+    old_ms = _bench(legacy_is_login_wall, html, args.iterations * 50)
+    new_ms = _bench(_is_login_wall, html, args.iterations * 50)
+    print("_is_login_wall (first 8000 chars)")
+    print(f"  re.search per phrase {old_ms * 1000:8.1f} us")
+    print(f"  combined matcher     {new_ms * 1000:8.1f} us   {old_ms / new_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
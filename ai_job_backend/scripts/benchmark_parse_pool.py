@@ -0,0 +1,69 @@
+"""
+Parses/sec for job-page extraction in threads vs the parse worker pool, by worker count.
+Threads show the GIL ceiling; the process pool should scale with cores.
+Run from ai_job_backend:  python scripts/benchmark_parse_pool.py [--pages 200] [--max-workers N]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+backend_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_root)
+
+from model.job_scraper import JobScraper
+from model.parse_pool import ParsePool
+
+FIXTURES = os.path.join(backend_root, "model", "tests", "fixtures")
+
+JOB_PAGES = {
+    "indeed_job.html": "https://www.indeed.com/viewjob?jk=bench",
+    "greenhouse_job.html": "https://boards.greenhouse.io/example/jobs/1",
+    "lever_job.html": "https://jobs.lever.co/example/1",
+    "generic_job.html": "https://careers.example.com/jobs/1",
+}
+
+
+def _load(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def _run(submit, work, concurrency: int) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as callers:  # API threads issuing parses
+        list(callers.map(lambda item: submit(*item), work))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore")
+
+    pages = [(_load(name), url) for name, url in JOB_PAGES.items()]
+    work = [pages[i % len(pages)] for i in range(args.pages)]
+    counts = sorted({1, 2, 4, 8, args.max_workers} & set(range(1, args.max_workers + 1)))
+    scraper = JobScraper(use_playwright=False, use_cache=False)
+    scraper._parse_page(*pages[0])  # warm selector plans
+
+    print(f"{args.pages} job pages, {os.cpu_count()} cores\n")
+    print(f"{'workers':>7}  {'threads p/s':>12}  {'processes p/s':>14}  {'speedup':>8}")
+    for n in counts:
+        threaded = args.pages / _run(scraper._parse_page, work, n)
+        pool = ParsePool(workers=n)  # spawned + warmed before timing
+        try:
+            pooled = args.pages / _run(pool.parse_job, work, n * 2)
+        finally:
+            pool.shutdown()
+        print(f"{n:>7}  {threaded:>12.1f}  {pooled:>14.1f}  {pooled / threaded:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
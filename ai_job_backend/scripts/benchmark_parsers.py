@@ -0,0 +1,85 @@
+"""
+Throughput of the HTML parser backends over the saved fixtures (model/tests/fixtures).
+Runs the real extraction paths: JobScraper._parse_html for job pages and the
+discovery card parsers for listing pages.
+Run from ai_job_backend:  python scripts/benchmark_parsers.py [--iterations 30]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+import warnings
+
+backend_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_root)
+
+from model import job_discovery
+from model.html_backends import available_backends
+from model.job_scraper import JobScraper
+from model.utils.config import Config
+
+FIXTURES = os.path.join(backend_root, "model", "tests", "fixtures")
+
+JOB_PAGES = {
+    "indeed_job.html": "https://www.indeed.com/viewjob?jk=bench",
+    "greenhouse_job.html": "https://boards.greenhouse.io/example/jobs/1",
+    "lever_job.html": "https://jobs.lever.co/example/1",
+    "generic_job.html": "https://careers.example.com/jobs/1",
+    "jsonld_job.html": "https://boards.greenhouse.io/example/jobs/2",  # structured-data fast path
+}
+
+LISTING_PAGES = {
+    "ziprecruiter_search.html": job_discovery._parse_ziprecruiter_cards,
+    "dailyaijobs_listing.html": job_discovery._parse_dailyaijobs_cards,
+    "aiworkportal_jobs.html": job_discovery._parse_aiworkportal_cards,
+}
+
+
+def _load(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def _bench(fn, iterations: int) -> float:
+    fn()  # warm-up (selector compilation, imports)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=30)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore")  # bs4 XMLParsedAsHTMLWarning on the lever fixture
+
+    scraper = JobScraper(use_playwright=False, use_cache=False)
+    pages = [(name, _load(name)) for name in list(JOB_PAGES) + list(LISTING_PAGES)]
+    total_bytes = sum(len(html.encode("utf-8")) for _, html in pages)
+
+    results = {}
+    for backend in available_backends():
+        Config.HTML_PARSER_BACKEND = backend
+        print(f"\n[{backend}]")
+        elapsed_total = 0.0
+        for name, html in pages:
+            if name in JOB_PAGES:
+                fn = lambda html=html, url=JOB_PAGES[name]: scraper._parse_html(html, url)
+            else:
+                fn = lambda html=html, parse=LISTING_PAGES[name]: parse(html)
+            elapsed = _bench(fn, args.iterations)
+            elapsed_total += elapsed
+            print(f"  {name:<26} {args.iterations / elapsed:8.1f} pages/s  {elapsed / args.iterations * 1000:7.2f} ms/page")
+        results[backend] = elapsed_total
+        mb = total_bytes * args.iterations / 1e6
+        print(f"  {'total':<26} {len(pages) * args.iterations / elapsed_total:8.1f} pages/s  {mb / elapsed_total:7.2f} MB/s")
+
+    if "lxml" in results and "soup" in results:
+        print(f"\nlxml speedup over soup: {results['soup'] / results['lxml']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
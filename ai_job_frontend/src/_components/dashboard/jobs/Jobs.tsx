@@ -93,30 +93,53 @@ export default function Jobs({ initialJobs }: Props) {
         // keep defaults
       }
       setStatus("Searching job boards…");
+      // Streamed per source (NDJSON): show each board's jobs as soon as it answers
       const res = await fetch(
-        `${base}/api/job/discover?q=${encodeURIComponent(query)}&location=${encodeURIComponent(location)}&max_results=60`,
+        `${base}/api/job/discover/stream?q=${encodeURIComponent(query)}&location=${encodeURIComponent(location)}&max_results=60`,
         { credentials: "include" }
       );
-      const data = await res.json().catch(() => ({}));
-      if (!res.ok) {
+      if (!res.ok || !res.body) {
+        const data = await res.json().catch(() => ({}));
         setError(typeof data.detail === "string" ? data.detail : data.error || `Error ${res.status}`);
         setStatus(null);
         return;
       }
-      const rawJobs: Record<string, unknown>[] = Array.isArray(data.jobs) ? data.jobs : [];
-      const list: JobListing[] = rawJobs.map((j, i) => ({
-        id: (j.url as string) || `discover-${i}-${Date.now()}`,
-        title: String(j.title ?? "Job"),
-        company: String(j.company ?? ""),
-        location: (data.location as string) || location || "",
-        work_mode: "Remote",
-        source_url: (j.url as string) || null,
-        description: j.snippet ? String(j.snippet) : null,
-      }));
-      setJobs(list);
-      setSelectedId(list[0]?.id ?? "");
+      const list: JobListing[] = [];
+      const onEvent = (event: Record<string, unknown>) => {
+        if (event.event !== "jobs") return;
+        const rawJobs: Record<string, unknown>[] = Array.isArray(event.jobs) ? event.jobs : [];
+        if (rawJobs.length === 0) return;
+        const first = list.length === 0;
+        const batch: JobListing[] = rawJobs.map((j, i) => ({
+          id: (j.url as string) || `discover-${list.length + i}-${Date.now()}`,
+          title: String(j.title ?? "Job"),
+          company: String(j.company ?? ""),
+          location: location || "",
+          work_mode: "Remote",
+          source_url: (j.url as string) || null,
+          description: j.snippet ? String(j.snippet) : null,
+        }));
+        list.push(...batch);
+        setJobs([...list]);
+        if (first) setSelectedId(list[0].id);
+        setStatus(`Searching job boards… ${list.length} jobs so far`);
+      };
+      const reader = res.body.getReader();
+      const decoder = new TextDecoder();
+      let buffered = "";
+      for (;;) {
+        const { done, value } = await reader.read();
+        buffered += decoder.decode(value, { stream: !done });
+        const lines = buffered.split("\n");
+        buffered = done ? "" : lines.pop() ?? "";
+        for (const line of lines) {
+          if (line.trim()) onEvent(JSON.parse(line));
+        }
+        if (done) break;
+      }
       setStatus(null);
       if (list.length === 0) {
+        setJobs([]);
         setError("No jobs found for this search. Try different keywords or location.");
       }
     } catch (e) {
@@ -46,8 +46,15 @@ async function proxy(
       body: body || undefined,
       signal: AbortSignal.timeout(90000),
     });
-    const data = await res.text();
     const contentType = res.headers.get("Content-Type") || "";
+    // Streaming responses (NDJSON / SSE) are passed through as they arrive instead of buffered
+    if (res.ok && res.body && /ndjson|event-stream/.test(contentType)) {
+      return new NextResponse(res.body, {
+        status: res.status,
+        headers: { "Content-Type": contentType, "Cache-Control": "no-cache" },
+      });
+    }
+    const data = await res.text();
     // Backend may return HTML error page (502/503) - return JSON so frontend can parse
     if (
       !res.ok &&